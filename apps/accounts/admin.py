@@ -1,6 +1,6 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
-from .models import User, RoleChangeRequest
+from .models import User, RoleChangeRequest, UserArchive
 
 class UserAdmin(BaseUserAdmin):
     list_display = ('email', 'name', 'role', 'account_status', 'approval_status', 'is_staff')
@@ -28,5 +28,11 @@ class RoleChangeRequestAdmin(admin.ModelAdmin):
     search_fields = ('user__email', 'user__name')
     readonly_fields = ('created_at', 'reviewed_at')
 
+class UserArchiveAdmin(admin.ModelAdmin):
+    list_display = ('id', 'email', 'name', 'role', 'deleted_at', 'archived_at')
+    list_filter = ('role',)
+    search_fields = ('=id', 'email', 'name')
+
 admin.site.register(User, UserAdmin)
 admin.site.register(RoleChangeRequest, RoleChangeRequestAdmin)
+admin.site.register(UserArchive, UserArchiveAdmin)
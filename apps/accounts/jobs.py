@@ -0,0 +1,22 @@
+from django.conf import settings
+from django.core.management import call_command
+from django.utils import timezone
+
+from .models import User
+from core.jobs import job
+
+@job("accounts.purge_expired_tokens", schedule="0 4 * * *")
+def purge_expired_tokens():
+    """
+    Drops expired refresh tokens from the blacklist tables and clears
+    password reset tokens past their expiry.
+    """
+    call_command("flushexpiredtokens", verbosity=0)
+    User.all_objects.filter(reset_token_expiry__lt=timezone.now()).update(reset_token=None, reset_token_expiry=None)
+
+@job("accounts.compact_soft_deleted", schedule="0 5 * * 0")
+def compact_soft_deleted_job(older_than_days=None):
+    """
+    Weekly compact_soft_deleted run.
+    """
+    call_command("compact_soft_deleted", days=older_than_days or settings.SOFT_DELETE_COMPACT_AFTER_DAYS, verbosity=0)
@@ -0,0 +1,55 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.accounts.models import User
+from apps.accounts.services import compact_users_batch, compactable_users
+from apps.resources.models import Resource
+from apps.resources.services import compact_resources_batch, compactable_resources
+from core.compaction import rebuild_indexes
+
+# Resources first: a deleted manager stays put while their resource is still in `resources`
+TARGETS = [
+    ("resource", Resource, compactable_resources, compact_resources_batch),
+    ("user", User, compactable_users, compact_users_batch),
+]
+
+class Command(BaseCommand):
+    help = (
+        'Moves users and resources soft-deleted more than --days ago into '
+        'users_archive/resources_archive in small transactions, then rebuilds '
+        'the indexes of the live tables. Safe to interrupt and re-run.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.SOFT_DELETE_COMPACT_AFTER_DAYS,
+                            help='Grace period: only rows deleted more than this many days ago move.')
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--sleep', type=float, default=0.0, help='Seconds to pause between batches.')
+        parser.add_argument('--no-rebuild', action='store_true', help='Skip rebuilding indexes afterwards.')
+        parser.add_argument('--dry-run', action='store_true', help='Only count what would be moved.')
+
+    def handle(self, *args, **options):
+        for label, model, compactable, compact in TARGETS:
+            if options['dry_run']:
+                deleted = model._base_manager.filter(is_deleted=True).count()
+                count = compactable(options['days']).count()
+                self.stdout.write(f"{count} of {deleted} deleted {label}(s) would be compacted.")
+                continue
+
+            moved = batches = 0
+            while True:
+                count = compact(options['days'], options['batch_size'])
+                if not count:
+                    break
+                moved += count
+                batches += 1
+                if options['verbosity'] > 1:
+                    self.stdout.write(f"  {label} batch {batches}: {count}, {moved} total")
+                if options['sleep']:
+                    time.sleep(options['sleep'])
+
+            if moved and not options['no_rebuild']:
+                rebuild_indexes(model)
+            self.stdout.write(self.style.SUCCESS(f"Compacted {moved} {label}(s) in {batches} batch(es)."))
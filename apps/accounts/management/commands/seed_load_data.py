@@ -0,0 +1,346 @@
+import bisect
+import datetime
+import itertools
+import random
+import time
+from contextlib import contextmanager
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from apps.accounts.models import User
+from apps.audit.models import AuditLog
+from apps.bookings.models import Booking
+from apps.notifications.models import UserNotification
+from apps.resources.models import Resource, ResourceWeeklySchedule, CalendarOverride
+
+LOAD_DOMAIN = "load.reshub.test"
+RESOURCE_PREFIX = "LOAD "
+LOAD_PASSWORD = "Load@1234"
+
+# Relative booking demand by weekday (Mon..Sun) and by start hour (08:00..18:00)
+WEEKDAY_WEIGHTS = [1.0, 1.0, 0.95, 0.9, 0.75, 0.15, 0.03]
+HOUR_WEIGHTS = {8: 0.5, 9: 1.0, 10: 1.3, 11: 1.2, 12: 0.6, 13: 0.7, 14: 1.2, 15: 1.1, 16: 0.9, 17: 0.5, 18: 0.3}
+
+ROLE_WEIGHTS = [("STUDENT", 85), ("FACULTY", 9), ("STAFF", 5), ("ADMIN", 1)]
+AUDIT_ACTIONS = [
+    ("USER_LOGIN", "user"), ("BOOKING_CREATED", "booking"), ("BOOKING_APPROVED", "booking"),
+    ("BOOKING_CANCELLED", "booking"), ("BOOKING_REJECTED", "booking"), ("PROFILE_UPDATED", "user"),
+    ("USER_LOGOUT", "user"), ("RESOURCE_UPDATED", "resource"),
+]
+NOTIFICATION_TYPES = [
+    ("BOOKING_APPROVED", "Booking Approved", 40), ("BOOKING_REJECTED", "Booking Rejected", 8),
+    ("BOOKING_CANCELLED", "Booking Cancelled", 10), ("GENERAL", "New Booking Request", 35),
+    ("REGISTRATION_APPROVED", "Registration Approved", 5), ("ROLE_CHANGE_APPROVED", "Role Change Approved", 2),
+]
+
+def cumulative(weights):
+    return list(itertools.accumulate(weights))
+
+@contextmanager
+def preserve_timestamps(*models):
+    """
+    Lets bulk_create keep the generated created_at/updated_at/timestamp values
+    instead of stamping every row with now().
+    """
+    toggled = []
+    for model in models:
+        for field in model._meta.concrete_fields:
+            if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False):
+                toggled.append((field, field.auto_now, field.auto_now_add))
+                field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in toggled:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+class Command(BaseCommand):
+    help = (
+        "Deterministically generates benchmark-sized volumes of users, resources, "
+        "calendar overrides, bookings, notifications and audit logs."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=100_000)
+        parser.add_argument('--resources', type=int, default=5_000)
+        parser.add_argument('--calendar-days', type=int, default=365, help='Days of calendar overrides to generate, starting today.')
+        parser.add_argument('--bookings', type=int, default=10_000_000)
+        parser.add_argument('--notifications', type=int, default=2_000_000)
+        parser.add_argument('--audit-logs', type=int, default=2_000_000)
+        parser.add_argument('--history-days', type=int, default=300, help='How far back generated bookings go.')
+        parser.add_argument('--batch-size', type=int, default=5_000)
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--resume', action='store_true', help='Continue a previous run with the same --seed and --batch-size.')
+        parser.add_argument('--no-progress', action='store_true')
+
+    def handle(self, *args, **options):
+        self.seed = options['seed']
+        self.batch_size = options['batch_size']
+        self.show_progress = not options['no_progress']
+        self.today = timezone.localdate()
+        self.now = timezone.now()
+
+        existing = User.all_objects.filter(email__endswith=f"@{LOAD_DOMAIN}").exists()
+        if existing and not options['resume']:
+            raise CommandError("Load data already exists. Re-run with --resume to continue it.")
+
+        # One hash for every generated account; hashing 100k passwords would dominate the run
+        self.password_hash = make_password(LOAD_PASSWORD)
+
+        started = time.monotonic()
+        self.insert('users', User, User.all_objects.filter(email__endswith=f"@{LOAD_DOMAIN}"),
+                    options['users'], self.generate_users)
+        self.load_user_ids()
+
+        self.insert('resources', Resource, Resource.all_objects.filter(name__startswith=RESOURCE_PREFIX),
+                    options['resources'], self.generate_resources, after_batch=self.create_schedules)
+        self.load_resources()
+
+        self.create_calendar_overrides(options['calendar_days'])
+
+        self.history_days = options['history_days']
+        self.build_booking_calendar()
+        self.insert('bookings', Booking, Booking.objects.filter(resource__name__startswith=RESOURCE_PREFIX),
+                    options['bookings'], self.generate_bookings)
+        self.insert('notifications', UserNotification,
+                    UserNotification.objects.filter(user__email__endswith=f"@{LOAD_DOMAIN}"),
+                    options['notifications'], self.generate_notifications)
+        self.insert('audit_logs', AuditLog, AuditLog.objects.filter(actor_email__endswith=f"@{LOAD_DOMAIN}"),
+                    options['audit_logs'], self.generate_audit_logs)
+
+        self.stdout.write(self.style.SUCCESS(f"Load data ready in {time.monotonic() - started:.0f}s."))
+
+    # Driver
+
+    def rng(self, entity, batch_index):
+        # Each batch has its own stream so --resume regenerates identical rows
+        return random.Random(f"{self.seed}:{entity}:{batch_index}")
+
+    def insert(self, entity, model, existing_qs, total, generator, after_batch=None):
+        done = existing_qs.count()
+        if done >= total:
+            self.stdout.write(f"{entity}: {done} rows present, skipping.")
+            return
+        if done % self.batch_size:
+            raise CommandError(
+                f"{entity}: {done} rows present, which is not a multiple of --batch-size {self.batch_size}. "
+                "Resume with the batch size used originally."
+            )
+
+        started = time.monotonic()
+        first_batch = done // self.batch_size
+        batches = (total + self.batch_size - 1) // self.batch_size
+        for batch_index in range(first_batch, batches):
+            start = batch_index * self.batch_size
+            size = min(self.batch_size, total - start)
+            rows = list(generator(self.rng(entity, batch_index), start, size))
+            with transaction.atomic(), preserve_timestamps(model):
+                model.objects.bulk_create(rows)
+                if after_batch:
+                    after_batch(rows)
+            done = start + size
+            self.progress(entity, done - first_batch * self.batch_size, total - first_batch * self.batch_size, started)
+        self.progress(entity, 1, 1, started, final=True)
+
+    def progress(self, entity, done, total, started, final=False):
+        if not self.show_progress and not final:
+            return
+        elapsed = time.monotonic() - started
+        if final:
+            self.stdout.write(f"\r{entity}: done in {elapsed:.0f}s" + " " * 30)
+            return
+        rate = done / elapsed if elapsed else 0
+        eta = (total - done) / rate if rate else 0
+        self.stdout.write(
+            f"\r{entity}: {done}/{total} ({done / total:.0%}) {rate:,.0f} rows/s, eta {eta:.0f}s",
+            ending=""
+        )
+        self.stdout.flush()
+
+    # Users
+
+    def generate_users(self, rng, start, size):
+        roles, weights = zip(*ROLE_WEIGHTS)
+        cum = cumulative(weights)
+        for index in range(start, start + size):
+            role = rng.choices(roles, cum_weights=cum)[0]
+            # Guarantee some staff/admins even on tiny runs
+            if index < 5:
+                role = "STAFF"
+            elif index == 5:
+                role = "ADMIN"
+            created = self.now - datetime.timedelta(days=rng.randint(0, 4 * 365), seconds=rng.randint(0, 86399))
+            approval = "APPROVED" if rng.random() < 0.97 else rng.choice(["PENDING", "REJECTED"])
+            yield User(
+                email=f"load.user{index:07d}@{LOAD_DOMAIN}",
+                name=f"Load User {index}",
+                password=self.password_hash,
+                role=role,
+                account_status="ACTIVE" if rng.random() < 0.98 else "INACTIVE",
+                approval_status=approval,
+                is_email_verified=approval == "APPROVED",
+                is_staff=role == "ADMIN",
+                created_at=created,
+                updated_at=created,
+            )
+
+    def load_user_ids(self):
+        users = User.all_objects.filter(email__endswith=f"@{LOAD_DOMAIN}")
+        self.user_ids = list(users.order_by('id').values_list('id', flat=True))
+        self.staff_ids = list(users.filter(role="STAFF").order_by('id').values_list('id', flat=True))
+        self.admin_id = (
+            users.filter(role="ADMIN").order_by('id').values_list('id', flat=True).first()
+            or User.objects.filter(role="ADMIN").values_list('id', flat=True).first()
+        )
+        self.emails = dict(users.values_list('id', 'email'))
+
+    # Resources
+
+    def generate_resources(self, rng, start, size):
+        for index in range(start, start + size):
+            resource_type = rng.choices(["CLASSROOM", "LAB", "EVENT_HALL"], cum_weights=[60, 90, 100])[0]
+            created = self.now - datetime.timedelta(days=rng.randint(30, 3 * 365))
+            yield Resource(
+                name=f"{RESOURCE_PREFIX}{resource_type.title()} {index:05d}",
+                type=resource_type,
+                capacity=rng.randint(20, 300) if resource_type == "EVENT_HALL" else rng.randint(20, 80),
+                total_quantity=rng.choices([1, 2, 5, 10, 25], cum_weights=[70, 80, 90, 97, 100])[0],
+                location=f"Block {chr(65 + index % 12)}, Floor {index % 6}",
+                description="Generated by seed_load_data.",
+                approval_type=rng.choices(["AUTO_APPROVE", "STAFF_APPROVE", "ADMIN_APPROVE"], cum_weights=[50, 85, 100])[0],
+                managed_by_id=self.staff_ids[index % len(self.staff_ids)],
+                created_at=created,
+                updated_at=created,
+            )
+
+    def create_schedules(self, resources):
+        # bulk_create does not return ids on MySQL, so look the batch up by name
+        ids = Resource.all_objects.filter(name__in=[r.name for r in resources]).values_list('id', flat=True)
+        ResourceWeeklySchedule.objects.bulk_create([
+            ResourceWeeklySchedule(
+                resource_id=resource_id,
+                day_of_week=day,
+                start_time=datetime.time(8, 0),
+                end_time=datetime.time(19, 0),
+                is_working=day < 5,
+            )
+            for resource_id in ids for day in range(7)
+        ])
+
+    def load_resources(self):
+        rows = Resource.all_objects.filter(name__startswith=RESOURCE_PREFIX).order_by('id').values_list(
+            'id', 'managed_by_id', 'approval_type', 'total_quantity'
+        )
+        self.resources = list(rows)
+        # Zipf-like popularity: a few rooms take most of the demand
+        self.resource_cum = cumulative(1 / (rank + 1) ** 0.8 for rank in range(len(self.resources)))
+
+    # Calendar
+
+    def create_calendar_overrides(self, days):
+        rng = self.rng("calendar", 0)
+        overrides = []
+        for offset in range(days):
+            day = self.today + datetime.timedelta(days=offset)
+            if day.weekday() < 5 and rng.random() < 0.06:
+                overrides.append((day, "HOLIDAY", "Generated holiday"))
+            elif day.weekday() == 5 and rng.random() < 0.1:
+                overrides.append((day, "WORKING_DAY", "Generated working Saturday"))
+        CalendarOverride.objects.bulk_create([
+            CalendarOverride(start_date=day, end_date=day, override_type=kind, description=description, created_by_id=self.admin_id)
+            for day, kind, description in overrides
+        ], ignore_conflicts=True)
+        self.stdout.write(f"calendar_overrides: {len(overrides)} generated.")
+
+    # Bookings
+
+    def build_booking_calendar(self):
+        start = self.today - datetime.timedelta(days=self.history_days)
+        self.booking_days = [start + datetime.timedelta(days=offset) for offset in range(self.history_days + 90)]
+        self.booking_day_cum = cumulative(WEEKDAY_WEIGHTS[day.weekday()] for day in self.booking_days)
+        self.hours = list(HOUR_WEIGHTS)
+        self.hour_cum = cumulative(HOUR_WEIGHTS.values())
+
+    def generate_bookings(self, rng, start, size):
+        resources = self.resources
+        for _ in range(size):
+            resource_id, manager_id, approval_type, total_quantity = resources[
+                bisect.bisect_left(self.resource_cum, rng.random() * self.resource_cum[-1])
+            ]
+            booking_date = rng.choices(self.booking_days, cum_weights=self.booking_day_cum)[0]
+            hour = rng.choices(self.hours, cum_weights=self.hour_cum)[0]
+            user_id = rng.choice(self.user_ids)
+            # Booked up to two weeks ahead, but never in the future: versions
+            # built on Max(updated_at) would stop moving on such a dataset
+            created = min(self.now, timezone.make_aware(datetime.datetime.combine(
+                booking_date - datetime.timedelta(days=rng.randint(0, 14)), datetime.time(rng.randint(7, 21), rng.randint(0, 59))
+            )))
+
+            if booking_date < self.today:
+                status = rng.choices(["APPROVED", "CANCELLED", "REJECTED", "PENDING"], cum_weights=[70, 85, 95, 100])[0]
+            else:
+                status = rng.choices(["APPROVED", "PENDING", "CANCELLED"], cum_weights=[60, 95, 100])[0]
+            if approval_type == "AUTO_APPROVE" and status in ("PENDING", "REJECTED"):
+                status = "APPROVED"
+
+            booking = Booking(
+                user_id=user_id,
+                resource_id=resource_id,
+                booking_date=booking_date,
+                start_time=datetime.time(hour, 0),
+                end_time=datetime.time(hour + 1, 0),
+                quantity_requested=1 if total_quantity == 1 else rng.randint(1, min(3, total_quantity)),
+                status=status,
+                created_at=created,
+                updated_at=created,
+                approver_id=manager_id if approval_type == "STAFF_APPROVE" else None,
+            )
+            if status == "APPROVED":
+                booking.approved_by_id = user_id if approval_type == "AUTO_APPROVE" else (
+                    manager_id if approval_type == "STAFF_APPROVE" else self.admin_id
+                )
+                booking.approved_at = min(self.now, created + datetime.timedelta(hours=rng.randint(0, 48)))
+                booking.updated_at = booking.approved_at
+            elif status == "CANCELLED":
+                booking.cancelled_by_id = user_id
+                booking.cancelled_at = min(self.now, created + datetime.timedelta(hours=rng.randint(1, 72)))
+                booking.updated_at = booking.cancelled_at
+                booking.cancellation_reason = "Plans changed"
+            elif status == "REJECTED":
+                booking.rejected_by_id = manager_id if approval_type == "STAFF_APPROVE" else self.admin_id
+                booking.rejection_reason = "Slot needed for a scheduled class"
+            yield booking
+
+    # Notifications & audit
+
+    def generate_notifications(self, rng, start, size):
+        types = [(t, title) for t, title, _ in NOTIFICATION_TYPES]
+        cum = cumulative(weight for _, _, weight in NOTIFICATION_TYPES)
+        for _ in range(size):
+            message_type, title = rng.choices(types, cum_weights=cum)[0]
+            age_days = rng.randint(0, 365)
+            yield UserNotification(
+                user_id=rng.choice(self.user_ids),
+                message_type=message_type,
+                title=title,
+                body=f"{title}: generated notification.",
+                is_read=rng.random() < min(0.95, 0.3 + age_days / 60),
+                created_at=self.now - datetime.timedelta(days=age_days, seconds=rng.randint(0, 86399)),
+            )
+
+    def generate_audit_logs(self, rng, start, size):
+        for _ in range(size):
+            action, entity_type = rng.choice(AUDIT_ACTIONS)
+            actor_id = rng.choice(self.user_ids)
+            yield AuditLog(
+                actor_id=actor_id,
+                actor_email=self.emails[actor_id],
+                action=action,
+                target_entity_type=entity_type,
+                target_entity_id=actor_id if entity_type == "user" else rng.randint(1, 10_000_000),
+                ip_address=f"10.{rng.randint(0, 255)}.{rng.randint(0, 255)}.{rng.randint(1, 254)}",
+                timestamp=self.now - datetime.timedelta(days=rng.randint(0, 365), seconds=rng.randint(0, 86399)),
+            )
@@ -212,8 +212,9 @@ class Command(BaseCommand):
             next_saturday = today + datetime.timedelta(days=days_ahead)
             
             override, created = CalendarOverride.objects.get_or_create(
-                override_date=next_saturday,
+                start_date=next_saturday,
                 defaults={
+                    'end_date': next_saturday,
                     'override_type': 'HOLIDAY',
                     'description': 'Campus Maintenance Day',
                     'created_by': admin_user
@@ -0,0 +1,38 @@
+# Generated by Django 6.0.2 on 2026-10-19 01:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserArchive",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("email", models.EmailField(max_length=255)),
+                ("name", models.CharField(max_length=150)),
+                ("phone", models.CharField(blank=True, max_length=20, null=True)),
+                ("role", models.CharField(choices=[("STUDENT", "Student"), ("FACULTY", "Faculty"), ("STAFF", "Staff"), ("ADMIN", "Admin")], max_length=20)),
+                ("account_status", models.CharField(choices=[("ACTIVE", "Active"), ("INACTIVE", "Inactive")], max_length=20)),
+                ("approval_status", models.CharField(choices=[("PENDING", "Pending"), ("APPROVED", "Approved"), ("REJECTED", "Rejected")], max_length=20)),
+                ("rejection_reason", models.TextField(blank=True, null=True)),
+                ("is_email_verified", models.BooleanField(default=False)),
+                ("verified_at", models.DateTimeField(blank=True, null=True)),
+                ("is_staff", models.BooleanField(default=False)),
+                ("last_login", models.DateTimeField(blank=True, null=True)),
+                ("created_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+                ("deleted_at", models.DateTimeField(blank=True, null=True)),
+                ("archived_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "users_archive",
+                "indexes": [models.Index(fields=["email"], name="users_archi_email_48454d_idx")],
+            },
+        ),
+    ]
@@ -1,9 +1,9 @@
 from django.db import models
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
 from django.utils.translation import gettext_lazy as _
-from core.mixins import SoftDeleteMixin, SoftDeleteUserManager, SoftDeleteManager
+from core.mixins import DirtyFieldsMixin, SoftDeleteMixin, SoftDeleteUserManager, SoftDeleteManager
 
-class User(AbstractBaseUser, PermissionsMixin, SoftDeleteMixin):
+class User(DirtyFieldsMixin, AbstractBaseUser, PermissionsMixin, SoftDeleteMixin):
     ROLE_CHOICES = (
         ('STUDENT', 'Student'),
         ('FACULTY', 'Faculty'),
@@ -48,6 +48,9 @@ class User(AbstractBaseUser, PermissionsMixin, SoftDeleteMixin):
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['name']
 
+    # Kept out of audit log diffs
+    audit_exclude_fields = ('password', 'verification_token', 'reset_token')
+
     class Meta:
         db_table = 'users'
         indexes = [
@@ -62,7 +65,7 @@ class User(AbstractBaseUser, PermissionsMixin, SoftDeleteMixin):
         return self.email
 
 
-class RoleChangeRequest(models.Model):
+class RoleChangeRequest(DirtyFieldsMixin, models.Model):
     STATUS_CHOICES = (
         ('PENDING', 'Pending'),
         ('APPROVED', 'Approved'),
@@ -84,3 +87,42 @@ class RoleChangeRequest(models.Model):
             models.Index(fields=['user']),
             models.Index(fields=['status']),
         ]
+
+class UserArchive(models.Model):
+    """
+    Soft-deleted users moved out of `users` by the compact_soft_deleted
+    command. Rows keep their original id, so archived bookings and audit
+    logs still resolve; credentials and tokens are not carried over.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    email = models.EmailField(max_length=255)
+    name = models.CharField(max_length=150)
+    phone = models.CharField(max_length=20, blank=True, null=True)
+    role = models.CharField(max_length=20, choices=User.ROLE_CHOICES)
+    account_status = models.CharField(max_length=20, choices=User.ACCOUNT_STATUS_CHOICES)
+    approval_status = models.CharField(max_length=20, choices=User.APPROVAL_STATUS_CHOICES)
+    rejection_reason = models.TextField(blank=True, null=True)
+    is_email_verified = models.BooleanField(default=False)
+    verified_at = models.DateTimeField(blank=True, null=True)
+    is_staff = models.BooleanField(default=False)
+    last_login = models.DateTimeField(blank=True, null=True)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    deleted_at = models.DateTimeField(blank=True, null=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    # Columns copied verbatim between User and UserArchive
+    COPIED_FIELDS = [
+        'id', 'email', 'name', 'phone', 'role', 'account_status', 'approval_status',
+        'rejection_reason', 'is_email_verified', 'verified_at', 'is_staff', 'last_login',
+        'created_at', 'updated_at', 'deleted_at'
+    ]
+
+    class Meta:
+        db_table = 'users_archive'
+        indexes = [
+            models.Index(fields=['email']),
+        ]
+
+    def __str__(self):
+        return f"{self.email} (archived)"
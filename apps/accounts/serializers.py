@@ -4,6 +4,8 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
 from rest_framework.exceptions import AuthenticationFailed
 from .models import RoleChangeRequest
+from core.fieldsets import DynamicFieldsMixin
+from core.projections import Projection
 from core.validators import CustomPasswordValidator
 
 User = get_user_model()
@@ -86,7 +88,7 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         data['user'] = UserMinimalSerializer(self.user).data
         return data
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = [
@@ -96,6 +98,8 @@ class UserSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'email', 'created_at', 'updated_at', 'last_login']
 
+user_projection = Projection(UserSerializer)
+
 class UserUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
@@ -146,6 +150,20 @@ class RegistrationApprovalSerializer(serializers.Serializer):
             raise serializers.ValidationError({"rejection_reason": "Rejection reason is required."})
         return data
 
+class BulkDecisionSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False, max_length=500)
+    action = serializers.ChoiceField(choices=['approve', 'reject'])
+    rejection_reason = serializers.CharField(required=False, allow_blank=True)
+
+    def validate_ids(self, value):
+        # Keep the caller's order for the per-id results
+        return list(dict.fromkeys(value))
+
+    def validate(self, data):
+        if data['action'] == 'reject' and not data.get('rejection_reason'):
+            raise serializers.ValidationError({"rejection_reason": "Rejection reason is required."})
+        return data
+
 class RoleChangeRequestCreateSerializer(serializers.ModelSerializer):
     requested_role = serializers.ChoiceField(choices=['STUDENT', 'FACULTY', 'STAFF'])
 
@@ -0,0 +1,246 @@
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+from django.utils import timezone
+
+from .models import RoleChangeRequest, User, UserArchive
+from apps.audit.models import AuditLog, build_audit_log, bulk_create_audit_logs
+from core.compaction import compact_batch, compactable
+from apps.notifications.services import build_notification, bulk_notify
+
+def registration_error(user, actor, action):
+    """
+    Why `actor` can't approve/reject `user`'s registration, or None. Faculty
+    may only decide on students.
+    """
+    if user.approval_status != "PENDING":
+        return "Registration is not pending."
+    if actor.role == "FACULTY" and user.role != "STUDENT":
+        return f"Faculty can only {action} students."
+    return None
+
+def role_change_error(role_request, actor, action):
+    """
+    Why `actor` can't approve/reject `role_request`, or None. Changes to
+    Faculty/Staff need an admin.
+    """
+    if role_request.status != "PENDING":
+        return "Request is not pending."
+    if role_request.requested_role in ["FACULTY", "STAFF"] and actor.role != "ADMIN":
+        return f"Only Admin can {action} changes to Faculty/Staff."
+    return None
+
+def results(ids, errors, message):
+    return [
+        {"id": item_id, "success": errors[item_id] is None, "message": errors[item_id] or message}
+        for item_id in ids
+    ]
+
+def decide_registrations(actor, user_ids, action, rejection_reason=None, ip_address=None):
+    """
+    Approves or rejects many pending registrations at once: one query for
+    the permission checks, one guarded UPDATE, and bulk audit and
+    notification inserts. Returns one {"id", "success", "message"} dict per
+    requested id, in order.
+    """
+    users = {user.id: user for user in User.objects.filter(id__in=user_ids)}
+    errors = {}
+    for user_id in user_ids:
+        user = users.get(user_id)
+        errors[user_id] = registration_error(user, actor, action) if user else "User not found."
+    allowed = [user_id for user_id in user_ids if errors[user_id] is None]
+
+    decided = []
+    with transaction.atomic():
+        if allowed:
+            # Another approver may have decided some of these meanwhile
+            decided = list(
+                User.objects.select_for_update().filter(id__in=allowed, approval_status="PENDING")
+                .order_by("id").values_list("id", flat=True)
+            )
+        if decided:
+            now = timezone.now()
+            if action == "approve":
+                User.objects.filter(id__in=decided).update(approval_status="APPROVED", updated_at=now)
+            else:
+                User.objects.filter(id__in=decided).update(
+                    approval_status="REJECTED", rejection_reason=rejection_reason, updated_at=now
+                )
+
+        # Audit rows commit with the state change they record
+        logs = []
+        notifications = []
+        for user_id in decided:
+            user = users[user_id]
+            # Mirror the UPDATE on the loaded copy so the audit diff matches
+            # ApproveRegistrationView/RejectRegistrationView
+            user.approval_status = "APPROVED" if action == "approve" else "REJECTED"
+            if action == "reject":
+                user.rejection_reason = rejection_reason
+            previous_state, new_state = user.state_diff()
+            if action == "approve":
+                logs.append(build_audit_log(
+                    actor=actor,
+                    action="REGISTRATION_APPROVED",
+                    target_entity_type="user",
+                    target_entity_id=user.id,
+                    previous_state=previous_state,
+                    new_state=new_state,
+                    metadata={"bulk": True},
+                    ip_address=ip_address
+                ))
+                notifications.append(build_notification(
+                    user=user,
+                    message_type="REGISTRATION_APPROVED",
+                    title="Registration Approved",
+                    body="Your registration has been approved. You can now access the system."
+                ))
+            else:
+                logs.append(build_audit_log(
+                    actor=actor,
+                    action="REGISTRATION_REJECTED",
+                    target_entity_type="user",
+                    target_entity_id=user.id,
+                    previous_state=previous_state,
+                    new_state=new_state,
+                    metadata={"bulk": True},
+                    ip_address=ip_address
+                ))
+                notifications.append(build_notification(
+                    user=user,
+                    message_type="REGISTRATION_REJECTED",
+                    title="Registration Rejected",
+                    body=f"Your registration was rejected. Reason: {rejection_reason}"
+                ))
+        bulk_create_audit_logs(logs)
+        bulk_notify(notifications)
+
+    decided_set = set(decided)
+    for user_id in allowed:
+        if user_id not in decided_set:
+            errors[user_id] = "Registration is not pending."
+
+    message = "User approved successfully." if action == "approve" else "User rejected successfully."
+    return results(user_ids, errors, message)
+
+def decide_role_changes(actor, request_ids, action, rejection_reason=None, ip_address=None):
+    """
+    Approves or rejects many pending role change requests at once. Approved
+    users get their new role with one UPDATE per target role. Returns one
+    {"id", "success", "message"} dict per requested id, in order.
+    """
+    role_requests = {
+        role_request.id: role_request
+        for role_request in RoleChangeRequest.objects.filter(id__in=request_ids).select_related("user")
+    }
+    errors = {}
+    for request_id in request_ids:
+        role_request = role_requests.get(request_id)
+        errors[request_id] = role_change_error(role_request, actor, action) if role_request else "Request not found."
+    allowed = [request_id for request_id in request_ids if errors[request_id] is None]
+
+    now = timezone.now()
+    decided = []
+    with transaction.atomic():
+        if allowed:
+            decided = list(
+                RoleChangeRequest.objects.select_for_update().filter(id__in=allowed, status="PENDING")
+                .order_by("id").values_list("id", flat=True)
+            )
+        if decided and action == "approve":
+            RoleChangeRequest.objects.filter(id__in=decided).update(
+                status="APPROVED", reviewed_by=actor, reviewed_at=now
+            )
+            by_role = defaultdict(list)
+            for request_id in decided:
+                role_request = role_requests[request_id]
+                by_role[role_request.requested_role].append(role_request.user_id)
+            for role, user_ids in by_role.items():
+                User.objects.filter(id__in=user_ids).update(role=role, updated_at=now)
+        elif decided:
+            RoleChangeRequest.objects.filter(id__in=decided).update(
+                status="REJECTED", rejection_reason=rejection_reason, reviewed_by=actor, reviewed_at=now
+            )
+
+        # Audit rows commit with the state change they record
+        logs = []
+        notifications = []
+        for request_id in decided:
+            role_request = role_requests[request_id]
+            user = role_request.user
+            if action == "approve":
+                logs.append(build_audit_log(
+                    actor=actor,
+                    action="ROLE_CHANGE_APPROVED",
+                    target_entity_type="user",
+                    target_entity_id=user.id,
+                    previous_state={"role": user.role},
+                    new_state={"role": role_request.requested_role},
+                    metadata={"request_id": role_request.id, "bulk": True},
+                    ip_address=ip_address
+                ))
+                notifications.append(build_notification(
+                    user=user,
+                    message_type="ROLE_CHANGE_APPROVED",
+                    title="Role Change Approved",
+                    body=f"Your role has been changed to {role_request.requested_role}."
+                ))
+            else:
+                logs.append(build_audit_log(
+                    actor=actor,
+                    action="ROLE_CHANGE_REJECTED",
+                    target_entity_type="role_change_request",
+                    target_entity_id=role_request.id,
+                    metadata={"bulk": True},
+                    ip_address=ip_address
+                ))
+                notifications.append(build_notification(
+                    user=user,
+                    message_type="ROLE_CHANGE_REJECTED",
+                    title="Role Change Rejected",
+                    body=f"Your role change request to {role_request.requested_role} was rejected. Reason: {rejection_reason}"
+                ))
+        bulk_create_audit_logs(logs)
+        bulk_notify(notifications)
+
+    decided_set = set(decided)
+    for request_id in allowed:
+        if request_id not in decided_set:
+            errors[request_id] = "Request is not pending."
+
+    message = "Role change approved." if action == "approve" else "Role change rejected."
+    return results(request_ids, errors, message)
+
+# Rows that go with a compacted user. Audit logs lose the actor link but keep
+# actor_email; anything else referring to the user keeps it in `users`.
+USER_COMPACTION_DISPOSABLE = (
+    "notifications.UserNotification",
+    "notifications.NotificationSummary",
+    "bookings.BookingWaitlistEntry",
+    "bookings.BookingHold",
+    "core.IdempotencyKey",
+    "token_blacklist.OutstandingToken",
+    "audit.AuditLog",
+)
+
+def compactable_users(older_than_days):
+    return compactable(User, older_than_days, USER_COMPACTION_DISPOSABLE)
+
+def keep_actor_emails(user_ids):
+    """
+    Fills in actor_email on audit logs of users about to be compacted, so
+    the log still names them once the actor link is cleared.
+    """
+    AuditLog.objects.filter(actor_id__in=user_ids, actor_email__isnull=True).update(
+        actor_email=Subquery(User.all_objects.filter(pk=OuterRef("actor_id")).values("email")[:1])
+    )
+
+def compact_users_batch(older_than_days, batch_size):
+    """
+    Moves up to `batch_size` long-deleted users into users_archive. Returns
+    the number moved.
+    """
+    return compact_batch(
+        User, UserArchive, older_than_days, batch_size, USER_COMPACTION_DISPOSABLE, before_delete=keep_actor_emails
+    )
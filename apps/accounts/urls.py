@@ -5,6 +5,7 @@ from .views import (
     PendingRegistrationsView, ApproveRegistrationView, RejectRegistrationView,
     RoleChangeRequestCreateView, RoleChangeRequestListView, MyRoleChangeRequestsView,
     ApproveRoleChangeView, RejectRoleChangeView, StatisticsView,
+    BulkRegistrationDecisionView, BulkRoleChangeDecisionView,
 )
 
 urlpatterns = [
@@ -20,12 +21,14 @@ urlpatterns = [
     path("profile/change-password/", ChangePasswordView.as_view(), name="change-password"),
     
     path("approvals/registrations/", PendingRegistrationsView.as_view(), name="pending-registrations"),
+    path("approvals/registrations/bulk-decision/", BulkRegistrationDecisionView.as_view(), name="bulk-registration-decision"),
     path("approvals/registrations/<int:pk>/approve/", ApproveRegistrationView.as_view(), name="approve-registration"),
     path("approvals/registrations/<int:pk>/reject/", RejectRegistrationView.as_view(), name="reject-registration"),
     
     path("role-changes/", RoleChangeRequestCreateView.as_view(), name="role-change-create"),
     path("role-changes/list/", RoleChangeRequestListView.as_view(), name="role-change-list"),
     path("role-changes/my/", MyRoleChangeRequestsView.as_view(), name="my-role-changes"),
+    path("role-changes/bulk-decision/", BulkRoleChangeDecisionView.as_view(), name="bulk-role-change-decision"),
     path("role-changes/<int:pk>/approve/", ApproveRoleChangeView.as_view(), name="approve-role-change"),
     path("role-changes/<int:pk>/reject/", RejectRoleChangeView.as_view(), name="reject-role-change"),
     
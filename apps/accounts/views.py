@@ -13,14 +13,17 @@ from .serializers import (
     RegisterSerializer, CustomTokenObtainPairSerializer, UserSerializer, 
     UserUpdateSerializer, ProfileSerializer, ChangePasswordSerializer,
     RegistrationApprovalSerializer, RoleChangeRequestCreateSerializer,
-    RoleChangeRequestSerializer, RoleChangeReviewSerializer
+    RoleChangeRequestSerializer, RoleChangeReviewSerializer, BulkDecisionSerializer, user_projection
 )
 from .models import RoleChangeRequest
+from .services import decide_registrations, decide_role_changes
 from apps.audit.models import create_audit_log
 from apps.notifications.services import create_notification, notify_admins, notify_faculty
 from apps.resources.models import Resource, ResourceAdditionRequest
 from apps.bookings.models import Booking
 from core.permissions import IsActiveAndApproved, IsAdmin, IsFacultyOrAdmin
+from core.fieldsets import SparseFieldsetMixin
+from core.projections import ProjectionListMixin
 from core.response import success_response, error_response
 
 User = get_user_model()
@@ -92,6 +95,7 @@ class LoginView(TokenObtainPairView):
 
 class LogoutView(views.APIView):
     permission_classes = [IsAuthenticated]
+    idempotent = True
 
     def post(self, request):
         try:
@@ -126,9 +130,11 @@ class ApprovalStatusView(views.APIView):
         }
         return success_response(data)
 
-class UserListView(generics.ListAPIView):
+class UserListView(SparseFieldsetMixin, ProjectionListMixin, generics.ListAPIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved, IsAdmin]
     serializer_class = UserSerializer
+    projection = user_projection
+    query_budget = 3
 
     def get_queryset(self):
         queryset = User.objects.all()
@@ -147,18 +153,10 @@ class UserListView(generics.ListAPIView):
             
         return queryset.order_by('-created_at')
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        serializer = self.get_serializer(queryset, many=True)
-        return success_response(serializer.data)
-
-class UserDetailView(generics.RetrieveUpdateDestroyAPIView):
+class UserDetailView(SparseFieldsetMixin, generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved, IsAdmin]
     queryset = User.objects.all()
+    idempotent = True
     
     def get_serializer_class(self):
         if self.request.method in ['PUT', 'PATCH']:
@@ -210,6 +208,7 @@ class UserDetailView(generics.RetrieveUpdateDestroyAPIView):
 
 class ProfileView(views.APIView):
     permission_classes = [IsAuthenticated]
+    idempotent = True
 
     def get(self, request):
         if request.user.approval_status == "APPROVED":
@@ -250,6 +249,7 @@ class ProfileView(views.APIView):
 class ChangePasswordView(generics.GenericAPIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved]
     serializer_class = ChangePasswordSerializer
+    idempotent = True
 
     def post(self, request):
         serializer = self.get_serializer(data=request.data)
@@ -269,9 +269,11 @@ class ChangePasswordView(generics.GenericAPIView):
         
         return success_response(message="Password changed successfully.")
 
-class PendingRegistrationsView(generics.ListAPIView):
+class PendingRegistrationsView(SparseFieldsetMixin, ProjectionListMixin, generics.ListAPIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved, IsFacultyOrAdmin]
     serializer_class = UserSerializer
+    projection = user_projection
+    query_budget = 3
 
     def get_queryset(self):
         queryset = User.objects.filter(approval_status="PENDING")
@@ -280,17 +282,9 @@ class PendingRegistrationsView(generics.ListAPIView):
         # Admin sees all pending
         return queryset.order_by('-created_at')
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        serializer = self.get_serializer(queryset, many=True)
-        return success_response(serializer.data)
-
 class ApproveRegistrationView(views.APIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved, IsFacultyOrAdmin]
+    idempotent = True
 
     def post(self, request, pk):
         user_to_approve = get_object_or_404(User, pk=pk)
@@ -300,6 +294,7 @@ class ApproveRegistrationView(views.APIView):
             return error_response(message="Faculty can only approve students.", status_code=403)
             
         user_to_approve.approval_status = "APPROVED"
+        previous_state, new_state = user_to_approve.state_diff()
         user_to_approve.save()
         
         create_audit_log(
@@ -307,6 +302,8 @@ class ApproveRegistrationView(views.APIView):
             action="REGISTRATION_APPROVED",
             target_entity_type="user",
             target_entity_id=user_to_approve.id,
+            previous_state=previous_state,
+            new_state=new_state,
             ip_address=getattr(request, 'audit_ip', None)
         )
         
@@ -321,6 +318,7 @@ class ApproveRegistrationView(views.APIView):
 
 class RejectRegistrationView(views.APIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved, IsFacultyOrAdmin]
+    idempotent = True
 
     def post(self, request, pk):
         user_to_reject = get_object_or_404(User, pk=pk)
@@ -337,6 +335,7 @@ class RejectRegistrationView(views.APIView):
 
         user_to_reject.approval_status = "REJECTED"
         user_to_reject.rejection_reason = serializer.validated_data.get('rejection_reason')
+        previous_state, new_state = user_to_reject.state_diff()
         user_to_reject.save()
         
         create_audit_log(
@@ -344,6 +343,8 @@ class RejectRegistrationView(views.APIView):
             action="REGISTRATION_REJECTED",
             target_entity_type="user",
             target_entity_id=user_to_reject.id,
+            previous_state=previous_state,
+            new_state=new_state,
             ip_address=getattr(request, 'audit_ip', None)
         )
         
@@ -356,9 +357,35 @@ class RejectRegistrationView(views.APIView):
         
         return success_response(message="User rejected successfully.")
 
+class BulkRegistrationDecisionView(views.APIView):
+    """
+    Approves or rejects a list of pending registrations, reporting on each
+    id separately.
+    """
+    permission_classes = [IsAuthenticated, IsActiveAndApproved, IsFacultyOrAdmin]
+    idempotent = True
+
+    def post(self, request):
+        serializer = BulkDecisionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        results = decide_registrations(
+            request.user,
+            serializer.validated_data['ids'],
+            serializer.validated_data['action'],
+            rejection_reason=serializer.validated_data.get('rejection_reason'),
+            ip_address=getattr(request, 'audit_ip', None)
+        )
+        processed = sum(1 for result in results if result["success"])
+        return success_response(
+            {"processed": processed, "failed": len(results) - processed, "results": results},
+            message=f"{processed} of {len(results)} registration(s) updated."
+        )
+
 class RoleChangeRequestCreateView(generics.CreateAPIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved]
     serializer_class = RoleChangeRequestCreateSerializer
+    idempotent = True
 
     def post(self, request, *args, **kwargs):
         if request.user.role == "ADMIN":
@@ -393,9 +420,10 @@ class RoleChangeRequestCreateView(generics.CreateAPIView):
 class RoleChangeRequestListView(generics.ListAPIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved, IsFacultyOrAdmin]
     serializer_class = RoleChangeRequestSerializer
+    query_budget = 3
 
     def get_queryset(self):
-        queryset = RoleChangeRequest.objects.filter(status="PENDING")
+        queryset = RoleChangeRequest.objects.filter(status="PENDING").select_related("user", "reviewed_by")
         if self.request.user.role == "FACULTY":
             queryset = queryset.filter(requested_role="STUDENT")
         return queryset.order_by('-created_at')
@@ -412,9 +440,10 @@ class RoleChangeRequestListView(generics.ListAPIView):
 class MyRoleChangeRequestsView(generics.ListAPIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved]
     serializer_class = RoleChangeRequestSerializer
+    query_budget = 2
 
     def get_queryset(self):
-        return RoleChangeRequest.objects.filter(user=self.request.user)
+        return RoleChangeRequest.objects.filter(user=self.request.user).select_related("user", "reviewed_by")
     
     def list(self, request, *args, **kwargs):
         queryset = self.filter_queryset(self.get_queryset())
@@ -423,6 +452,7 @@ class MyRoleChangeRequestsView(generics.ListAPIView):
 
 class ApproveRoleChangeView(views.APIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved, IsFacultyOrAdmin]
+    idempotent = True
 
     def post(self, request, pk):
         role_request = get_object_or_404(RoleChangeRequest, pk=pk)
@@ -444,8 +474,8 @@ class ApproveRoleChangeView(views.APIView):
         role_request.save()
         
         user = role_request.user
-        previous_role = user.role
         user.role = role_request.requested_role
+        previous_state, new_state = user.state_diff()
         user.save()
         
         create_audit_log(
@@ -453,8 +483,8 @@ class ApproveRoleChangeView(views.APIView):
             action="ROLE_CHANGE_APPROVED",
             target_entity_type="user",
             target_entity_id=user.id,
-            previous_state={"role": previous_role},
-            new_state={"role": user.role},
+            previous_state=previous_state,
+            new_state=new_state,
             metadata={"request_id": role_request.id},
             ip_address=getattr(request, 'audit_ip', None)
         )
@@ -470,6 +500,7 @@ class ApproveRoleChangeView(views.APIView):
 
 class RejectRoleChangeView(views.APIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved, IsFacultyOrAdmin]
+    idempotent = True
 
     def post(self, request, pk):
         role_request = get_object_or_404(RoleChangeRequest, pk=pk)
@@ -513,6 +544,31 @@ class RejectRoleChangeView(views.APIView):
         
         return success_response(message="Role change rejected.")
 
+class BulkRoleChangeDecisionView(views.APIView):
+    """
+    Approves or rejects a list of pending role change requests, reporting on
+    each id separately.
+    """
+    permission_classes = [IsAuthenticated, IsActiveAndApproved, IsFacultyOrAdmin]
+    idempotent = True
+
+    def post(self, request):
+        serializer = BulkDecisionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        results = decide_role_changes(
+            request.user,
+            serializer.validated_data['ids'],
+            serializer.validated_data['action'],
+            rejection_reason=serializer.validated_data.get('rejection_reason'),
+            ip_address=getattr(request, 'audit_ip', None)
+        )
+        processed = sum(1 for result in results if result["success"])
+        return success_response(
+            {"processed": processed, "failed": len(results) - processed, "results": results},
+            message=f"{processed} of {len(results)} role change request(s) updated."
+        )
+
 class StatisticsView(views.APIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved, IsAdmin]
 
@@ -1,5 +1,6 @@
 from django.db import models
 from apps.accounts.models import User
+from core.metrics import AUDIT_WRITE
 
 class AuditLog(models.Model):
     id = models.BigAutoField(primary_key=True)
@@ -42,9 +43,27 @@ def create_audit_log(actor, action, target_entity_type, target_entity_id=None, p
     # If actor is deleted or unavailable, we might still have the email
     # but here we just take it from the user object if present.
     
-    return AuditLog.objects.create(
+    with AUDIT_WRITE.time():
+        return AuditLog.objects.create(
+            actor=actor,
+            actor_email=actor_email,
+            action=action,
+            target_entity_type=target_entity_type,
+            target_entity_id=target_entity_id,
+            previous_state=previous_state,
+            new_state=new_state,
+            metadata=metadata,
+            ip_address=ip_address
+        )
+
+def build_audit_log(actor, action, target_entity_type, target_entity_id=None, previous_state=None, new_state=None, metadata=None, ip_address=None):
+    """
+    Unsaved AuditLog with the same fields as create_audit_log, for
+    bulk_create_audit_logs.
+    """
+    return AuditLog(
         actor=actor,
-        actor_email=actor_email,
+        actor_email=actor.email if actor else None,
         action=action,
         target_entity_type=target_entity_type,
         target_entity_id=target_entity_id,
@@ -53,3 +72,11 @@ def create_audit_log(actor, action, target_entity_type, target_entity_id=None, p
         metadata=metadata,
         ip_address=ip_address
     )
+
+def bulk_create_audit_logs(logs):
+    """
+    Inserts AuditLog entries built with build_audit_log in one statement.
+    """
+    if logs:
+        with AUDIT_WRITE.time():
+            AuditLog.objects.bulk_create(logs)
@@ -1,8 +1,10 @@
 from rest_framework import serializers
 from .models import AuditLog
 from apps.accounts.serializers import UserMinimalSerializer
+from core.fieldsets import DynamicFieldsMixin
+from core.projections import Projection
 
-class AuditLogSerializer(serializers.ModelSerializer):
+class AuditLogSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     actor = UserMinimalSerializer(read_only=True)
 
     class Meta:
@@ -14,3 +16,5 @@ class AuditLogSerializer(serializers.ModelSerializer):
             'ip_address', 'timestamp'
         ]
         read_only_fields = fields
+
+audit_log_projection = Projection(AuditLogSerializer)
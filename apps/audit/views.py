@@ -1,14 +1,17 @@
 from rest_framework import generics
 from rest_framework.permissions import IsAuthenticated
 from django.db.models import Q
-from .serializers import AuditLogSerializer
+from .serializers import AuditLogSerializer, audit_log_projection
 from .models import AuditLog
 from core.permissions import IsActiveAndApproved, IsAdmin
-from core.response import success_response
+from core.fieldsets import SparseFieldsetMixin
+from core.projections import ProjectionListMixin
 
-class AuditLogListView(generics.ListAPIView):
+class AuditLogListView(SparseFieldsetMixin, ProjectionListMixin, generics.ListAPIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved, IsAdmin]
     serializer_class = AuditLogSerializer
+    projection = audit_log_projection
+    query_budget = 3
 
     def get_queryset(self):
         queryset = AuditLog.objects.all()
@@ -38,12 +41,3 @@ class AuditLogListView(generics.ListAPIView):
             queryset = queryset.filter(Q(action__icontains=search) | Q(actor_email__icontains=search))
             
         return queryset
-
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        serializer = self.get_serializer(queryset, many=True)
-        return success_response(serializer.data)
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Booking
+from .models import Booking, BookingArchive, BookingHold, BookingWaitlistEntry
 
 class BookingAdmin(admin.ModelAdmin):
     list_display = ('user', 'resource', 'booking_date', 'start_time', 'status')
@@ -8,3 +8,27 @@ class BookingAdmin(admin.ModelAdmin):
     readonly_fields = ('created_at', 'updated_at')
 
 admin.site.register(Booking, BookingAdmin)
+
+class BookingWaitlistEntryAdmin(admin.ModelAdmin):
+    list_display = ('user', 'resource', 'booking_date', 'start_time', 'status', 'created_at')
+    list_filter = ('status', 'booking_date')
+    search_fields = ('user__email', 'resource__name')
+    readonly_fields = ('created_at', 'promoted_at')
+
+admin.site.register(BookingWaitlistEntry, BookingWaitlistEntryAdmin)
+
+class BookingHoldAdmin(admin.ModelAdmin):
+    list_display = ('user', 'resource', 'booking_date', 'start_time', 'quantity', 'status', 'expires_at')
+    list_filter = ('status', 'booking_date')
+    search_fields = ('user__email', 'resource__name', 'token')
+    readonly_fields = ('token', 'created_at')
+
+admin.site.register(BookingHold, BookingHoldAdmin)
+
+class BookingArchiveAdmin(admin.ModelAdmin):
+    # Ids rather than relations: users and resources may have been compacted
+    list_display = ('id', 'user_id', 'resource_id', 'booking_date', 'start_time', 'status', 'archived_at')
+    list_filter = ('status',)
+    search_fields = ('=id', '=user_id', '=resource_id')
+
+admin.site.register(BookingArchive, BookingArchiveAdmin)
@@ -0,0 +1,25 @@
+from django.conf import settings
+
+from .services import archive_batch, expire_holds, expire_pending_bookings
+from core.jobs import job
+
+@job("bookings.expire_holds", schedule="* * * * *")
+def expire_holds_job():
+    expire_holds()
+
+@job("bookings.archive", schedule="30 3 * * *")
+def archive_job(older_than_days=None, batch_size=1000, max_batches=200):
+    """
+    Nightly archive_bookings run. Capped at `max_batches` so a large backlog
+    is worked off over several nights instead of outliving the job lease.
+    """
+    days = older_than_days or settings.BOOKING_ARCHIVE_AFTER_DAYS
+    for _ in range(max_batches):
+        if not archive_batch(days, batch_size):
+            break
+
+@job("bookings.expire_pending", schedule="*/5 * * * *")
+def expire_pending_job(batch_size=500, max_batches=50):
+    for _ in range(max_batches):
+        if not expire_pending_bookings(batch_size):
+            break
@@ -0,0 +1,40 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.bookings.services import archivable_bookings, archive_batch
+
+class Command(BaseCommand):
+    help = (
+        'Moves old bookings (and rejected/cancelled ones whose date has passed) into '
+        'bookings_archive in small transactions. Safe to interrupt and re-run.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.BOOKING_ARCHIVE_AFTER_DAYS,
+                            help='Archive every booking dated more than this many days ago.')
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--max-batches', type=int, default=None, help='Stop after this many batches.')
+        parser.add_argument('--sleep', type=float, default=0.0, help='Seconds to pause between batches.')
+        parser.add_argument('--dry-run', action='store_true', help='Only count what would be archived.')
+
+    def handle(self, *args, **options):
+        if options['dry_run']:
+            count = archivable_bookings(options['days']).count()
+            self.stdout.write(f"{count} booking(s) would be archived.")
+            return
+
+        moved = batches = 0
+        while options['max_batches'] is None or batches < options['max_batches']:
+            count = archive_batch(options['days'], options['batch_size'])
+            if not count:
+                break
+            moved += count
+            batches += 1
+            if options['verbosity'] > 1:
+                self.stdout.write(f"  batch {batches}: {count} booking(s), {moved} total")
+            if options['sleep']:
+                time.sleep(options['sleep'])
+
+        self.stdout.write(self.style.SUCCESS(f"Archived {moved} booking(s) in {batches} batch(es)."))
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+
+from apps.bookings.services import expire_holds
+
+class Command(BaseCommand):
+    help = 'Marks slot holds past their expiry as EXPIRED. Run it from cron every minute or so.'
+
+    def handle(self, *args, **options):
+        expired = expire_holds()
+        self.stdout.write(self.style.SUCCESS(f"Expired {expired} hold(s)."))
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from apps.bookings.services import expire_pending_bookings
+
+class Command(BaseCommand):
+    help = (
+        'Expires pending bookings nobody reviewed before their expiry point '
+        '(BOOKING_PENDING_EXPIRY_HOURS or the resource override). The worker runs this every five minutes.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        total = 0
+        while True:
+            expired = expire_pending_bookings(options['batch_size'])
+            if not expired:
+                break
+            total += expired
+        self.stdout.write(self.style.SUCCESS(f"Expired {total} pending booking(s)."))
@@ -0,0 +1,41 @@
+# Generated by Django 6.0.2 on 2026-10-19 01:02
+
+import django.core.validators
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bookings", "0001_initial"),
+        ("resources", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BookingWaitlistEntry",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("booking_date", models.DateField()),
+                ("start_time", models.TimeField()),
+                ("end_time", models.TimeField()),
+                ("quantity_requested", models.IntegerField(default=1, validators=[django.core.validators.MinValueValidator(1)])),
+                ("is_special_request", models.BooleanField(default=False)),
+                ("special_request_reason", models.TextField(blank=True, null=True)),
+                ("status", models.CharField(choices=[("WAITING", "Waiting"), ("PROMOTED", "Promoted"), ("CANCELLED", "Cancelled")], default="WAITING", max_length=20)),
+                ("promoted_at", models.DateTimeField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("booking", models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="waitlist_entry", to="bookings.booking")),
+                ("resource", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="waitlist_entries", to="resources.resource")),
+                ("user", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="waitlist_entries", to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                "db_table": "booking_waitlist",
+                "ordering": ["created_at", "id"],
+                "indexes": [models.Index(fields=["resource", "booking_date", "start_time", "status", "created_at"], name="booking_wai_resourc_48995c_idx"), models.Index(fields=["user", "status"], name="booking_wai_user_id_c21d94_idx")],
+            },
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 6.0.2 on 2026-10-19 01:06
+
+import django.core.validators
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bookings", "0002_bookingwaitlistentry"),
+        ("resources", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BookingHold",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("token", models.CharField(max_length=64, unique=True)),
+                ("booking_date", models.DateField()),
+                ("start_time", models.TimeField()),
+                ("end_time", models.TimeField()),
+                ("quantity", models.IntegerField(default=1, validators=[django.core.validators.MinValueValidator(1)])),
+                ("is_special_request", models.BooleanField(default=False)),
+                ("status", models.CharField(choices=[("ACTIVE", "Active"), ("CONFIRMED", "Confirmed"), ("RELEASED", "Released"), ("EXPIRED", "Expired")], default="ACTIVE", max_length=20)),
+                ("expires_at", models.DateTimeField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("booking", models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="hold", to="bookings.booking")),
+                ("resource", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="booking_holds", to="resources.resource")),
+                ("user", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="booking_holds", to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                "db_table": "booking_holds",
+                "indexes": [models.Index(fields=["resource", "booking_date", "start_time", "status", "expires_at"], name="booking_hol_resourc_73224d_idx"), models.Index(fields=["status", "expires_at"], name="booking_hol_status_c1c346_idx")],
+            },
+        ),
+    ]
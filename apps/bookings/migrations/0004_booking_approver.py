@@ -0,0 +1,43 @@
+# Generated by Django 6.0.2 on 2026-10-19 01:11
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_approvers(apps, schema_editor):
+    Booking = apps.get_model("bookings", "Booking")
+    Resource = apps.get_model("resources", "Resource")
+    staff_approved = Resource.objects.filter(approval_type="STAFF_APPROVE").values_list("id", "managed_by_id")
+    for resource_id, manager_id in staff_approved.iterator():
+        Booking.objects.filter(resource_id=resource_id).update(approver_id=manager_id)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bookings", "0003_bookinghold"),
+        ("resources", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="booking",
+            name="bookings_status_51373b_idx",
+        ),
+        migrations.AddField(
+            model_name="booking",
+            name="approver",
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="booking_inbox", to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RunPython(backfill_approvers, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="booking",
+            index=models.Index(fields=["status", "created_at"], name="bookings_status_8f492c_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="booking",
+            index=models.Index(fields=["approver", "status", "created_at"], name="bookings_approve_4a84ad_idx"),
+        ),
+    ]
@@ -0,0 +1,86 @@
+# Generated by Django 6.0.2 on 2026-10-19 01:13
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bookings", "0004_booking_approver"),
+        ("resources", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BookingArchive",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("booking_date", models.DateField()),
+                ("start_time", models.TimeField()),
+                ("end_time", models.TimeField()),
+                ("quantity_requested", models.IntegerField(default=1)),
+                ("status", models.CharField(choices=[("PENDING", "Pending"), ("APPROVED", "Approved"), ("REJECTED", "Rejected"), ("CANCELLED", "Cancelled")], max_length=20)),
+                ("is_special_request", models.BooleanField(default=False)),
+                ("special_request_reason", models.TextField(blank=True, null=True)),
+                ("cancellation_reason", models.TextField(blank=True, null=True)),
+                ("cancelled_at", models.DateTimeField(blank=True, null=True)),
+                ("approved_at", models.DateTimeField(blank=True, null=True)),
+                ("rejection_reason", models.TextField(blank=True, null=True)),
+                ("created_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+                ("archived_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "bookings_archive",
+            },
+        ),
+        migrations.RemoveIndex(
+            model_name="booking",
+            name="bookings_user_id_fdc49e_idx",
+        ),
+        migrations.AddIndex(
+            model_name="booking",
+            index=models.Index(fields=["user", "booking_date", "id"], name="bookings_user_id_6c78bc_idx"),
+        ),
+        migrations.AddField(
+            model_name="bookingarchive",
+            name="approved_by",
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="+", to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name="bookingarchive",
+            name="approver",
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="+", to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name="bookingarchive",
+            name="cancelled_by",
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="+", to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name="bookingarchive",
+            name="rejected_by",
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="+", to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name="bookingarchive",
+            name="resource",
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="archived_bookings", to="resources.resource"),
+        ),
+        migrations.AddField(
+            model_name="bookingarchive",
+            name="user",
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="archived_bookings", to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name="bookingarchive",
+            index=models.Index(fields=["user", "booking_date", "id"], name="bookings_ar_user_id_fda86a_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="bookingarchive",
+            index=models.Index(fields=["resource", "booking_date"], name="bookings_ar_resourc_47bf5a_idx"),
+        ),
+    ]
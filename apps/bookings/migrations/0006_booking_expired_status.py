@@ -0,0 +1,30 @@
+# Generated by Django 6.0.2 on 2026-10-19 01:21
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bookings", "0005_bookingarchive"),
+        ("resources", "0002_resource_pending_expiry_hours"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="booking",
+            name="status",
+            field=models.CharField(choices=[("PENDING", "Pending"), ("APPROVED", "Approved"), ("REJECTED", "Rejected"), ("CANCELLED", "Cancelled"), ("EXPIRED", "Expired")], default="PENDING", max_length=20),
+        ),
+        migrations.AlterField(
+            model_name="bookingarchive",
+            name="status",
+            field=models.CharField(choices=[("PENDING", "Pending"), ("APPROVED", "Approved"), ("REJECTED", "Rejected"), ("CANCELLED", "Cancelled"), ("EXPIRED", "Expired")], max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name="booking",
+            index=models.Index(fields=["status", "booking_date", "start_time"], name="bookings_status_8479a4_idx"),
+        ),
+    ]
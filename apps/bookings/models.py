@@ -2,13 +2,22 @@ from django.db import models
 from django.core.validators import MinValueValidator
 from apps.accounts.models import User
 from apps.resources.models import Resource
+from core.mixins import DirtyFieldsMixin
 
-class Booking(models.Model):
+def approver_id_for(resource):
+    """
+    Whose inbox a pending booking on `resource` lands in: the manager for
+    STAFF_APPROVE resources, None (the admin queue) otherwise.
+    """
+    return resource.managed_by_id if resource.approval_type == "STAFF_APPROVE" else None
+
+class Booking(DirtyFieldsMixin, models.Model):
     STATUS_CHOICES = (
         ('PENDING', 'Pending'),
         ('APPROVED', 'Approved'),
         ('REJECTED', 'Rejected'),
         ('CANCELLED', 'Cancelled'),
+        ('EXPIRED', 'Expired'),
     )
 
     id = models.BigAutoField(primary_key=True)
@@ -31,6 +40,10 @@ class Booking(models.Model):
     
     rejected_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='rejected_bookings')
     rejection_reason = models.TextField(blank=True, null=True)
+
+    # Denormalized from the resource so approval inboxes don't join it;
+    # kept in sync by apps.bookings.services.sync_approvers
+    approver = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='booking_inbox')
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -39,10 +52,140 @@ class Booking(models.Model):
         db_table = 'bookings'
         indexes = [
             models.Index(fields=['resource', 'booking_date', 'start_time', 'status']),
-            models.Index(fields=['user']),
-            models.Index(fields=['status']),
+            models.Index(fields=['user', 'booking_date', 'id']),
+            models.Index(fields=['status', 'created_at']),
+            models.Index(fields=['status', 'booking_date', 'start_time']),
+            models.Index(fields=['approver', 'status', 'created_at']),
             models.Index(fields=['booking_date']),
         ]
 
+    def save(self, *args, **kwargs):
+        if self._state.adding and self.approver_id is None:
+            self.approver_id = approver_id_for(self.resource)
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.user.email} - {self.resource.name} ({self.booking_date})"
+
+class BookingArchive(models.Model):
+    """
+    Cold storage for bookings moved out of `bookings` by the archive_bookings
+    command. Rows keep their original id, so hot and archived bookings share
+    one id space.
+
+    Users and resources referenced here may themselves be compacted into
+    users_archive/resources_archive (same ids), so these relations carry no
+    database constraint. `resource` is nullable only so select_related uses
+    an outer join and keeps rows whose resource was compacted.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    user = models.ForeignKey(User, on_delete=models.DO_NOTHING, db_constraint=False, related_name='archived_bookings')
+    resource = models.ForeignKey(
+        Resource, on_delete=models.DO_NOTHING, db_constraint=False, null=True, related_name='archived_bookings'
+    )
+    booking_date = models.DateField()
+    start_time = models.TimeField()
+    end_time = models.TimeField()
+    quantity_requested = models.IntegerField(default=1)
+    status = models.CharField(max_length=20, choices=Booking.STATUS_CHOICES)
+    is_special_request = models.BooleanField(default=False)
+    special_request_reason = models.TextField(blank=True, null=True)
+
+    cancellation_reason = models.TextField(blank=True, null=True)
+    cancelled_by = models.ForeignKey(User, on_delete=models.DO_NOTHING, db_constraint=False, null=True, blank=True, related_name='+')
+    cancelled_at = models.DateTimeField(null=True, blank=True)
+
+    approved_by = models.ForeignKey(User, on_delete=models.DO_NOTHING, db_constraint=False, null=True, blank=True, related_name='+')
+    approved_at = models.DateTimeField(null=True, blank=True)
+
+    rejected_by = models.ForeignKey(User, on_delete=models.DO_NOTHING, db_constraint=False, null=True, blank=True, related_name='+')
+    rejection_reason = models.TextField(blank=True, null=True)
+
+    approver = models.ForeignKey(User, on_delete=models.DO_NOTHING, db_constraint=False, null=True, blank=True, related_name='+')
+
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    # Columns copied verbatim between Booking and BookingArchive
+    COPIED_FIELDS = [
+        'id', 'user_id', 'resource_id', 'booking_date', 'start_time', 'end_time',
+        'quantity_requested', 'status', 'is_special_request', 'special_request_reason',
+        'cancellation_reason', 'cancelled_by_id', 'cancelled_at', 'approved_by_id',
+        'approved_at', 'rejected_by_id', 'rejection_reason', 'approver_id',
+        'created_at', 'updated_at'
+    ]
+
+    class Meta:
+        db_table = 'bookings_archive'
+        indexes = [
+            models.Index(fields=['user', 'booking_date', 'id']),
+            models.Index(fields=['resource', 'booking_date']),
+        ]
+
+    def __str__(self):
+        return f"Booking {self.id} ({self.booking_date}, archived)"
+
+class BookingWaitlistEntry(models.Model):
+    STATUS_CHOICES = (
+        ('WAITING', 'Waiting'),
+        ('PROMOTED', 'Promoted'),
+        ('CANCELLED', 'Cancelled'),
+    )
+
+    id = models.BigAutoField(primary_key=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='waitlist_entries')
+    resource = models.ForeignKey(Resource, on_delete=models.CASCADE, related_name='waitlist_entries')
+    booking_date = models.DateField()
+    start_time = models.TimeField()
+    end_time = models.TimeField()
+    quantity_requested = models.IntegerField(default=1, validators=[MinValueValidator(1)])
+    is_special_request = models.BooleanField(default=False)
+    special_request_reason = models.TextField(blank=True, null=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='WAITING')
+    booking = models.OneToOneField(Booking, on_delete=models.SET_NULL, null=True, blank=True, related_name='waitlist_entry')
+    promoted_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'booking_waitlist'
+        ordering = ['created_at', 'id']
+        indexes = [
+            models.Index(fields=['resource', 'booking_date', 'start_time', 'status', 'created_at']),
+            models.Index(fields=['user', 'status']),
+        ]
+
+    def __str__(self):
+        return f"{self.user.email} waiting for {self.resource.name} ({self.booking_date} {self.start_time})"
+
+class BookingHold(models.Model):
+    STATUS_CHOICES = (
+        ('ACTIVE', 'Active'),
+        ('CONFIRMED', 'Confirmed'),
+        ('RELEASED', 'Released'),
+        ('EXPIRED', 'Expired'),
+    )
+
+    id = models.BigAutoField(primary_key=True)
+    token = models.CharField(max_length=64, unique=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='booking_holds')
+    resource = models.ForeignKey(Resource, on_delete=models.CASCADE, related_name='booking_holds')
+    booking_date = models.DateField()
+    start_time = models.TimeField()
+    end_time = models.TimeField()
+    quantity = models.IntegerField(default=1, validators=[MinValueValidator(1)])
+    is_special_request = models.BooleanField(default=False)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='ACTIVE')
+    expires_at = models.DateTimeField()
+    booking = models.OneToOneField(Booking, on_delete=models.SET_NULL, null=True, blank=True, related_name='hold')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'booking_holds'
+        indexes = [
+            models.Index(fields=['resource', 'booking_date', 'start_time', 'status', 'expires_at']),
+            models.Index(fields=['status', 'expires_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.user.email} holds {self.resource.name} ({self.booking_date} {self.start_time})"
@@ -1,7 +1,10 @@
 from rest_framework import serializers
-from .models import Booking
+from .models import Booking, BookingArchive, BookingHold, BookingWaitlistEntry
+from .services import waitlist_position
 from apps.accounts.serializers import UserMinimalSerializer
 from apps.resources.models import Resource
+from core.fieldsets import DynamicFieldsMixin
+from core.projections import Projection
 from core.validators import validate_hourly_alignment
 from django.utils import timezone
 import datetime
@@ -14,13 +17,14 @@ class ResourceMinimalSerializer(serializers.ModelSerializer):
 class BookingCreateSerializer(serializers.ModelSerializer):
     resource_id = serializers.IntegerField()
     start_time = serializers.TimeField(validators=[validate_hourly_alignment])
+    join_waitlist = serializers.BooleanField(default=False)
 
     class Meta:
         model = Booking
         fields = [
             'resource_id', 'booking_date', 'start_time', 
             'quantity_requested', 'is_special_request', 
-            'special_request_reason'
+            'special_request_reason', 'join_waitlist'
         ]
         extra_kwargs = {
             'quantity_requested': {'default': 1, 'min_value': 1},
@@ -35,7 +39,7 @@ class BookingCreateSerializer(serializers.ModelSerializer):
              raise serializers.ValidationError({"booking_date": "Cannot book in the past."})
         return data
 
-class BookingSerializer(serializers.ModelSerializer):
+class BookingSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     user = UserMinimalSerializer(read_only=True)
     resource = ResourceMinimalSerializer(read_only=True)
 
@@ -51,6 +55,74 @@ class BookingSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = fields
 
+booking_projection = Projection(BookingSerializer)
+
+class BookingArchiveSerializer(serializers.ModelSerializer):
+    user = UserMinimalSerializer(read_only=True)
+    resource = serializers.SerializerMethodField()
+
+    class Meta:
+        model = BookingArchive
+        fields = BookingSerializer.Meta.fields
+        read_only_fields = fields
+
+    def get_resource(self, obj):
+        # Compacted resources come from context["archived_resources"] (id -> ResourceArchive)
+        resource = obj.resource or self.context.get("archived_resources", {}).get(obj.resource_id)
+        return ResourceMinimalSerializer(resource).data if resource is not None else None
+
+class BookingWaitlistEntrySerializer(serializers.ModelSerializer):
+    resource = ResourceMinimalSerializer(read_only=True)
+    position = serializers.SerializerMethodField()
+
+    class Meta:
+        model = BookingWaitlistEntry
+        fields = [
+            'id', 'resource', 'booking_date', 'start_time', 'end_time',
+            'quantity_requested', 'status', 'position', 'booking',
+            'promoted_at', 'created_at'
+        ]
+        read_only_fields = fields
+
+    def get_position(self, obj):
+        if obj.status != "WAITING":
+            return None
+        if hasattr(obj, "queue_position"):
+            return obj.queue_position
+        return waitlist_position(obj)
+
+class BookingHoldCreateSerializer(serializers.ModelSerializer):
+    resource_id = serializers.IntegerField()
+    start_time = serializers.TimeField(validators=[validate_hourly_alignment])
+
+    class Meta:
+        model = BookingHold
+        fields = ['resource_id', 'booking_date', 'start_time', 'quantity', 'is_special_request']
+        extra_kwargs = {
+            'quantity': {'default': 1, 'min_value': 1},
+            'is_special_request': {'default': False}
+        }
+
+    def validate_booking_date(self, value):
+        if value < timezone.localdate():
+            raise serializers.ValidationError("Cannot book in the past.")
+        return value
+
+class BookingHoldSerializer(serializers.ModelSerializer):
+    resource = ResourceMinimalSerializer(read_only=True)
+
+    class Meta:
+        model = BookingHold
+        fields = [
+            'token', 'resource', 'booking_date', 'start_time', 'end_time',
+            'quantity', 'is_special_request', 'status', 'expires_at',
+            'booking', 'created_at'
+        ]
+        read_only_fields = fields
+
+class BookingHoldConfirmSerializer(serializers.Serializer):
+    special_request_reason = serializers.CharField(required=False, allow_blank=True)
+
 class BookingApprovalSerializer(serializers.Serializer):
     action = serializers.ChoiceField(choices=['approve', 'reject'])
     rejection_reason = serializers.CharField(required=False, allow_blank=True)
@@ -60,6 +132,20 @@ class BookingApprovalSerializer(serializers.Serializer):
             raise serializers.ValidationError({"rejection_reason": "Rejection reason is required."})
         return data
 
+class BookingBulkDecisionSerializer(serializers.Serializer):
+    booking_ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False, max_length=200)
+    action = serializers.ChoiceField(choices=['approve', 'reject'])
+    rejection_reason = serializers.CharField(required=False, allow_blank=True)
+
+    def validate_booking_ids(self, value):
+        # Keep the caller's order for the per-id results
+        return list(dict.fromkeys(value))
+
+    def validate(self, data):
+        if data['action'] == 'reject' and not data.get('rejection_reason'):
+            raise serializers.ValidationError({"rejection_reason": "Rejection reason is required."})
+        return data
+
 class BookingCancelSerializer(serializers.Serializer):
     cancellation_reason = serializers.CharField(required=True)
 
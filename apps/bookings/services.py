@@ -0,0 +1,662 @@
+import datetime
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Count, OuterRef, Q, Subquery, Sum
+from django.utils import timezone
+
+from .models import Booking, BookingArchive, BookingHold, BookingWaitlistEntry, approver_id_for
+from apps.audit.models import build_audit_log, bulk_create_audit_logs, create_audit_log
+from apps.notifications.services import build_notification, bulk_notify, create_notification, notify_admins
+from apps.resources.models import Resource
+from apps.resources.services import override_on
+from core.metrics import BOOKING_HOLDS, BOOKINGS_CREATED, BOOKINGS_EXPIRED, WAITLIST_PROMOTED
+
+ACTIVE_STATUSES = ["PENDING", "APPROVED"]
+
+# Badge counts may lag a missed invalidation by at most this long
+PENDING_COUNT_TTL = 60
+
+def booked_quantity(resource, booking_date, start_time):
+    """
+    Seats taken on one slot by pending and approved bookings.
+    """
+    return Booking.objects.filter(
+        resource=resource,
+        booking_date=booking_date,
+        start_time=start_time,
+        status__in=ACTIVE_STATUSES
+    ).aggregate(total=Sum("quantity_requested"))["total"] or 0
+
+def held_quantity(resource, booking_date, start_time):
+    """
+    Seats reserved on one slot by active holds that haven't expired yet.
+    Expired holds stop counting immediately, before the sweeper marks them.
+    """
+    return BookingHold.objects.filter(
+        resource=resource,
+        booking_date=booking_date,
+        start_time=start_time,
+        status="ACTIVE",
+        expires_at__gt=timezone.now()
+    ).aggregate(total=Sum("quantity"))["total"] or 0
+
+def taken_quantity(resource, booking_date, start_time):
+    return booked_quantity(resource, booking_date, start_time) + held_quantity(resource, booking_date, start_time)
+
+def slot_usage(resource, booking_date):
+    """
+    Booked and held seats per start_time for a whole day, as two dicts,
+    in two queries regardless of how many slots the day has.
+    """
+    booked = dict(
+        Booking.objects.filter(resource=resource, booking_date=booking_date, status__in=ACTIVE_STATUSES)
+        .order_by().values_list("start_time").annotate(total=Sum("quantity_requested"))
+    )
+    held = dict(
+        BookingHold.objects.filter(
+            resource=resource, booking_date=booking_date, status="ACTIVE", expires_at__gt=timezone.now()
+        ).order_by().values_list("start_time").annotate(total=Sum("quantity"))
+    )
+    return booked, held
+
+def expire_holds():
+    """
+    Marks active holds past their expiry as EXPIRED. Returns the count.
+    """
+    expired = BookingHold.objects.filter(status="ACTIVE", expires_at__lte=timezone.now()).update(status="EXPIRED")
+    if expired:
+        BOOKING_HOLDS.labels(outcome="expired").inc(expired)
+    return expired
+
+def working_day_error(resource, booking_date, is_special):
+    """
+    Why `booking_date` can't be booked on `resource`, or None. Holidays and
+    non-working weekdays are only open to special requests.
+    """
+    message = "Cannot book on a non-working day. Submit a special request instead."
+    override = override_on(booking_date)
+    if override:
+        if override.override_type == "HOLIDAY" and not is_special:
+            return message
+        return None
+    schedule = resource.weekly_schedules.filter(day_of_week=booking_date.weekday()).first()
+    if (schedule and schedule.is_working) or is_special:
+        return None
+    return message
+
+def announce_booking(booking, booking_data, actor, ip_address=None):
+    """
+    Audit log plus notifications for a newly created booking: the booker
+    when it was auto-approved, otherwise whoever has to approve it.
+    """
+    resource = booking.resource
+    create_audit_log(
+        actor=actor,
+        action="BOOKING_CREATED",
+        target_entity_type="booking",
+        target_entity_id=booking.id,
+        new_state=booking_data,
+        ip_address=ip_address
+    )
+
+    if booking.status == "APPROVED":
+        create_notification(
+            user=booking.user,
+            message_type="BOOKING_APPROVED",
+            title="Booking Approved",
+            body=f"Your booking for {resource.name} on {booking.booking_date} has been auto-approved."
+        )
+    else:
+        invalidate_pending_counts(booking.approver_id)
+        # Notify approver
+        title = "New Booking Request"
+        body = f"User {booking.user.name} requested {resource.name} on {booking.booking_date}."
+        if resource.approval_type == "STAFF_APPROVE":
+            # Notify manager
+            create_notification(
+                user=resource.managed_by,
+                message_type="GENERAL", # Or specific type for request
+                title=title,
+                body=body
+            )
+        elif resource.approval_type == "ADMIN_APPROVE":
+            notify_admins("GENERAL", title, body)
+
+def pending_inbox(user):
+    """
+    Pending bookings `user` can act on, oldest first. Both queues are range
+    reads on the (status, created_at) / (approver, status, created_at)
+    indexes.
+    """
+    if user.role == "ADMIN":
+        return Booking.objects.filter(status="PENDING").order_by("created_at")
+    if user.role == "STAFF":
+        return Booking.objects.filter(approver=user, status="PENDING").order_by("created_at")
+    return Booking.objects.none()
+
+def pending_count_key(user):
+    return "pending_count:admin" if user.role == "ADMIN" else f"pending_count:{user.id}"
+
+def pending_count(user):
+    """
+    Cached size of `user`'s pending inbox, for badges.
+    """
+    return cache.get_or_set(pending_count_key(user), lambda: pending_inbox(user).count(), PENDING_COUNT_TTL)
+
+def invalidate_pending_counts(*approver_ids):
+    """
+    Drops the cached counts for these approvers and for admins, who see
+    every pending booking. Call it whenever bookings enter or leave PENDING.
+    Inside a transaction the keys are dropped once it commits; dropping them
+    earlier would let a concurrent pending_count() re-cache the old count.
+    """
+    keys = ["pending_count:admin"] + [f"pending_count:{i}" for i in set(approver_ids) if i]
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+def sync_approvers(resource, previous_approver_id):
+    """
+    Re-points pending bookings at the resource's current approver after its
+    managed_by or approval_type changed.
+    """
+    approver_id = approver_id_for(resource)
+    if approver_id == previous_approver_id:
+        return 0
+    updated = Booking.objects.filter(resource=resource, status="PENDING").update(approver_id=approver_id)
+    invalidate_pending_counts(previous_approver_id, approver_id)
+    return updated
+
+def waitlist_position(entry):
+    """
+    1-based position of a waiting entry in its slot's queue.
+    """
+    return BookingWaitlistEntry.objects.filter(
+        resource_id=entry.resource_id,
+        booking_date=entry.booking_date,
+        start_time=entry.start_time,
+        status="WAITING",
+        id__lte=entry.id
+    ).count()
+
+def with_waitlist_positions(queryset):
+    """
+    Annotates `queue_position` (what waitlist_position returns) on every
+    entry in the same query, for lists.
+    """
+    ahead = BookingWaitlistEntry.objects.filter(
+        resource_id=OuterRef("resource_id"),
+        booking_date=OuterRef("booking_date"),
+        start_time=OuterRef("start_time"),
+        status="WAITING",
+        id__lte=OuterRef("id")
+    ).order_by().values("resource_id").annotate(position=Count("id")).values("position")
+    return queryset.annotate(queue_position=Subquery(ahead))
+
+def promote_waitlist(resource, slots, actor=None, ip_address=None):
+    """
+    Turns waiting entries into bookings for the seats now free on `slots`
+    ((booking_date, start_time) pairs), oldest entry first. Entries that need
+    more seats than are free are skipped in favour of the next one that fits.
+
+    Must run inside the transaction that freed the seats, with `resource`
+    locked by select_for_update, so promotions can't overbook. Bookings,
+    entry updates, notifications and audit logs are written in bulk.
+    Returns the promoted bookings.
+    """
+    today = timezone.localdate()
+    slots = {slot for slot in slots if slot[0] >= today}
+    if not slots or resource.is_deleted or resource.resource_status != "AVAILABLE":
+        return []
+
+    dates = {date for date, _ in slots}
+    times = {start for _, start in slots}
+    booked = {
+        (row["booking_date"], row["start_time"]): row["total"]
+        for row in Booking.objects.filter(
+            resource=resource, booking_date__in=dates, start_time__in=times, status__in=ACTIVE_STATUSES
+        ).values("booking_date", "start_time").annotate(total=Sum("quantity_requested"))
+    }
+    held = {
+        (row["booking_date"], row["start_time"]): row["total"]
+        for row in BookingHold.objects.filter(
+            resource=resource, booking_date__in=dates, start_time__in=times,
+            status="ACTIVE", expires_at__gt=timezone.now()
+        ).values("booking_date", "start_time").annotate(total=Sum("quantity"))
+    }
+    free = {slot: resource.total_quantity - booked.get(slot, 0) - held.get(slot, 0) for slot in slots}
+
+    waiters = BookingWaitlistEntry.objects.filter(
+        resource=resource,
+        status="WAITING",
+        booking_date__in=dates,
+        start_time__in=times,
+        user__is_deleted=False,
+        user__account_status="ACTIVE",
+        user__approval_status="APPROVED",
+    ).select_related("user").order_by("id")
+
+    now = timezone.now()
+    auto_approve = resource.approval_type == "AUTO_APPROVE"
+    promoted = []
+    for entry in waiters:
+        slot = (entry.booking_date, entry.start_time)
+        if slot not in free or entry.quantity_requested > free[slot]:
+            continue
+        free[slot] -= entry.quantity_requested
+        entry.booking = Booking(
+            user=entry.user,
+            resource=resource,
+            booking_date=entry.booking_date,
+            start_time=entry.start_time,
+            end_time=entry.end_time,
+            quantity_requested=entry.quantity_requested,
+            status="APPROVED" if auto_approve else "PENDING",
+            is_special_request=entry.is_special_request,
+            special_request_reason=entry.special_request_reason,
+            approved_by=entry.user if auto_approve else None,
+            approved_at=now if auto_approve else None,
+            approver_id=approver_id_for(resource)
+        )
+        promoted.append(entry)
+
+    if not promoted:
+        return []
+
+    bookings = [entry.booking for entry in promoted]
+    if connection.features.can_return_rows_from_bulk_insert:
+        Booking.objects.bulk_create(bookings)
+    else:
+        # MySQL doesn't hand back ids from bulk inserts, and the entries need them
+        for booking in bookings:
+            booking.save()
+
+    for entry in promoted:
+        entry.status = "PROMOTED"
+        entry.promoted_at = now
+    BookingWaitlistEntry.objects.bulk_update(promoted, ["status", "booking", "promoted_at"])
+
+    notifications = []
+    logs = []
+    for entry in promoted:
+        booking = entry.booking
+        if auto_approve:
+            body = f"A seat opened up for {resource.name} on {booking.booking_date} {booking.start_time}-{booking.end_time}. Your booking is confirmed."
+        else:
+            body = f"A seat opened up for {resource.name} on {booking.booking_date} {booking.start_time}-{booking.end_time}. Your booking is now pending approval."
+        notifications.append(build_notification(
+            user=entry.user,
+            message_type="WAITLIST_PROMOTED",
+            title="Waitlist Promotion",
+            body=body,
+            related_entity_type="booking",
+            related_entity_id=booking.id
+        ))
+        logs.append(build_audit_log(
+            actor=actor,
+            action="BOOKING_WAITLIST_PROMOTED",
+            target_entity_type="booking",
+            target_entity_id=booking.id,
+            new_state={"status": booking.status, "user_id": entry.user_id},
+            metadata={"waitlist_entry_id": entry.id},
+            ip_address=ip_address
+        ))
+        BOOKINGS_CREATED.labels(status=booking.status).inc()
+        WAITLIST_PROMOTED.labels(status=booking.status).inc()
+
+    if not auto_approve:
+        invalidate_pending_counts(approver_id_for(resource))
+        title = "New Booking Requests"
+        body = f"{len(promoted)} waitlisted request(s) for {resource.name} need review."
+        if resource.approval_type == "STAFF_APPROVE":
+            notifications.append(build_notification(
+                user=resource.managed_by,
+                message_type="GENERAL",
+                title=title,
+                body=body
+            ))
+        elif resource.approval_type == "ADMIN_APPROVE":
+            notify_admins(message_type="GENERAL", title=title, body=body)
+
+    bulk_notify(notifications)
+    bulk_create_audit_logs(logs)
+    return bookings
+
+def cancel_waitlist(resource, reason, actor=None, ip_address=None):
+    """
+    Cancels every waiting entry for `resource` and tells the waiters why.
+    Returns the number of entries cancelled.
+    """
+    entries = list(BookingWaitlistEntry.objects.filter(resource=resource, status="WAITING").select_related("user"))
+    if not entries:
+        return 0
+
+    BookingWaitlistEntry.objects.filter(id__in=[entry.id for entry in entries]).update(status="CANCELLED")
+    bulk_notify([
+        build_notification(
+            user=entry.user,
+            message_type="BOOKING_AUTO_CANCELLED",
+            title="Waitlist Cancelled",
+            body=f"Your waitlist entry for {resource.name} on {entry.booking_date} was cancelled. Reason: {reason}"
+        )
+        for entry in entries
+    ])
+    bulk_create_audit_logs([
+        build_audit_log(
+            actor=actor,
+            action="BOOKING_WAITLIST_CANCELLED",
+            target_entity_type="booking_waitlist",
+            target_entity_id=entry.id,
+            metadata={"reason": reason},
+            ip_address=ip_address
+        )
+        for entry in entries
+    ])
+    return len(entries)
+
+def cancel_resource_bookings(resource, reason, actor=None, ip_address=None):
+    """
+    Cancels every pending or approved booking for `resource` from today on,
+    with one UPDATE and bulk-inserted notifications and audit rows. Returns
+    the number of bookings cancelled.
+    """
+    bookings = list(Booking.objects.filter(
+        resource=resource,
+        booking_date__gte=datetime.date.today(),
+        status__in=ACTIVE_STATUSES
+    ).select_related("user"))
+    if not bookings:
+        return 0
+
+    now = timezone.now()
+    Booking.objects.filter(id__in=[booking.id for booking in bookings]).update(
+        status="CANCELLED",
+        cancellation_reason=reason,
+        cancelled_by=actor,
+        cancelled_at=now,
+        updated_at=now
+    )
+    invalidate_pending_counts(*{booking.approver_id for booking in bookings if booking.status == "PENDING"})
+    bulk_notify([
+        build_notification(
+            user=booking.user,
+            message_type="BOOKING_AUTO_CANCELLED",
+            title="Booking Auto-Cancelled",
+            body=f"Your booking for {resource.name} on {booking.booking_date} has been cancelled because the resource was removed by administrator."
+        )
+        for booking in bookings
+    ])
+    bulk_create_audit_logs([
+        build_audit_log(
+            actor=actor,
+            action="BOOKING_AUTO_CANCELLED",
+            target_entity_type="booking",
+            target_entity_id=booking.id,
+            metadata={"reason": "Resource deleted"},
+            ip_address=ip_address
+        )
+        for booking in bookings
+    ])
+    return len(bookings)
+
+def decision_error(booking, actor, action):
+    """
+    Why `actor` can't approve/reject `booking`, or None. Same rules as
+    ApproveBookingView and RejectBookingView.
+    """
+    verb = "approved" if action == "approve" else "rejected"
+    if booking.status != "PENDING":
+        return f"Only pending bookings can be {verb}."
+    resource = booking.resource
+    if resource.approval_type == "AUTO_APPROVE":
+        return "Auto-approved resources do not require manual approval."
+    if resource.approval_type == "STAFF_APPROVE" and resource.managed_by_id != actor.id:
+        return f"Only the resource manager can {action} this."
+    if resource.approval_type == "ADMIN_APPROVE" and actor.role != "ADMIN":
+        return f"Only admins can {action} this."
+    return None
+
+def decide_bookings(actor, booking_ids, action, rejection_reason=None, ip_address=None):
+    """
+    Approves or rejects many pending bookings at once. Permissions are checked
+    against one query, the status change is a single UPDATE guarded by
+    status=PENDING, and audit logs and notifications are bulk inserted.
+    Rejections free seats, so they lock the affected resources and promote
+    waitlists like RejectBookingView does.
+
+    Returns one {"id", "success", "message"} dict per requested id, in order.
+    """
+    bookings = {
+        booking.id: booking
+        for booking in Booking.objects.filter(id__in=booking_ids).select_related("resource", "user")
+    }
+    errors = {}
+    for booking_id in booking_ids:
+        booking = bookings.get(booking_id)
+        errors[booking_id] = decision_error(booking, actor, action) if booking else "Booking not found."
+    allowed = [booking_id for booking_id in booking_ids if errors[booking_id] is None]
+
+    now = timezone.now()
+    decided = []
+    with transaction.atomic():
+        if allowed and action == "reject":
+            resource_ids = {bookings[booking_id].resource_id for booking_id in allowed}
+            resources = {
+                resource.id: resource
+                for resource in Resource.objects.select_for_update().filter(id__in=resource_ids).order_by("id")
+            }
+
+        if allowed:
+            # Re-read under the row locks; another approver may have got there first
+            decided = list(
+                Booking.objects.select_for_update().filter(id__in=allowed, status="PENDING")
+                .order_by("id").values_list("id", flat=True)
+            )
+        if decided:
+            if action == "approve":
+                Booking.objects.filter(id__in=decided).update(
+                    status="APPROVED", approved_by=actor, approved_at=now, updated_at=now
+                )
+            else:
+                Booking.objects.filter(id__in=decided).update(
+                    status="REJECTED", rejected_by=actor, rejection_reason=rejection_reason, updated_at=now
+                )
+                freed = defaultdict(set)
+                for booking_id in decided:
+                    booking = bookings[booking_id]
+                    freed[booking.resource_id].add((booking.booking_date, booking.start_time))
+                for resource_id, slots in freed.items():
+                    promote_waitlist(resources[resource_id], slots, actor=actor, ip_address=ip_address)
+
+    decided_set = set(decided)
+    for booking_id in allowed:
+        if booking_id not in decided_set:
+            errors[booking_id] = "Booking was updated by someone else."
+    if decided:
+        invalidate_pending_counts(*(bookings[booking_id].approver_id for booking_id in decided))
+
+    notifications = []
+    logs = []
+    for booking_id in decided:
+        booking = bookings[booking_id]
+        resource = booking.resource
+        # Mirror the UPDATE on the loaded copy so the audit diff matches the
+        # single-booking endpoints
+        if action == "approve":
+            booking.status = "APPROVED"
+            booking.approved_by = actor
+            booking.approved_at = now
+        else:
+            booking.status = "REJECTED"
+            booking.rejected_by = actor
+            booking.rejection_reason = rejection_reason
+        previous_state, new_state = booking.state_diff()
+        if action == "approve":
+            logs.append(build_audit_log(
+                actor=actor,
+                action="BOOKING_APPROVED",
+                target_entity_type="booking",
+                target_entity_id=booking.id,
+                previous_state=previous_state,
+                new_state=new_state,
+                metadata={"bulk": True},
+                ip_address=ip_address
+            ))
+            notifications.append(build_notification(
+                user=booking.user,
+                message_type="BOOKING_APPROVED",
+                title="Booking Approved",
+                body=f"Your booking for {resource.name} on {booking.booking_date} {booking.start_time}-{booking.end_time} has been approved."
+            ))
+        else:
+            logs.append(build_audit_log(
+                actor=actor,
+                action="BOOKING_REJECTED",
+                target_entity_type="booking",
+                target_entity_id=booking.id,
+                previous_state=previous_state,
+                new_state=new_state,
+                metadata={"bulk": True},
+                ip_address=ip_address
+            ))
+            notifications.append(build_notification(
+                user=booking.user,
+                message_type="BOOKING_REJECTED",
+                title="Booking Rejected",
+                body=f"Your booking for {resource.name} on {booking.booking_date} was rejected. Reason: {rejection_reason}"
+            ))
+    bulk_create_audit_logs(logs)
+    bulk_notify(notifications)
+
+    message = "Booking approved." if action == "approve" else "Booking rejected."
+    return [
+        {"id": booking_id, "success": errors[booking_id] is None, "message": errors[booking_id] or message}
+        for booking_id in booking_ids
+    ]
+
+def pending_expiry_filter(now):
+    """
+    Q for pending bookings past their expiry point: slot start minus the
+    resource's pending_expiry_hours (or BOOKING_PENDING_EXPIRY_HOURS when
+    unset). One branch per distinct override, so the whole policy is a
+    single query.
+    """
+    def due(hours):
+        cutoff = timezone.localtime(now) + datetime.timedelta(hours=hours)
+        return Q(booking_date__lt=cutoff.date()) | Q(booking_date=cutoff.date(), start_time__lte=cutoff.time())
+
+    condition = Q(resource__pending_expiry_hours__isnull=True) & due(settings.BOOKING_PENDING_EXPIRY_HOURS)
+    overrides = (
+        Resource.all_objects.filter(pending_expiry_hours__isnull=False)
+        .order_by().values_list("pending_expiry_hours", flat=True).distinct()
+    )
+    for hours in overrides:
+        condition |= Q(resource__pending_expiry_hours=hours) & due(hours)
+    return condition
+
+def expire_pending_bookings(batch_size=500, now=None):
+    """
+    Moves up to `batch_size` stale pending bookings to EXPIRED with one
+    UPDATE, so they stop holding seats. On auto-approve resources, slots
+    that haven't started yet get their waitlists promoted into the freed
+    seats; elsewhere a promotion would only be a new pending booking inside
+    the expiry window, so the seat is left for direct booking.
+    Notifications and audit logs are bulk inserted. Returns the number
+    expired; 0 means done.
+    """
+    now = now or timezone.now()
+    local_now = timezone.localtime(now)
+    current_slot = (local_now.date(), local_now.time())
+    candidates = {
+        booking.id: booking
+        for booking in Booking.objects.filter(pending_expiry_filter(now), status="PENDING")
+        .select_related("user", "resource").order_by("id")[:batch_size]
+    }
+    if not candidates:
+        return 0
+
+    with transaction.atomic():
+        upcoming_ids = {
+            booking.resource_id for booking in candidates.values()
+            if booking.resource.approval_type == "AUTO_APPROVE" and (booking.booking_date, booking.start_time) > current_slot
+        }
+        resources = {
+            resource.id: resource
+            for resource in Resource.objects.select_for_update().filter(id__in=upcoming_ids).order_by("id")
+        }
+        # Re-read under the row locks; an approver may have decided some meanwhile
+        expired = list(
+            Booking.objects.select_for_update().filter(id__in=candidates, status="PENDING")
+            .order_by("id").values_list("id", flat=True)
+        )
+        if expired:
+            Booking.objects.filter(id__in=expired).update(status="EXPIRED", updated_at=now)
+            freed = defaultdict(set)
+            for booking_id in expired:
+                booking = candidates[booking_id]
+                if booking.resource_id in resources and (booking.booking_date, booking.start_time) > current_slot:
+                    freed[booking.resource_id].add((booking.booking_date, booking.start_time))
+            for resource_id, slots in freed.items():
+                promote_waitlist(resources[resource_id], slots)
+
+    if not expired:
+        return 0
+    BOOKINGS_EXPIRED.inc(len(expired))
+    invalidate_pending_counts(*(candidates[booking_id].approver_id for booking_id in expired))
+    logs = []
+    notifications = []
+    for booking_id in expired:
+        booking = candidates[booking_id]
+        logs.append(build_audit_log(
+            actor=None,
+            action="BOOKING_EXPIRED",
+            target_entity_type="booking",
+            target_entity_id=booking.id,
+            previous_state={"status": "PENDING"},
+            new_state={"status": "EXPIRED"}
+        ))
+        notifications.append(build_notification(
+            user=booking.user,
+            message_type="BOOKING_EXPIRED",
+            title="Booking Request Expired",
+            body=f"Your booking request for {booking.resource.name} on {booking.booking_date} {booking.start_time}-{booking.end_time} expired before it was reviewed.",
+            related_entity_type="booking",
+            related_entity_id=booking.id
+        ))
+    bulk_create_audit_logs(logs)
+    bulk_notify(notifications)
+    return len(expired)
+
+TERMINAL_STATUSES = ["REJECTED", "CANCELLED", "EXPIRED"]
+
+def archivable_bookings(older_than_days):
+    """
+    Bookings that belong in the archive: anything dated more than
+    `older_than_days` ago, plus rejected/cancelled/expired bookings whose
+    date has passed.
+    """
+    today = timezone.localdate()
+    cutoff = today - datetime.timedelta(days=older_than_days)
+    return Booking.objects.filter(
+        Q(booking_date__lt=cutoff) | Q(booking_date__lt=today, status__in=TERMINAL_STATUSES)
+    )
+
+def archive_batch(older_than_days, batch_size):
+    """
+    Moves up to `batch_size` archivable bookings, lowest ids first, into
+    bookings_archive in one transaction. Returns the number moved; 0 means
+    there is nothing left. A batch either moves completely or not at all,
+    so an interrupted run just picks up where it stopped.
+    """
+    with transaction.atomic():
+        ids = list(
+            archivable_bookings(older_than_days).select_for_update().order_by("id").values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            return 0
+        rows = Booking.objects.filter(id__in=ids).values(*BookingArchive.COPIED_FIELDS)
+        BookingArchive.objects.bulk_create([BookingArchive(**row) for row in rows], ignore_conflicts=True)
+        # Waitlist entries and holds that point at these bookings are kept, unlinked (SET_NULL)
+        Booking.objects.filter(id__in=ids).delete()
+    return len(ids)
@@ -0,0 +1,85 @@
+import datetime
+from unittest import mock
+
+from django.shortcuts import get_object_or_404
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.accounts.models import User
+from apps.resources.models import Resource
+from .models import Booking
+from .services import expire_pending_bookings
+
+class PendingExpiryRaceTests(TestCase):
+    """
+    Pending expiry can move a booking to EXPIRED (and give its seat away)
+    between a decision endpoint loading the booking and saving it.
+    """
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            "admin@example.com", "Admin@1234", name="Admin", role="ADMIN",
+            account_status="ACTIVE", approval_status="APPROVED"
+        )
+        cls.student = User.objects.create_user(
+            "student@example.com", "Student@1234", name="Student", role="STUDENT",
+            account_status="ACTIVE", approval_status="APPROVED"
+        )
+        cls.resource = Resource.objects.create(
+            name="Chemistry Lab", type="LAB", capacity=20, total_quantity=1, approval_type="ADMIN_APPROVE",
+            managed_by=cls.admin
+        )
+
+    def setUp(self):
+        # Already started, so the next sweep expires it
+        self.booking = Booking.objects.create(
+            user=self.student, resource=self.resource,
+            booking_date=timezone.localdate() - datetime.timedelta(days=1),
+            start_time=datetime.time(9), end_time=datetime.time(10), status="PENDING"
+        )
+
+    def client_for(self, user):
+        client = APIClient()
+        client.force_authenticate(user)
+        return client
+
+    def expire_after_load(self, *args, **kwargs):
+        # The view holds a stale PENDING copy while the sweep runs
+        booking = get_object_or_404(*args, **kwargs)
+        self.assertEqual(expire_pending_bookings(), 1)
+        return booking
+
+    def test_expired_booking_cannot_be_approved(self):
+        expire_pending_bookings()
+        response = self.client_for(self.admin).post(f"/api/v1/bookings/{self.booking.id}/approve/")
+        self.assertEqual(response.status_code, 400)
+        self.booking.refresh_from_db()
+        self.assertEqual(self.booking.status, "EXPIRED")
+
+    def test_approve_racing_expiry_keeps_expired(self):
+        with mock.patch("apps.bookings.views.get_object_or_404", self.expire_after_load):
+            response = self.client_for(self.admin).post(f"/api/v1/bookings/{self.booking.id}/approve/")
+        self.assertEqual(response.status_code, 400)
+        self.booking.refresh_from_db()
+        self.assertEqual(self.booking.status, "EXPIRED")
+        self.assertIsNone(self.booking.approved_by_id)
+
+    def test_reject_racing_expiry_keeps_expired(self):
+        with mock.patch("apps.bookings.views.get_object_or_404", self.expire_after_load):
+            response = self.client_for(self.admin).post(
+                f"/api/v1/bookings/{self.booking.id}/reject/", {"action": "reject", "rejection_reason": "Clash"}
+            )
+        self.assertEqual(response.status_code, 400)
+        self.booking.refresh_from_db()
+        self.assertEqual(self.booking.status, "EXPIRED")
+
+    def test_cancel_racing_expiry_keeps_expired(self):
+        with mock.patch("apps.bookings.views.get_object_or_404", self.expire_after_load):
+            response = self.client_for(self.student).post(
+                f"/api/v1/bookings/{self.booking.id}/cancel/", {"cancellation_reason": "Plans changed"}
+            )
+        self.assertEqual(response.status_code, 400)
+        self.booking.refresh_from_db()
+        self.assertEqual(self.booking.status, "EXPIRED")
+        self.assertIsNone(self.booking.cancelled_by_id)
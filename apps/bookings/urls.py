@@ -2,15 +2,32 @@ from django.urls import path
 from .views import (
     BookingCreateView, BookingListView, AdminBookingListView,
     PendingBookingsView, ApproveBookingView, RejectBookingView,
-    CancelBookingView
+    CancelBookingView, WaitlistListView, LeaveWaitlistView,
+    BookingHoldCreateView, BookingHoldDetailView, ConfirmBookingHoldView,
+    BulkBookingDecisionView, PendingBookingsCountView, BookingHistoryView,
+    BookingFeedURLView, BookingFeedView
 )
 
 urlpatterns = [
     path("bookings/", BookingListView.as_view(), name="my-bookings"),
+    path("bookings/history/", BookingHistoryView.as_view(), name="booking-history"),
     path("bookings/create/", BookingCreateView.as_view(), name="booking-create"),
     path("bookings/all/", AdminBookingListView.as_view(), name="all-bookings"),
     path("bookings/pending/", PendingBookingsView.as_view(), name="pending-bookings"),
+    path("bookings/pending/count/", PendingBookingsCountView.as_view(), name="pending-bookings-count"),
+    path("bookings/bulk-decision/", BulkBookingDecisionView.as_view(), name="bulk-booking-decision"),
     path("bookings/<int:pk>/approve/", ApproveBookingView.as_view(), name="approve-booking"),
     path("bookings/<int:pk>/reject/", RejectBookingView.as_view(), name="reject-booking"),
     path("bookings/<int:pk>/cancel/", CancelBookingView.as_view(), name="cancel-booking"),
+    path("bookings/waitlist/", WaitlistListView.as_view(), name="my-waitlist"),
+    path("bookings/waitlist/<int:pk>/leave/", LeaveWaitlistView.as_view(), name="leave-waitlist"),
+    path("bookings/holds/", BookingHoldCreateView.as_view(), name="booking-hold-create"),
+    path("bookings/holds/<str:token>/", BookingHoldDetailView.as_view(), name="booking-hold-detail"),
+    path("bookings/holds/<str:token>/confirm/", ConfirmBookingHoldView.as_view(), name="booking-hold-confirm"),
+
+    # Calendar feeds (token in the URL, for calendar apps)
+    path("bookings/feed/", BookingFeedURLView.as_view(), name="booking-feed-url"),
+    path("bookings/feed/<str:token>.ics", BookingFeedView.as_view(), name="booking-feed"),
+    path("resources/<int:pk>/feed/", BookingFeedURLView.as_view(), name="resource-booking-feed-url"),
+    path("resources/<int:pk>/feed/<str:token>.ics", BookingFeedView.as_view(), name="resource-booking-feed"),
 ]
@@ -2,24 +2,48 @@ from rest_framework import generics, views, status
 from rest_framework.permissions import IsAuthenticated
 from django.shortcuts import get_object_or_404
 from django.db import transaction
-from django.db.models import Sum, Q
+from django.db.models import Q
+from django.conf import settings
+from django.core.cache import cache
+from django.http import Http404, HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+from django.urls import reverse
 from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.views import View
 import datetime
+import heapq
+import secrets
 
 from .serializers import (
-    BookingSerializer, BookingCreateSerializer, BookingApprovalSerializer,
-    BookingCancelSerializer
+    booking_projection, BookingSerializer, BookingCreateSerializer, BookingApprovalSerializer,
+    BookingCancelSerializer, BookingWaitlistEntrySerializer, BookingHoldCreateSerializer,
+    BookingHoldSerializer, BookingHoldConfirmSerializer, BookingBulkDecisionSerializer,
+    BookingArchiveSerializer
 )
-from .models import Booking
-from apps.resources.models import Resource, CalendarOverride, ResourceWeeklySchedule
-from apps.notifications.services import create_notification, notify_admins, notify_faculty
+from .models import Booking, BookingArchive, BookingHold, BookingWaitlistEntry
+from .feeds import feed_bookings, feed_events, feed_token, feed_user
+from .services import (
+    announce_booking, decide_bookings, invalidate_pending_counts, pending_count, pending_inbox,
+    promote_waitlist, taken_quantity, waitlist_position, with_waitlist_positions, working_day_error
+)
+from apps.resources.models import Resource, ResourceArchive, ResourceWeeklySchedule
+from apps.notifications.services import create_notification, notify_faculty
 from apps.audit.models import create_audit_log
 from core.permissions import IsActiveAndApproved, IsAdmin, CanBook
 from core.response import success_response, error_response
+from core.conditional import make_etag, queryset_version, set_cache_headers
+from core.ical import render_calendar
+from core.instrumentation import timed
+from core.pagination import decode_cursor, encode_cursor
+from core.fieldsets import SparseFieldsetMixin
+from core.projections import ProjectionListMixin
+from core.metrics import BOOKINGS_CREATED, BOOKINGS_REJECTED, BOOKING_HOLDS, BOOKING_LOCK_WAIT
 
 class BookingCreateView(generics.CreateAPIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved, CanBook]
     serializer_class = BookingCreateSerializer
+    throttle_scope = "booking_create"
+    idempotent = True
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -31,6 +55,7 @@ class BookingCreateView(generics.CreateAPIView):
         quantity = serializer.validated_data['quantity_requested']
         is_special = serializer.validated_data['is_special_request']
         reason = serializer.validated_data.get('special_request_reason')
+        join_waitlist = serializer.validated_data['join_waitlist']
 
         # Resource verification
         resource = get_object_or_404(Resource, pk=resource_id)
@@ -45,20 +70,9 @@ class BookingCreateView(generics.CreateAPIView):
         end_time = end_dt.time()
         
         # Working day verification
-        is_working = False
-        override = CalendarOverride.objects.filter(override_date=booking_date).first()
-        
-        if override:
-            if override.override_type == "WORKING_DAY":
-                is_working = True
-            elif override.override_type == "HOLIDAY" and not is_special:
-                 return error_response(message="Cannot book on a non-working day. Submit a special request instead.", status_code=400)
-        else:
-            schedule = resource.weekly_schedules.filter(day_of_week=booking_date.weekday()).first()
-            if schedule and schedule.is_working:
-                is_working = True
-            elif not is_special:
-                 return error_response(message="Cannot book on a non-working day. Submit a special request instead.", status_code=400)
+        day_error = working_day_error(resource, booking_date, is_special)
+        if day_error:
+             return error_response(message=day_error, status_code=400)
                  
         if is_special and not reason:
              return error_response(message="Special request reason is required.", status_code=400)
@@ -69,17 +83,45 @@ class BookingCreateView(generics.CreateAPIView):
             # Locking resource is safer/simpler to serialize checks on this resource)
             # But we are aggregating from Booking table.
             # Best is to select_for_update on Resource to serialize all bookings for it.
-            resource_locked = Resource.objects.select_for_update().get(pk=resource.pk)
+            with BOOKING_LOCK_WAIT.time():
+                resource_locked = Resource.objects.select_for_update().get(pk=resource.pk)
             
-            booked_qty = Booking.objects.filter(
-                resource=resource_locked,
-                booking_date=booking_date,
-                start_time=start_time,
-                status__in=["PENDING", "APPROVED"]
-            ).aggregate(total=Sum("quantity_requested"))["total"] or 0
+            # Unexpired holds reserve seats just like bookings do
+            booked_qty = taken_quantity(resource_locked, booking_date, start_time)
             
             if booked_qty + quantity > resource_locked.total_quantity:
-                 return error_response(message="Insufficient availability for the requested slot.", status_code=409)
+                 BOOKINGS_REJECTED.labels(reason="insufficient_capacity").inc()
+                 if not join_waitlist or quantity > resource_locked.total_quantity:
+                     return error_response(message="Insufficient availability for the requested slot.", status_code=409)
+                 if BookingWaitlistEntry.objects.filter(
+                     user=request.user, resource=resource_locked, booking_date=booking_date,
+                     start_time=start_time, status="WAITING"
+                 ).exists():
+                     return error_response(message="You are already on the waitlist for this slot.", status_code=409)
+
+                 entry = BookingWaitlistEntry.objects.create(
+                     user=request.user,
+                     resource=resource_locked,
+                     booking_date=booking_date,
+                     start_time=start_time,
+                     end_time=end_time,
+                     quantity_requested=quantity,
+                     is_special_request=is_special,
+                     special_request_reason=reason
+                 )
+                 create_audit_log(
+                     actor=request.user,
+                     action="BOOKING_WAITLISTED",
+                     target_entity_type="booking_waitlist",
+                     target_entity_id=entry.id,
+                     metadata={"position": waitlist_position(entry)},
+                     ip_address=getattr(request, 'audit_ip', None)
+                 )
+                 return success_response(
+                     BookingWaitlistEntrySerializer(entry).data,
+                     message="Slot is full. You have been added to the waitlist.",
+                     status_code=status.HTTP_202_ACCEPTED
+                 )
 
             # Determine initial status
             status_val = "PENDING"
@@ -107,44 +149,21 @@ class BookingCreateView(generics.CreateAPIView):
                 approved_by=approved_by,
                 approved_at=approved_at
             )
+        BOOKINGS_CREATED.labels(status=status_val).inc()
             
+        with timed("serializer"):
+            booking_data = BookingSerializer(booking).data
+
         # Post-transaction: Notifications & Audit
-        create_audit_log(
-            actor=request.user,
-            action="BOOKING_CREATED",
-            target_entity_type="booking",
-            target_entity_id=booking.id,
-            new_state=BookingSerializer(booking).data,
-            ip_address=getattr(request, 'audit_ip', None)
-        )
-        
-        if status_val == "APPROVED":
-            create_notification(
-                user=request.user,
-                message_type="BOOKING_APPROVED",
-                title="Booking Approved",
-                body=f"Your booking for {resource.name} on {booking_date} has been auto-approved."
-            )
-        else:
-            # Notify approver
-            title = "New Booking Request"
-            body = f"User {request.user.name} requested {resource.name} on {booking_date}."
-            if resource.approval_type == "STAFF_APPROVE":
-                # Notify manager
-                create_notification(
-                    user=resource.managed_by,
-                    message_type="GENERAL", # Or specific type for request
-                    title=title,
-                    body=body
-                )
-            elif resource.approval_type == "ADMIN_APPROVE":
-                notify_admins("GENERAL", title, body)
+        announce_booking(booking, booking_data, request.user, getattr(request, 'audit_ip', None))
                 
-        return success_response(BookingSerializer(booking).data, status_code=status.HTTP_201_CREATED)
+        return success_response(booking_data, status_code=status.HTTP_201_CREATED)
 
-class BookingListView(generics.ListAPIView):
+class BookingListView(SparseFieldsetMixin, ProjectionListMixin, generics.ListAPIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved] # CanBook implied by being authenticated? No, admins can view too.
     serializer_class = BookingSerializer
+    projection = booking_projection
+    query_budget = 3
 
     def get_queryset(self):
         return Booking.objects.filter(
@@ -153,18 +172,69 @@ class BookingListView(generics.ListAPIView):
             status__in=["PENDING", "APPROVED"]
         ).order_by("booking_date", "start_time")
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        serializer = self.get_serializer(queryset, many=True)
-        return success_response(serializer.data)
+class BookingHistoryView(views.APIView):
+    """
+    The user's bookings from both `bookings` and `bookings_archive`, newest
+    first, with keyset pagination (?cursor=). Each page is one index range
+    read per table merged in Python, so deep pages cost the same as the first.
+    """
+    permission_classes = [IsAuthenticated, IsActiveAndApproved]
+    page_size = 20
+    max_page_size = 100
+    query_budget = 4
+
+    def get(self, request):
+        try:
+            page_size = min(int(request.query_params.get('page_size', self.page_size)), self.max_page_size)
+        except ValueError:
+             return error_response(message="page_size must be an integer.", status_code=400)
+        if page_size < 1:
+             return error_response(message="page_size must be positive.", status_code=400)
+
+        hot = Booking.objects.filter(user=request.user)
+        cold = BookingArchive.objects.filter(user=request.user)
+        cursor = request.query_params.get('cursor')
+        if cursor:
+            try:
+                booking_date, booking_id = decode_cursor(cursor)
+                after = Q(booking_date__lt=datetime.date.fromisoformat(booking_date)) | Q(
+                    booking_date=datetime.date.fromisoformat(booking_date), id__lt=int(booking_id)
+                )
+            except (TypeError, ValueError):
+                 return error_response(message="Invalid cursor.", status_code=400)
+            hot, cold = hot.filter(after), cold.filter(after)
+
+        ordering = ("-booking_date", "-id")
+        hot = hot.select_related("user", "resource").order_by(*ordering)[:page_size + 1]
+        cold = cold.select_related("user", "resource").order_by(*ordering)[:page_size + 1]
+        rows = list(heapq.merge(hot, cold, key=lambda booking: (booking.booking_date, booking.id), reverse=True))
+        page = rows[:page_size]
+        # Archived bookings may point at resources compacted into resources_archive
+        compacted = {
+            booking.resource_id for booking in page
+            if isinstance(booking, BookingArchive) and booking.resource is None
+        }
+        archived_resources = ResourceArchive.objects.in_bulk(compacted) if compacted else {}
+
+        with timed("serializer"):
+            results = [
+                {**BookingArchiveSerializer(booking, context={"archived_resources": archived_resources}).data, "archived": True}
+                if isinstance(booking, BookingArchive) else
+                {**BookingSerializer(booking).data, "archived": False}
+                for booking in page
+            ]
 
-class AdminBookingListView(generics.ListAPIView):
+        next_cursor = None
+        if len(rows) > page_size:
+            last = page[-1]
+            next_cursor = encode_cursor([last.booking_date.isoformat(), last.id])
+        return success_response({"next_cursor": next_cursor, "results": results})
+
+class AdminBookingListView(SparseFieldsetMixin, ProjectionListMixin, generics.ListAPIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved, IsAdmin]
     serializer_class = BookingSerializer
+    projection = booking_projection
+    query_budget = 3
 
     def get_queryset(self):
         queryset = Booking.objects.all()
@@ -191,49 +261,34 @@ class AdminBookingListView(generics.ListAPIView):
 
         return queryset.order_by("-booking_date")
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        serializer = self.get_serializer(queryset, many=True)
-        return success_response(serializer.data)
-
-class PendingBookingsView(generics.ListAPIView):
+class PendingBookingsView(SparseFieldsetMixin, ProjectionListMixin, generics.ListAPIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved]
     serializer_class = BookingSerializer
+    projection = booking_projection
+    query_budget = 3
 
     def get_queryset(self):
-        user = self.request.user
-        if user.role == "ADMIN":
-            return Booking.objects.filter(status="PENDING")
-        elif user.role == "STAFF":
-            return Booking.objects.filter(
-                status="PENDING",
-                resource__managed_by=user,
-                resource__approval_type="STAFF_APPROVE"
-            )
-        else:
-            return Booking.objects.none()
+        return pending_inbox(self.request.user)
             
     def list(self, request, *args, **kwargs):
         if request.user.role not in ["ADMIN", "STAFF"]:
              return error_response(message="Permission denied.", status_code=403)
-             
-        queryset = self.filter_queryset(self.get_queryset())
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        serializer = self.get_serializer(queryset, many=True)
-        return success_response(serializer.data)
+        return super().list(request, *args, **kwargs)
+
+class PendingBookingsCountView(views.APIView):
+    permission_classes = [IsAuthenticated, IsActiveAndApproved]
+
+    def get(self, request):
+        if request.user.role not in ["ADMIN", "STAFF"]:
+             return error_response(message="Permission denied.", status_code=403)
+        return success_response({"count": pending_count(request.user)})
 
 class ApproveBookingView(views.APIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved]
+    idempotent = True
 
     def post(self, request, pk):
-        booking = get_object_or_404(Booking, pk=pk)
+        booking = get_object_or_404(Booking.objects.select_related("resource", "user"), pk=pk)
         
         if booking.status != "PENDING":
              return error_response(message="Only pending bookings can be approved.", status_code=400)
@@ -245,23 +300,37 @@ class ApproveBookingView(views.APIView):
              return error_response(message="Auto-approved resources do not require manual approval.", status_code=400)
              
         if resource.approval_type == "STAFF_APPROVE":
-            if resource.managed_by != request.user:
+            if resource.managed_by_id != request.user.id:
                  return error_response(message="Only the resource manager can approve this.", status_code=403)
         
         if resource.approval_type == "ADMIN_APPROVE":
              if request.user.role != "ADMIN":
                  return error_response(message="Only admins can approve this.", status_code=403)
 
-        booking.status = "APPROVED"
-        booking.approved_by = request.user
-        booking.approved_at = timezone.now()
-        booking.save()
+        with transaction.atomic():
+            # Lock and re-read like decide_bookings: pending expiry may have
+            # expired the booking and handed its seat on since it was loaded
+            Resource.objects.select_for_update().get(pk=resource.pk)
+            booking = (
+                Booking.objects.select_for_update(of=("self",)).select_related("resource", "user")
+                .filter(pk=pk, status="PENDING").first()
+            )
+            if booking is None:
+                 return error_response(message="Booking was updated by someone else.", status_code=400)
+            booking.status = "APPROVED"
+            booking.approved_by = request.user
+            booking.approved_at = timezone.now()
+            previous_state, new_state = booking.state_diff()
+            booking.save()
+            invalidate_pending_counts(booking.approver_id)
         
         create_audit_log(
             actor=request.user,
             action="BOOKING_APPROVED",
             target_entity_type="booking",
             target_entity_id=booking.id,
+            previous_state=previous_state,
+            new_state=new_state,
             ip_address=getattr(request, 'audit_ip', None)
         )
         
@@ -276,9 +345,10 @@ class ApproveBookingView(views.APIView):
 
 class RejectBookingView(views.APIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved]
+    idempotent = True
 
     def post(self, request, pk):
-        booking = get_object_or_404(Booking, pk=pk)
+        booking = get_object_or_404(Booking.objects.select_related("resource", "user"), pk=pk)
         
         if booking.status != "PENDING":
              return error_response(message="Only pending bookings can be rejected.", status_code=400)
@@ -287,7 +357,7 @@ class RejectBookingView(views.APIView):
         
         # Auth check (same as approve)
         if resource.approval_type == "STAFF_APPROVE":
-            if resource.managed_by != request.user:
+            if resource.managed_by_id != request.user.id:
                  return error_response(message="Only the resource manager can reject this.", status_code=403)
         if resource.approval_type == "ADMIN_APPROVE":
              if request.user.role != "ADMIN":
@@ -299,16 +369,33 @@ class RejectBookingView(views.APIView):
         if serializer.validated_data['action'] != 'reject':
              return error_response(message="Invalid action.", status_code=400)
 
-        booking.status = "REJECTED"
-        booking.rejected_by = request.user
-        booking.rejection_reason = serializer.validated_data.get('rejection_reason')
-        booking.save()
+        with transaction.atomic():
+            resource = Resource.objects.select_for_update().get(pk=resource.pk)
+            # Re-read under the lock; it may have been decided or expired since
+            booking = (
+                Booking.objects.select_for_update(of=("self",)).select_related("user")
+                .filter(pk=pk, status="PENDING").first()
+            )
+            if booking is None:
+                 return error_response(message="Booking was updated by someone else.", status_code=400)
+            booking.status = "REJECTED"
+            booking.rejected_by = request.user
+            booking.rejection_reason = serializer.validated_data.get('rejection_reason')
+            previous_state, new_state = booking.state_diff()
+            booking.save()
+            invalidate_pending_counts(booking.approver_id)
+            promote_waitlist(
+                resource, [(booking.booking_date, booking.start_time)],
+                actor=request.user, ip_address=getattr(request, 'audit_ip', None)
+            )
         
         create_audit_log(
             actor=request.user,
             action="BOOKING_REJECTED",
             target_entity_type="booking",
             target_entity_id=booking.id,
+            previous_state=previous_state,
+            new_state=new_state,
             ip_address=getattr(request, 'audit_ip', None)
         )
         
@@ -321,36 +408,82 @@ class RejectBookingView(views.APIView):
         
         return success_response(message="Booking rejected.")
 
+class BulkBookingDecisionView(views.APIView):
+    """
+    Approves or rejects a list of pending bookings in one request. Each id is
+    checked with the same rules as the single approve/reject endpoints and
+    reported on separately; ids that fail don't block the rest.
+    """
+    permission_classes = [IsAuthenticated, IsActiveAndApproved]
+    idempotent = True
+
+    def post(self, request):
+        if request.user.role not in ["ADMIN", "STAFF"]:
+             return error_response(message="Permission denied.", status_code=403)
+
+        serializer = BookingBulkDecisionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        results = decide_bookings(
+            request.user,
+            serializer.validated_data['booking_ids'],
+            serializer.validated_data['action'],
+            rejection_reason=serializer.validated_data.get('rejection_reason'),
+            ip_address=getattr(request, 'audit_ip', None)
+        )
+        processed = sum(1 for result in results if result["success"])
+        return success_response(
+            {"processed": processed, "failed": len(results) - processed, "results": results},
+            message=f"{processed} of {len(results)} booking(s) updated."
+        )
+
 class CancelBookingView(views.APIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved]
+    idempotent = True
 
     def post(self, request, pk):
-        booking = get_object_or_404(Booking, pk=pk)
+        booking = get_object_or_404(Booking.objects.select_related("resource", "user"), pk=pk)
         
-        if booking.status in ["CANCELLED", "REJECTED"]:
+        if booking.status in ["CANCELLED", "REJECTED", "EXPIRED"]:
              return error_response(message="This booking cannot be cancelled.", status_code=400)
              
         # Auth check
-        if not (booking.user == request.user or request.user.role == "ADMIN"):
+        if not (booking.user_id == request.user.id or request.user.role == "ADMIN"):
              return error_response(message="Permission denied.", status_code=403)
              
         serializer = BookingCancelSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
-        previous_status = booking.status
-        booking.status = "CANCELLED"
-        booking.cancellation_reason = serializer.validated_data['cancellation_reason']
-        booking.cancelled_by = request.user
-        booking.cancelled_at = timezone.now()
-        booking.save()
+        with transaction.atomic():
+            resource = Resource.objects.select_for_update().get(pk=booking.resource_id)
+            # Re-read under the lock so a concurrent cancel or expiry can't be overwritten
+            booking = (
+                Booking.objects.select_for_update(of=("self",)).select_related("user")
+                .filter(pk=pk).exclude(status__in=["CANCELLED", "REJECTED", "EXPIRED"]).first()
+            )
+            if booking is None:
+                 return error_response(message="This booking cannot be cancelled.", status_code=400)
+            previous_status = booking.status
+            booking.status = "CANCELLED"
+            booking.cancellation_reason = serializer.validated_data['cancellation_reason']
+            booking.cancelled_by = request.user
+            booking.cancelled_at = timezone.now()
+            previous_state, new_state = booking.state_diff()
+            booking.save()
+            if previous_status == "PENDING":
+                invalidate_pending_counts(booking.approver_id)
+            promote_waitlist(
+                resource, [(booking.booking_date, booking.start_time)],
+                actor=request.user, ip_address=getattr(request, 'audit_ip', None)
+            )
         
         create_audit_log(
             actor=request.user,
             action="BOOKING_CANCELLED",
             target_entity_type="booking",
             target_entity_id=booking.id,
-            previous_state={"status": previous_status},
-            new_state={"status": "CANCELLED"},
+            previous_state=previous_state,
+            new_state=new_state,
             metadata={"reason": booking.cancellation_reason},
             ip_address=getattr(request, 'audit_ip', None)
         )
@@ -359,7 +492,258 @@ class CancelBookingView(views.APIView):
             user=booking.user,
             message_type="BOOKING_CANCELLED",
             title="Booking Cancelled",
-            body=f"Booking for {booking.resource.name} on {booking.booking_date} cancelled. Reason: {booking.cancellation_reason}"
+            body=f"Booking for {resource.name} on {booking.booking_date} cancelled. Reason: {booking.cancellation_reason}"
         )
         
         return success_response(message="Booking cancelled.")
+
+class WaitlistListView(generics.ListAPIView):
+    permission_classes = [IsAuthenticated, IsActiveAndApproved]
+    serializer_class = BookingWaitlistEntrySerializer
+    query_budget = 3
+
+    def get_queryset(self):
+        queryset = BookingWaitlistEntry.objects.filter(
+            user=self.request.user,
+            status="WAITING",
+            booking_date__gte=timezone.localdate()
+        ).select_related("resource").order_by("booking_date", "start_time")
+        return with_waitlist_positions(queryset)
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        serializer = self.get_serializer(queryset, many=True)
+        return success_response(serializer.data)
+
+class LeaveWaitlistView(views.APIView):
+    permission_classes = [IsAuthenticated, IsActiveAndApproved]
+    idempotent = True
+
+    def post(self, request, pk):
+        entry = get_object_or_404(BookingWaitlistEntry, pk=pk)
+
+        if entry.user != request.user:
+             return error_response(message="Permission denied.", status_code=403)
+        if entry.status != "WAITING":
+             return error_response(message="This waitlist entry is no longer waiting.", status_code=400)
+
+        entry.status = "CANCELLED"
+        entry.save(update_fields=["status"])
+
+        create_audit_log(
+            actor=request.user,
+            action="BOOKING_WAITLIST_LEFT",
+            target_entity_type="booking_waitlist",
+            target_entity_id=entry.id,
+            ip_address=getattr(request, 'audit_ip', None)
+        )
+
+        return success_response(message="Removed from the waitlist.")
+
+class BookingHoldCreateView(generics.CreateAPIView):
+    """
+    Reserves seats on a slot for BOOKING_HOLD_SECONDS while the user finishes
+    the booking form. The capacity check and lock happen here, once; confirming
+    the hold later doesn't repeat them.
+    """
+    permission_classes = [IsAuthenticated, IsActiveAndApproved, CanBook]
+    serializer_class = BookingHoldCreateSerializer
+    throttle_scope = "booking_create"
+    idempotent = True
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        resource_id = serializer.validated_data['resource_id']
+        booking_date = serializer.validated_data['booking_date']
+        start_time = serializer.validated_data['start_time']
+        quantity = serializer.validated_data['quantity']
+        is_special = serializer.validated_data['is_special_request']
+
+        resource = get_object_or_404(Resource, pk=resource_id)
+        if resource.is_deleted or resource.resource_status != "AVAILABLE":
+             return error_response(message="Resource is not available.", status_code=400)
+
+        day_error = working_day_error(resource, booking_date, is_special)
+        if day_error:
+             return error_response(message=day_error, status_code=400)
+
+        end_time = (datetime.datetime.combine(booking_date, start_time) + datetime.timedelta(hours=1)).time()
+
+        with transaction.atomic():
+            with BOOKING_LOCK_WAIT.time():
+                resource_locked = Resource.objects.select_for_update().get(pk=resource.pk)
+
+            # Re-holding the same slot replaces the user's previous hold
+            BookingHold.objects.filter(
+                user=request.user, resource=resource_locked, booking_date=booking_date,
+                start_time=start_time, status="ACTIVE"
+            ).update(status="RELEASED")
+
+            if taken_quantity(resource_locked, booking_date, start_time) + quantity > resource_locked.total_quantity:
+                BOOKING_HOLDS.labels(outcome="refused").inc()
+                return error_response(message="Insufficient availability for the requested slot.", status_code=409)
+
+            hold = BookingHold.objects.create(
+                token=secrets.token_urlsafe(32),
+                user=request.user,
+                resource=resource_locked,
+                booking_date=booking_date,
+                start_time=start_time,
+                end_time=end_time,
+                quantity=quantity,
+                is_special_request=is_special,
+                expires_at=timezone.now() + datetime.timedelta(seconds=settings.BOOKING_HOLD_SECONDS)
+            )
+        BOOKING_HOLDS.labels(outcome="created").inc()
+
+        return success_response(
+            BookingHoldSerializer(hold).data,
+            message="Slot held.",
+            status_code=status.HTTP_201_CREATED
+        )
+
+class BookingHoldDetailView(views.APIView):
+    permission_classes = [IsAuthenticated, IsActiveAndApproved]
+    idempotent = True
+
+    def get(self, request, token):
+        hold = get_object_or_404(BookingHold.objects.select_related("resource"), token=token, user=request.user)
+        return success_response(BookingHoldSerializer(hold).data)
+
+    def delete(self, request, token):
+        released = BookingHold.objects.filter(
+            token=token, user=request.user, status="ACTIVE"
+        ).update(status="RELEASED")
+        if not released:
+             return error_response(message="This hold is no longer active.", status_code=404)
+        BOOKING_HOLDS.labels(outcome="released").inc()
+        return success_response(message="Hold released.")
+
+class ConfirmBookingHoldView(views.APIView):
+    """
+    Turns an unexpired hold into a booking. The seats were reserved when the
+    hold was taken, so this is a conditional update on the hold row rather
+    than another resource lock and capacity sum.
+    """
+    permission_classes = [IsAuthenticated, IsActiveAndApproved, CanBook]
+    throttle_scope = "booking_create"
+    idempotent = True
+
+    def post(self, request, token):
+        serializer = BookingHoldConfirmSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        reason = serializer.validated_data.get('special_request_reason')
+
+        hold = get_object_or_404(BookingHold.objects.select_related("resource"), token=token, user=request.user)
+        if hold.is_special_request and not reason:
+             return error_response(message="Special request reason is required.", status_code=400)
+
+        resource = hold.resource
+        if resource.is_deleted or resource.resource_status != "AVAILABLE":
+             return error_response(message="Resource is not available.", status_code=400)
+
+        now = timezone.now()
+        auto_approve = resource.approval_type == "AUTO_APPROVE"
+        status_val = "APPROVED" if auto_approve else "PENDING"
+        with transaction.atomic():
+            claimed = BookingHold.objects.filter(
+                pk=hold.pk, status="ACTIVE", expires_at__gt=now
+            ).update(status="CONFIRMED")
+            if not claimed:
+                 return error_response(message="This hold has expired or was already used.", status_code=410)
+
+            booking = Booking.objects.create(
+                user=request.user,
+                resource=resource,
+                booking_date=hold.booking_date,
+                start_time=hold.start_time,
+                end_time=hold.end_time,
+                quantity_requested=hold.quantity,
+                status=status_val,
+                is_special_request=hold.is_special_request,
+                special_request_reason=reason if hold.is_special_request else None,
+                approved_by=request.user if auto_approve else None,
+                approved_at=now if auto_approve else None
+            )
+            BookingHold.objects.filter(pk=hold.pk).update(booking=booking)
+        BOOKINGS_CREATED.labels(status=status_val).inc()
+        BOOKING_HOLDS.labels(outcome="confirmed").inc()
+
+        with timed("serializer"):
+            booking_data = BookingSerializer(booking).data
+
+        announce_booking(booking, booking_data, request.user, getattr(request, 'audit_ip', None))
+
+        return success_response(booking_data, status_code=status.HTTP_201_CREATED)
+
+class BookingFeedURLView(views.APIView):
+    """
+    The subscription URL of the user's booking feed, or of a resource's
+    schedule feed when `pk` is given.
+    """
+    permission_classes = [IsAuthenticated, IsActiveAndApproved]
+
+    def get(self, request, pk=None):
+        if pk is None:
+            path = reverse("booking-feed", args=[feed_token(request.user)])
+        else:
+            get_object_or_404(Resource, pk=pk)
+            path = reverse("resource-booking-feed", args=[pk, feed_token(request.user, pk)])
+        return success_response({"url": request.build_absolute_uri(path)})
+
+class BookingFeedView(View):
+    """
+    iCalendar feed for calendar apps, authenticated by the signed token in
+    the URL. The ETag comes from one aggregate over the feed's bookings, so
+    a poll with nothing new is answered 304 without rendering. Rendered
+    feeds are cached under that version and streamed the first time.
+    """
+    query_budget = 4
+
+    def get(self, request, token, pk=None):
+        user = feed_user(token, pk)
+        if user is None:
+            raise Http404
+        if pk is None:
+            name = f"{user.name}: bookings"
+        else:
+            name = Resource.objects.filter(pk=pk).values_list("name", flat=True).first()
+            if name is None:
+                raise Http404
+
+        bookings = feed_bookings(user, pk)
+        # The window moves daily, and resource renames change every event
+        version = queryset_version(bookings, "updated_at", "resource__updated_at") + [timezone.localdate()]
+        etag = make_etag(request, version)
+        response = get_conditional_response(request, etag=etag)
+        if response is not None:
+            if isinstance(response, HttpResponseNotModified):
+                set_cache_headers(response, etag)
+            return response
+
+        cache_key = f"booking-feed:{etag}"
+        body = cache.get(cache_key)
+        if body is not None:
+            response = HttpResponse(body, content_type="text/calendar; charset=utf-8")
+        else:
+            events = feed_events(bookings, request.get_host(), show_resource=pk is None)
+            response = StreamingHttpResponse(
+                self.stream(render_calendar(name, events), cache_key), content_type="text/calendar; charset=utf-8"
+            )
+        response["Content-Disposition"] = 'inline; filename="bookings.ics"'
+        return set_cache_headers(response, etag)
+
+    def stream(self, lines, cache_key):
+        # Cache the feed once it has been sent in full
+        rendered = []
+        for line in lines:
+            chunk = line.encode()
+            rendered.append(chunk)
+            yield chunk
+        cache.set(cache_key, b"".join(rendered), settings.BOOKING_FEED_CACHE_SECONDS)
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import UserNotification
+from .models import NotificationSummary, UserNotification
 
 class UserNotificationAdmin(admin.ModelAdmin):
     list_display = ('user', 'message_type', 'title', 'is_read', 'created_at')
@@ -8,3 +8,11 @@ class UserNotificationAdmin(admin.ModelAdmin):
     readonly_fields = ('created_at',)
 
 admin.site.register(UserNotification, UserNotificationAdmin)
+
+class NotificationSummaryAdmin(admin.ModelAdmin):
+    list_display = ('user', 'message_type', 'purged_count', 'unread_count', 'last_created_at')
+    list_filter = ('message_type',)
+    search_fields = ('user__email',)
+    readonly_fields = ('updated_at',)
+
+admin.site.register(NotificationSummary, NotificationSummaryAdmin)
@@ -0,0 +1,12 @@
+from django.conf import settings
+
+from .services import purge_notifications_batch
+from core.jobs import job
+
+@job("notifications.purge", schedule="45 3 * * *")
+def purge_notifications_job(batch_size=1000, max_batches=500):
+    last_id = 0
+    for _ in range(max_batches):
+        _, last_id = purge_notifications_batch(last_id, batch_size, settings.NOTIFICATION_RETENTION_SUMMARIZE)
+        if last_id is None:
+            break
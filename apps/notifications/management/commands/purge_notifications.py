@@ -0,0 +1,42 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.notifications.services import purge_notifications_batch, retention_report
+
+class Command(BaseCommand):
+    help = (
+        'Deletes notifications past NOTIFICATION_RETENTION_DAYS in primary-key batches, '
+        'optionally tallying them into notification_summaries first.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--sleep', type=float, default=0.0, help='Seconds to pause between batches.')
+        parser.add_argument('--summarize', action='store_true', default=settings.NOTIFICATION_RETENTION_SUMMARIZE,
+                            help='Roll purged rows into per-user summaries (default: NOTIFICATION_RETENTION_SUMMARIZE).')
+        parser.add_argument('--no-summarize', action='store_false', dest='summarize')
+        parser.add_argument('--dry-run', action='store_true', help='Only report what would be deleted.')
+
+    def handle(self, *args, **options):
+        if options['dry_run']:
+            rows = retention_report()
+            for row in rows:
+                state = "read" if row['is_read'] else "unread"
+                self.stdout.write(f"  {row['message_type']:<24} {state:<7} {row['count']}")
+            self.stdout.write(f"{sum(row['count'] for row in rows)} notification(s) would be deleted.")
+            return
+
+        total = batches = 0
+        last_id = 0
+        while True:
+            deleted, last_id = purge_notifications_batch(last_id, options['batch_size'], options['summarize'])
+            if last_id is None:
+                break
+            total += deleted
+            batches += 1
+            if options['sleep']:
+                time.sleep(options['sleep'])
+
+        self.stdout.write(self.style.SUCCESS(f"Deleted {total} notification(s) in {batches} batch(es)."))
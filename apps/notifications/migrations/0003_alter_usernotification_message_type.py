@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-19 01:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0002_alter_usernotification_message_type"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="usernotification",
+            name="message_type",
+            field=models.CharField(choices=[("BOOKING_APPROVED", "Booking Approved"), ("BOOKING_REJECTED", "Booking Rejected"), ("BOOKING_CANCELLED", "Booking Cancelled"), ("BOOKING_AUTO_CANCELLED", "Booking Auto Cancelled"), ("BOOKING_EXPIRED", "Booking Expired"), ("WAITLIST_PROMOTED", "Waitlist Promoted"), ("REGISTRATION_APPROVED", "Registration Approved"), ("REGISTRATION_REJECTED", "Registration Rejected"), ("ROLE_CHANGE_APPROVED", "Role Change Approved"), ("ROLE_CHANGE_REJECTED", "Role Change Rejected"), ("GENERAL", "General")], max_length=30),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 6.0.2 on 2026-10-19 01:23
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0003_alter_usernotification_message_type"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NotificationSummary",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("message_type", models.CharField(choices=[("BOOKING_APPROVED", "Booking Approved"), ("BOOKING_REJECTED", "Booking Rejected"), ("BOOKING_CANCELLED", "Booking Cancelled"), ("BOOKING_AUTO_CANCELLED", "Booking Auto Cancelled"), ("BOOKING_EXPIRED", "Booking Expired"), ("WAITLIST_PROMOTED", "Waitlist Promoted"), ("REGISTRATION_APPROVED", "Registration Approved"), ("REGISTRATION_REJECTED", "Registration Rejected"), ("ROLE_CHANGE_APPROVED", "Role Change Approved"), ("ROLE_CHANGE_REJECTED", "Role Change Rejected"), ("GENERAL", "General")], max_length=30)),
+                ("purged_count", models.PositiveIntegerField(default=0)),
+                ("unread_count", models.PositiveIntegerField(default=0)),
+                ("first_created_at", models.DateTimeField()),
+                ("last_created_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("user", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="notification_summaries", to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                "db_table": "notification_summaries",
+                "constraints": [models.UniqueConstraint(fields=("user", "message_type"), name="unique_notification_summary")],
+            },
+        ),
+    ]
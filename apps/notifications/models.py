@@ -1,12 +1,15 @@
 from django.db import models
 from apps.accounts.models import User
+from core.mixins import DirtyFieldsMixin
 
-class UserNotification(models.Model):
+class UserNotification(DirtyFieldsMixin, models.Model):
     MESSAGE_TYPE_CHOICES = (
         ('BOOKING_APPROVED', 'Booking Approved'),
         ('BOOKING_REJECTED', 'Booking Rejected'),
         ('BOOKING_CANCELLED', 'Booking Cancelled'),
         ('BOOKING_AUTO_CANCELLED', 'Booking Auto Cancelled'),
+        ('BOOKING_EXPIRED', 'Booking Expired'),
+        ('WAITLIST_PROMOTED', 'Waitlist Promoted'),
         ('REGISTRATION_APPROVED', 'Registration Approved'),
         ('REGISTRATION_REJECTED', 'Registration Rejected'),
         ('ROLE_CHANGE_APPROVED', 'Role Change Approved'),
@@ -35,3 +38,26 @@ class UserNotification(models.Model):
 
     def __str__(self):
         return f"{self.user.email} - {self.title}"
+
+class NotificationSummary(models.Model):
+    """
+    Per-user, per-type tally of notifications removed by the retention
+    purge, so totals survive after the rows are gone.
+    """
+    id = models.BigAutoField(primary_key=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='notification_summaries')
+    message_type = models.CharField(max_length=30, choices=UserNotification.MESSAGE_TYPE_CHOICES)
+    purged_count = models.PositiveIntegerField(default=0)
+    unread_count = models.PositiveIntegerField(default=0)
+    first_created_at = models.DateTimeField()
+    last_created_at = models.DateTimeField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'notification_summaries'
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'message_type'], name='unique_notification_summary'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} - {self.message_type} ({self.purged_count})"
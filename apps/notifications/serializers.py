@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from .models import UserNotification
+from core.projections import Projection
 
 class NotificationSerializer(serializers.ModelSerializer):
     class Meta:
@@ -10,3 +11,5 @@ class NotificationSerializer(serializers.ModelSerializer):
             'is_read', 'is_email_sent', 'created_at'
         ]
         read_only_fields = fields
+
+notification_projection = Projection(NotificationSerializer)
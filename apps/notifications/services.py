@@ -1,18 +1,27 @@
-from apps.notifications.models import UserNotification
+import datetime
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Max, Min, Q
+from django.utils import timezone
+
+from apps.notifications.models import NotificationSummary, UserNotification
 from apps.accounts.models import User
+from core.metrics import NOTIFICATIONS_PURGED, NOTIFICATION_WRITE
 
 def create_notification(user, message_type, title, body, related_entity_type=None, related_entity_id=None):
     """
     Creates a notification for a specific user.
     """
-    return UserNotification.objects.create(
-        user=user,
-        message_type=message_type,
-        title=title,
-        body=body,
-        related_entity_type=related_entity_type,
-        related_entity_id=related_entity_id
-    )
+    with NOTIFICATION_WRITE.labels(kind="single").time():
+        return UserNotification.objects.create(
+            user=user,
+            message_type=message_type,
+            title=title,
+            body=body,
+            related_entity_type=related_entity_type,
+            related_entity_id=related_entity_id
+        )
 
 def notify_admins(message_type, title, body, related_entity_type=None, related_entity_id=None):
     """
@@ -31,7 +40,8 @@ def notify_admins(message_type, title, body, related_entity_type=None, related_e
         ))
     
     if notifications:
-        UserNotification.objects.bulk_create(notifications)
+        with NOTIFICATION_WRITE.labels(kind="bulk").time():
+            UserNotification.objects.bulk_create(notifications)
 
 def notify_faculty(message_type, title, body, related_entity_type=None, related_entity_id=None):
     """
@@ -50,4 +60,114 @@ def notify_faculty(message_type, title, body, related_entity_type=None, related_
         ))
         
     if notifications:
-        UserNotification.objects.bulk_create(notifications)
+        with NOTIFICATION_WRITE.labels(kind="bulk").time():
+            UserNotification.objects.bulk_create(notifications)
+
+def build_notification(user, message_type, title, body, related_entity_type=None, related_entity_id=None):
+    """
+    Unsaved notification for bulk_notify.
+    """
+    return UserNotification(
+        user=user,
+        message_type=message_type,
+        title=title,
+        body=body,
+        related_entity_type=related_entity_type,
+        related_entity_id=related_entity_id
+    )
+
+def bulk_notify(notifications):
+    """
+    Inserts notifications built with build_notification in one statement.
+    """
+    if notifications:
+        with NOTIFICATION_WRITE.labels(kind="bulk").time():
+            UserNotification.objects.bulk_create(notifications)
+
+def purgeable_notifications(now=None):
+    """
+    Notifications past their retention. NOTIFICATION_RETENTION_DAYS maps a
+    message type (or "default" for the rest) to how many days to keep
+    "read" and "unread" notifications; None keeps them forever.
+    """
+    now = now or timezone.now()
+    rules = settings.NOTIFICATION_RETENTION_DAYS
+    listed = [message_type for message_type in rules if message_type != "default"]
+    condition = Q(pk__in=[])
+    for message_type, keep in rules.items():
+        scope = ~Q(message_type__in=listed) if message_type == "default" else Q(message_type=message_type)
+        for state, is_read in (("read", True), ("unread", False)):
+            days = keep.get(state)
+            if days is not None:
+                condition |= scope & Q(is_read=is_read, created_at__lt=now - datetime.timedelta(days=days))
+    return UserNotification.objects.filter(condition)
+
+def retention_report(now=None):
+    """
+    What a purge would delete, as {"message_type", "is_read", "count"} rows.
+    """
+    return list(
+        purgeable_notifications(now).order_by().values("message_type", "is_read")
+        .annotate(count=Count("id")).order_by("message_type", "is_read")
+    )
+
+def summarize_notifications(ids):
+    """
+    Adds the notifications in `ids` to their users' NotificationSummary rows.
+    Call it in the transaction that deletes them.
+    """
+    rows = list(
+        UserNotification.objects.filter(id__in=ids).order_by().values("user_id", "message_type").annotate(
+            total=Count("id"), unread=Count("id", filter=Q(is_read=False)),
+            first=Min("created_at"), last=Max("created_at")
+        )
+    )
+    existing = {
+        (summary.user_id, summary.message_type): summary
+        for summary in NotificationSummary.objects.select_for_update().filter(
+            user_id__in={row["user_id"] for row in rows},
+            message_type__in={row["message_type"] for row in rows}
+        )
+    }
+    created, updated = [], []
+    for row in rows:
+        summary = existing.get((row["user_id"], row["message_type"]))
+        if summary is None:
+            created.append(NotificationSummary(
+                user_id=row["user_id"],
+                message_type=row["message_type"],
+                purged_count=row["total"],
+                unread_count=row["unread"],
+                first_created_at=row["first"],
+                last_created_at=row["last"]
+            ))
+            continue
+        summary.purged_count += row["total"]
+        summary.unread_count += row["unread"]
+        summary.first_created_at = min(summary.first_created_at, row["first"])
+        summary.last_created_at = max(summary.last_created_at, row["last"])
+        summary.updated_at = timezone.now()
+        updated.append(summary)
+    NotificationSummary.objects.bulk_create(created)
+    NotificationSummary.objects.bulk_update(
+        updated, ["purged_count", "unread_count", "first_created_at", "last_created_at", "updated_at"]
+    )
+
+def purge_notifications_batch(after_id=0, batch_size=1000, summarize=False, now=None):
+    """
+    Deletes the next `batch_size` purgeable notifications with ids above
+    `after_id`, walking the primary key so each DELETE touches one short id
+    range and the transaction stays small. Returns (deleted, last_id); pass
+    last_id back in for the next batch. last_id is None when nothing is left.
+    """
+    ids = list(
+        purgeable_notifications(now).filter(id__gt=after_id).order_by("id").values_list("id", flat=True)[:batch_size]
+    )
+    if not ids:
+        return 0, None
+    with transaction.atomic():
+        if summarize:
+            summarize_notifications(ids)
+        deleted, _ = UserNotification.objects.filter(id__in=ids).delete()
+    NOTIFICATIONS_PURGED.inc(deleted)
+    return deleted, ids[-1]
@@ -1,24 +1,25 @@
 from rest_framework import generics, views, status
 from rest_framework.permissions import IsAuthenticated
-from .serializers import NotificationSerializer
+from .serializers import NotificationSerializer, notification_projection
 from .models import UserNotification
 from core.permissions import IsActiveAndApproved
+from core.projections import ProjectionListMixin
 from core.response import success_response, error_response
 
-class NotificationListView(generics.ListAPIView):
+class NotificationListView(ProjectionListMixin, generics.ListAPIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved]
     serializer_class = NotificationSerializer
+    throttle_scope = "notifications"
+    projection = notification_projection
+    pagination_class = None
+    query_budget = 2
 
     def get_queryset(self):
         return UserNotification.objects.filter(user=self.request.user)[:20]
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-        serializer = self.get_serializer(queryset, many=True)
-        return success_response(serializer.data)
-
 class MarkNotificationReadView(views.APIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved]
+    throttle_scope = "notifications"
 
     def patch(self, request, pk):
         try:
@@ -26,7 +27,7 @@ class MarkNotificationReadView(views.APIView):
         except UserNotification.DoesNotExist:
             return error_response(message="Notification not found.", status_code=404)
             
-        if notification.user != request.user:
+        if notification.user_id != request.user.id:
             return error_response(message="Permission denied.", status_code=403)
             
         notification.is_read = True
@@ -35,6 +36,7 @@ class MarkNotificationReadView(views.APIView):
 
 class MarkAllNotificationsReadView(views.APIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved]
+    throttle_scope = "notifications"
 
     def post(self, request):
         UserNotification.objects.filter(user=request.user, is_read=False).update(is_read=True)
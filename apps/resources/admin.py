@@ -1,5 +1,10 @@
 from django.contrib import admin
-from .models import Resource, ResourceAdditionRequest, ResourceWeeklySchedule, CalendarOverride
+from .models import (
+    Resource, ResourceAdditionRequest, ResourceArchive, ResourceWeeklySchedule, CalendarOverride,
+    ScheduleTemplate, ScheduleTemplateDay
+)
+from apps.bookings.models import approver_id_for
+from apps.bookings.services import sync_approvers
 
 class ResourceWeeklyScheduleInline(admin.TabularInline):
     model = ResourceWeeklySchedule
@@ -13,17 +18,40 @@ class ResourceAdmin(admin.ModelAdmin):
     search_fields = ('name', 'location')
     inlines = [ResourceWeeklyScheduleInline]
 
+    def save_model(self, request, obj, form, change):
+        previous_approver_id = approver_id_for(Resource.objects.get(pk=obj.pk)) if change else None
+        super().save_model(request, obj, form, change)
+        if change:
+            sync_approvers(obj, previous_approver_id)
+
 class ResourceAdditionRequestAdmin(admin.ModelAdmin):
     list_display = ('proposed_name', 'requested_by', 'status', 'created_at')
     list_filter = ('status', 'proposed_type')
     search_fields = ('proposed_name', 'requested_by__email')
 
 class CalendarOverrideAdmin(admin.ModelAdmin):
-    list_display = ('override_date', 'override_type', 'description', 'created_by')
+    list_display = ('start_date', 'end_date', 'override_type', 'description', 'created_by')
     list_filter = ('override_type',)
-    ordering = ('override_date',)
+    ordering = ('start_date',)
+
+class ScheduleTemplateDayInline(admin.TabularInline):
+    model = ScheduleTemplateDay
+    extra = 0
+    fields = ('day_of_week', 'start_time', 'end_time', 'is_working')
+
+class ScheduleTemplateAdmin(admin.ModelAdmin):
+    list_display = ('name', 'is_default', 'created_by', 'updated_at')
+    search_fields = ('name',)
+    inlines = [ScheduleTemplateDayInline]
+
+class ResourceArchiveAdmin(admin.ModelAdmin):
+    list_display = ('id', 'name', 'type', 'managed_by_id', 'deleted_at', 'archived_at')
+    list_filter = ('type',)
+    search_fields = ('=id', 'name')
 
 admin.site.register(Resource, ResourceAdmin)
 admin.site.register(ResourceAdditionRequest, ResourceAdditionRequestAdmin)
 admin.site.register(ResourceWeeklySchedule) # Optional if inline is enough, but good for direct access
 admin.site.register(CalendarOverride, CalendarOverrideAdmin)
+admin.site.register(ScheduleTemplate, ScheduleTemplateAdmin)
+admin.site.register(ResourceArchive, ResourceArchiveAdmin)
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-19 01:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("resources", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="resource",
+            name="pending_expiry_hours",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 6.0.2 on 2026-10-19 01:29
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("resources", "0002_resource_pending_expiry_hours"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ResourceArchive",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("name", models.CharField(max_length=200)),
+                ("type", models.CharField(choices=[("LAB", "Lab"), ("CLASSROOM", "Classroom"), ("EVENT_HALL", "Event Hall")], max_length=20)),
+                ("capacity", models.IntegerField(default=0)),
+                ("total_quantity", models.IntegerField(default=1)),
+                ("location", models.CharField(blank=True, max_length=255, null=True)),
+                ("description", models.TextField(blank=True, null=True)),
+                ("resource_status", models.CharField(choices=[("AVAILABLE", "Available"), ("UNAVAILABLE", "Unavailable")], max_length=20)),
+                ("approval_type", models.CharField(choices=[("AUTO_APPROVE", "Auto Approve"), ("STAFF_APPROVE", "Staff Approve"), ("ADMIN_APPROVE", "Admin Approve")], max_length=20)),
+                ("pending_expiry_hours", models.PositiveIntegerField(blank=True, null=True)),
+                ("created_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+                ("deleted_at", models.DateTimeField(blank=True, null=True)),
+                ("archived_at", models.DateTimeField(auto_now_add=True)),
+                ("managed_by", models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name="+", to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                "db_table": "resources_archive",
+            },
+        ),
+    ]
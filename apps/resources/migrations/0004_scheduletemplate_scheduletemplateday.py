@@ -0,0 +1,49 @@
+# Generated by Django 6.0.2 on 2026-10-19 01:31
+
+import datetime
+import django.core.validators
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("resources", "0003_resourcearchive"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ScheduleTemplate",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("name", models.CharField(max_length=100, unique=True)),
+                ("description", models.CharField(blank=True, max_length=255, null=True)),
+                ("is_default", models.BooleanField(default=False)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("created_by", models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="schedule_templates", to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                "db_table": "schedule_templates",
+            },
+        ),
+        migrations.CreateModel(
+            name="ScheduleTemplateDay",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("day_of_week", models.SmallIntegerField(validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(6)])),
+                ("start_time", models.TimeField(default=datetime.time(8, 0))),
+                ("end_time", models.TimeField(default=datetime.time(19, 0))),
+                ("is_working", models.BooleanField(default=True)),
+                ("template", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="days", to="resources.scheduletemplate")),
+            ],
+            options={
+                "db_table": "schedule_template_days",
+                "ordering": ["day_of_week"],
+                "unique_together": {("template", "day_of_week")},
+            },
+        ),
+    ]
@@ -0,0 +1,38 @@
+from django.db import migrations, models
+
+
+def fill_end_date(apps, schema_editor):
+    CalendarOverride = apps.get_model("resources", "CalendarOverride")
+    CalendarOverride.objects.update(end_date=models.F("start_date"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("resources", "0004_scheduletemplate_scheduletemplateday"),
+    ]
+
+    operations = [
+        migrations.RenameField(
+            model_name="calendaroverride",
+            old_name="override_date",
+            new_name="start_date",
+        ),
+        migrations.AddField(
+            model_name="calendaroverride",
+            name="end_date",
+            field=models.DateField(null=True),
+        ),
+        migrations.RunPython(fill_end_date, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="calendaroverride",
+            name="end_date",
+            field=models.DateField(),
+        ),
+        migrations.AddConstraint(
+            model_name="calendaroverride",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("end_date__gte", models.F("start_date"))), name="calendar_override_range"
+            ),
+        ),
+    ]
@@ -30,6 +30,9 @@ class Resource(SoftDeleteMixin):
     resource_status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='AVAILABLE')
     approval_type = models.CharField(max_length=20, choices=APPROVAL_TYPE_CHOICES, default='AUTO_APPROVE')
     managed_by = models.ForeignKey(User, on_delete=models.PROTECT, related_name='managed_resources')
+    # Pending bookings expire this many hours before the slot starts;
+    # null falls back to BOOKING_PENDING_EXPIRY_HOURS
+    pending_expiry_hours = models.PositiveIntegerField(blank=True, null=True)
     
     # SoftDeleteMixin provides is_deleted and deleted_at
     
@@ -51,6 +54,42 @@ class Resource(SoftDeleteMixin):
     def __str__(self):
         return self.name
 
+class ResourceArchive(models.Model):
+    """
+    Soft-deleted resources moved out of `resources` by the
+    compact_soft_deleted command. Rows keep their original id, so archived
+    bookings still resolve.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    name = models.CharField(max_length=200)
+    type = models.CharField(max_length=20, choices=Resource.TYPE_CHOICES)
+    capacity = models.IntegerField(default=0)
+    total_quantity = models.IntegerField(default=1)
+    location = models.CharField(max_length=255, blank=True, null=True)
+    description = models.TextField(blank=True, null=True)
+    resource_status = models.CharField(max_length=20, choices=Resource.STATUS_CHOICES)
+    approval_type = models.CharField(max_length=20, choices=Resource.APPROVAL_TYPE_CHOICES)
+    # The manager may be compacted later, into users_archive
+    managed_by = models.ForeignKey(User, on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    pending_expiry_hours = models.PositiveIntegerField(blank=True, null=True)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    deleted_at = models.DateTimeField(blank=True, null=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    # Columns copied verbatim between Resource and ResourceArchive
+    COPIED_FIELDS = [
+        'id', 'name', 'type', 'capacity', 'total_quantity', 'location', 'description',
+        'resource_status', 'approval_type', 'managed_by_id', 'pending_expiry_hours',
+        'created_at', 'updated_at', 'deleted_at'
+    ]
+
+    class Meta:
+        db_table = 'resources_archive'
+
+    def __str__(self):
+        return f"{self.name} (archived)"
+
 class ResourceAdditionRequest(models.Model):
     STATUS_CHOICES = (
         ('PENDING', 'Pending'),
@@ -95,13 +134,51 @@ class ResourceWeeklySchedule(models.Model):
             models.Index(fields=['resource']),
         ]
 
+class ScheduleTemplate(models.Model):
+    """
+    A named weekly schedule (e.g. "Main building, exam term") that can be
+    applied to many resources at once. The template marked is_default is
+    what new resources start with.
+    """
+    name = models.CharField(max_length=100, unique=True)
+    description = models.CharField(max_length=255, blank=True, null=True)
+    is_default = models.BooleanField(default=False)
+    created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='schedule_templates')
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'schedule_templates'
+
+    def __str__(self):
+        return self.name
+
+class ScheduleTemplateDay(models.Model):
+    template = models.ForeignKey(ScheduleTemplate, on_delete=models.CASCADE, related_name='days')
+    day_of_week = models.SmallIntegerField(validators=[MinValueValidator(0), MaxValueValidator(6)])
+    start_time = models.TimeField(default=datetime.time(8, 0))
+    end_time = models.TimeField(default=datetime.time(19, 0))
+    is_working = models.BooleanField(default=True)
+
+    class Meta:
+        db_table = 'schedule_template_days'
+        ordering = ['day_of_week']
+        unique_together = [['template', 'day_of_week']]
+
 class CalendarOverride(models.Model):
+    """
+    Marks the dates start_date..end_date (inclusive) as holidays or working
+    days. Ranges never overlap, so the override for a date is the one with
+    the latest start_date on or before it, if it hasn't ended yet (see
+    apps.resources.services.override_on).
+    """
     TYPE_CHOICES = (
         ('HOLIDAY', 'Holiday'),
         ('WORKING_DAY', 'Working Day'),
     )
 
-    override_date = models.DateField(unique=True)
+    start_date = models.DateField(unique=True)
+    end_date = models.DateField()
     override_type = models.CharField(max_length=20, choices=TYPE_CHOICES)
     description = models.CharField(max_length=255, blank=True, null=True)
     created_by = models.ForeignKey(User, on_delete=models.PROTECT, related_name='calendar_overrides')
@@ -112,3 +189,6 @@ class CalendarOverride(models.Model):
         indexes = [
             models.Index(fields=['created_by']),
         ]
+        constraints = [
+            models.CheckConstraint(condition=models.Q(end_date__gte=models.F('start_date')), name='calendar_override_range'),
+        ]
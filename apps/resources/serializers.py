@@ -1,8 +1,16 @@
 from rest_framework import serializers
-from .models import Resource, ResourceAdditionRequest, ResourceWeeklySchedule, CalendarOverride
+from django.db import transaction
+from .models import (
+    Resource, ResourceAdditionRequest, ResourceWeeklySchedule, CalendarOverride, ScheduleTemplate, ScheduleTemplateDay
+)
 from apps.accounts.serializers import UserMinimalSerializer
 from apps.accounts.models import User
 from django.db.models import Q
+from .services import overlapping_override
+from core.fieldsets import DynamicFieldsMixin
+import datetime
+
+CALENDAR_IMPORT_MAX_BYTES = 1024 * 1024
 
 class ResourceWeeklyScheduleSerializer(serializers.ModelSerializer):
     day_name = serializers.SerializerMethodField()
@@ -18,7 +26,7 @@ class ResourceWeeklyScheduleSerializer(serializers.ModelSerializer):
             return days[obj.day_of_week]
         return "Unknown"
 
-class ResourceSerializer(serializers.ModelSerializer):
+class ResourceSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     managed_by = UserMinimalSerializer(read_only=True)
     weekly_schedules = ResourceWeeklyScheduleSerializer(many=True, read_only=True)
 
@@ -27,7 +35,7 @@ class ResourceSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'name', 'type', 'capacity', 'total_quantity', 
             'location', 'description', 'resource_status', 
-            'approval_type', 'managed_by', 'weekly_schedules',
+            'approval_type', 'managed_by', 'pending_expiry_hours', 'weekly_schedules',
             'created_at', 'updated_at', 'is_deleted'
         ]
         read_only_fields = ['id', 'created_at', 'updated_at', 'is_deleted', 'weekly_schedules']
@@ -43,7 +51,7 @@ class ResourceCreateSerializer(serializers.ModelSerializer):
         fields = [
             'name', 'type', 'capacity', 'total_quantity', 
             'location', 'description', 'resource_status', 
-            'approval_type', 'managed_by'
+            'approval_type', 'managed_by', 'pending_expiry_hours'
         ]
 
     def validate_managed_by(self, value):
@@ -62,7 +70,7 @@ class ResourceUpdateSerializer(serializers.ModelSerializer):
         fields = [
             'name', 'type', 'capacity', 'total_quantity', 
             'location', 'description', 'resource_status', 
-            'approval_type', 'managed_by'
+            'approval_type', 'managed_by', 'pending_expiry_hours'
         ]
         extra_kwargs = {
             'name': {'required': False},
@@ -116,19 +124,125 @@ class ResourceAdditionReviewSerializer(serializers.Serializer):
             raise serializers.ValidationError({"rejection_reason": "Rejection reason is required."})
         return data
 
+class ScheduleDaySerializer(serializers.Serializer):
+    day_of_week = serializers.IntegerField(min_value=0, max_value=6)
+    start_time = serializers.TimeField(default=datetime.time(8, 0))
+    end_time = serializers.TimeField(default=datetime.time(19, 0))
+    is_working = serializers.BooleanField(default=True)
+
+    def validate(self, attrs):
+        if attrs['is_working'] and attrs['start_time'] >= attrs['end_time']:
+            raise serializers.ValidationError("end_time must be after start_time.")
+        return attrs
+
+def validate_week(days):
+    """
+    A week is exactly one entry for each day_of_week 0-6.
+    """
+    if sorted(day['day_of_week'] for day in days) != list(range(7)):
+        raise serializers.ValidationError("Expected one entry for each day_of_week 0-6.")
+    return sorted(days, key=lambda day: day['day_of_week'])
+
+class ScheduleTemplateSerializer(serializers.ModelSerializer):
+    days = ScheduleDaySerializer(many=True)
+    created_by = UserMinimalSerializer(read_only=True)
+
+    class Meta:
+        model = ScheduleTemplate
+        fields = ['id', 'name', 'description', 'is_default', 'days', 'created_by', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'created_by', 'created_at', 'updated_at']
+
+    def validate_days(self, value):
+        return validate_week(value)
+
+    @transaction.atomic
+    def create(self, validated_data):
+        days = validated_data.pop('days')
+        template = ScheduleTemplate.objects.create(**validated_data)
+        self.save_days(template, days)
+        self.keep_single_default(template)
+        return template
+
+    @transaction.atomic
+    def update(self, instance, validated_data):
+        days = validated_data.pop('days', None)
+        template = super().update(instance, validated_data)
+        if days is not None:
+            template.days.all().delete()
+            self.save_days(template, days)
+        self.keep_single_default(template)
+        return template
+
+    def save_days(self, template, days):
+        ScheduleTemplateDay.objects.bulk_create([ScheduleTemplateDay(template=template, **day) for day in days])
+        # Drop the prefetched days so the response shows the new ones
+        getattr(template, '_prefetched_objects_cache', {}).pop('days', None)
+
+    def keep_single_default(self, template):
+        if template.is_default:
+            ScheduleTemplate.objects.filter(is_default=True).exclude(pk=template.pk).update(is_default=False)
+
+class ScheduleTemplateApplySerializer(serializers.Serializer):
+    """
+    Which resources to apply a template to. Filters combine; at least one is
+    required so a template is never applied to every resource by accident.
+    """
+    resource_ids = serializers.ListField(child=serializers.IntegerField(), required=False, allow_empty=False)
+    type = serializers.ChoiceField(choices=Resource.TYPE_CHOICES, required=False)
+    location = serializers.CharField(required=False)
+
+    def validate(self, attrs):
+        if not attrs:
+            raise serializers.ValidationError("Give resource_ids, type or location.")
+        return attrs
+
 class CalendarOverrideSerializer(serializers.ModelSerializer):
     created_by = UserMinimalSerializer(read_only=True)
+    end_date = serializers.DateField(required=False, help_text="Last day of the range; defaults to start_date.")
 
     class Meta:
         model = CalendarOverride
-        fields = ['id', 'override_date', 'override_type', 'description', 'created_by']
+        fields = ['id', 'start_date', 'end_date', 'override_type', 'description', 'created_by']
         read_only_fields = ['id', 'created_by']
 
+    def validate(self, attrs):
+        # Only race-free under lock_calendar_overrides(), which the view holds
+        attrs.setdefault('end_date', attrs['start_date'])
+        if attrs['end_date'] < attrs['start_date']:
+            raise serializers.ValidationError({"end_date": "end_date is before start_date."})
+        existing = overlapping_override(attrs['start_date'], attrs['end_date'])
+        if existing is not None:
+            raise serializers.ValidationError(
+                f"Overlaps the existing override {existing.start_date}..{existing.end_date}."
+            )
+        return attrs
+
+class CalendarImportSerializer(serializers.Serializer):
+    file = serializers.FileField()
+    format = serializers.ChoiceField(choices=['ics', 'csv'], required=False,
+                                     help_text="Taken from the file name when left out.")
+    default_type = serializers.ChoiceField(choices=CalendarOverride.TYPE_CHOICES, default='HOLIDAY',
+                                           help_text="Type for rows/events that don't name one.")
+
+    def validate(self, attrs):
+        if 'format' not in attrs:
+            name = attrs['file'].name.lower()
+            if name.endswith(('.ics', '.ical')):
+                attrs['format'] = 'ics'
+            elif name.endswith('.csv'):
+                attrs['format'] = 'csv'
+            else:
+                raise serializers.ValidationError({"format": "Give format (ics or csv) for this file name."})
+        if attrs['file'].size > CALENDAR_IMPORT_MAX_BYTES:
+            raise serializers.ValidationError({"file": "Calendar files are limited to 1 MB."})
+        return attrs
+
 class AvailabilitySlotSerializer(serializers.Serializer):
     start_time = serializers.TimeField()
     end_time = serializers.TimeField()
     total_quantity = serializers.IntegerField()
     booked_quantity = serializers.IntegerField()
+    held_quantity = serializers.IntegerField()
     available_quantity = serializers.IntegerField()
     status = serializers.SerializerMethodField()
 
@@ -0,0 +1,207 @@
+import csv
+import datetime
+import io
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import CalendarOverride, Resource, ResourceArchive, ResourceWeeklySchedule, ScheduleTemplate
+from core.compaction import compact_batch, compactable
+from core.models import NamedLock
+from core.ical import parse_events
+
+# Week for new resources when no template is marked default: Mon-Fri 08:00-19:00
+DEFAULT_WEEK = [
+    {"day_of_week": day, "start_time": datetime.time(8, 0), "end_time": datetime.time(19, 0), "is_working": day < 5}
+    for day in range(7)
+]
+
+# Schedule rows per upsert statement (seven per resource)
+SCHEDULE_UPSERT_BATCH_SIZE = 700
+
+# Rows that go with a compacted resource; anything else referring to it (live
+# bookings, the addition request that created it) keeps it in `resources`
+RESOURCE_COMPACTION_DISPOSABLE = (
+    "resources.ResourceWeeklySchedule",
+    "bookings.BookingWaitlistEntry",
+    "bookings.BookingHold",
+)
+
+def compactable_resources(older_than_days):
+    return compactable(Resource, older_than_days, RESOURCE_COMPACTION_DISPOSABLE)
+
+def compact_resources_batch(older_than_days, batch_size):
+    """
+    Moves up to `batch_size` long-deleted resources into resources_archive.
+    Returns the number moved.
+    """
+    return compact_batch(Resource, ResourceArchive, older_than_days, batch_size, RESOURCE_COMPACTION_DISPOSABLE)
+
+def template_week(template):
+    return [
+        {"day_of_week": day.day_of_week, "start_time": day.start_time, "end_time": day.end_time, "is_working": day.is_working}
+        for day in template.days.all()
+    ]
+
+def default_week():
+    """
+    The week new resources start with: the default template's, or DEFAULT_WEEK.
+    """
+    template = ScheduleTemplate.objects.filter(is_default=True).prefetch_related("days").first()
+    return template_week(template) if template is not None else DEFAULT_WEEK
+
+def create_weekly_schedules(resource):
+    """
+    Gives a new resource its seven schedule rows from default_week().
+    """
+    ResourceWeeklySchedule.objects.bulk_create([ResourceWeeklySchedule(resource=resource, **day) for day in default_week()])
+
+def upsert_weekly_schedules(resource_ids, week):
+    """
+    Writes `week` (dicts of day_of_week, start_time, end_time, is_working)
+    as the weekly schedule of every resource in `resource_ids`: one
+    INSERT ... ON CONFLICT/ON DUPLICATE KEY UPDATE per batch, then a single
+    updated_at bump so cached schedules and availability revalidate.
+    """
+    rows = [
+        ResourceWeeklySchedule(resource_id=resource_id, **day)
+        for resource_id in resource_ids for day in week
+    ]
+    # MySQL upserts on any unique key and can't be given the target
+    unique_fields = ["resource", "day_of_week"] if connection.features.supports_update_conflicts_with_target else None
+    with transaction.atomic():
+        ResourceWeeklySchedule.objects.bulk_create(
+            rows,
+            batch_size=SCHEDULE_UPSERT_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=unique_fields,
+            update_fields=["start_time", "end_time", "is_working"]
+        )
+        Resource.objects.filter(id__in=resource_ids).update(updated_at=timezone.now())
+
+def lock_calendar_overrides():
+    """
+    Serializes writers of calendar overrides until the end of the current
+    transaction. The no-overlap rule is checked in code (a unique start_date
+    can't express it), so each writer must hold this lock from the overlap
+    check to the insert.
+    """
+    NamedLock.acquire("calendar_overrides")
+
+def overlapping_override(start_date, end_date):
+    """
+    An existing override sharing a day with start_date..end_date, or None.
+    Ranges never overlap, so only the latest one starting on or before
+    end_date can: one probe of the start_date index, however many there are.
+    """
+    override = CalendarOverride.objects.filter(start_date__lte=end_date).order_by("-start_date").first()
+    return override if override is not None and override.end_date >= start_date else None
+
+def override_on(day):
+    """
+    The CalendarOverride covering `day`, or None.
+    """
+    return overlapping_override(day, day)
+
+def ics_override_type(event, default_type):
+    # Events can say what they are with CATEGORIES:HOLIDAY or CATEGORIES:WORKING_DAY
+    categories = {category.replace(" ", "_") for category in event["categories"]}
+    for override_type, _ in CalendarOverride.TYPE_CHOICES:
+        if override_type in categories:
+            return override_type
+    return default_type
+
+def parse_calendar_file(text, file_format, default_type):
+    """
+    Rows (start_date, end_date, override_type, description, line) from an
+    iCalendar file or a CSV with a start_date[,end_date][,override_type]
+    [,description] header. Raises ValueError on unreadable input.
+    """
+    if file_format == "ics":
+        return [
+            {
+                "start_date": event["start"],
+                "end_date": event["end"],
+                "override_type": ics_override_type(event, default_type),
+                "description": (event["summary"] or event["description"])[:255] or None,
+                "line": event["line"],
+            }
+            for event in parse_events(text)
+        ]
+
+    reader = csv.DictReader(io.StringIO(text))
+    if not reader.fieldnames or "start_date" not in reader.fieldnames:
+        raise ValueError("CSV needs a header row with at least a start_date column.")
+    rows = []
+    for record in reader:
+        line = reader.line_num
+        try:
+            start_date = datetime.date.fromisoformat(record["start_date"].strip())
+            end_date = datetime.date.fromisoformat((record.get("end_date") or "").strip() or str(start_date))
+        except ValueError:
+            raise ValueError(f"Line {line}: dates must be YYYY-MM-DD.") from None
+        rows.append({
+            "start_date": start_date,
+            "end_date": end_date,
+            "override_type": (record.get("override_type") or "").strip().upper() or default_type,
+            "description": (record.get("description") or "").strip()[:255] or None,
+            "line": line,
+        })
+    return rows
+
+def calendar_import_errors(rows):
+    """
+    Problems that stop an import, as [{"line", "message"}]: unknown types,
+    ranges ending before they start, and ranges overlapping each other or an
+    existing override. Existing ranges are read in one query.
+    """
+    errors = []
+    valid_types = {choice for choice, _ in CalendarOverride.TYPE_CHOICES}
+    for row in rows:
+        if row["override_type"] not in valid_types:
+            errors.append({"line": row["line"], "message": f"Unknown override_type {row['override_type']!r}."})
+        if row["end_date"] < row["start_date"]:
+            errors.append({"line": row["line"], "message": "end_date is before start_date."})
+    ordered = sorted((row for row in rows if row["end_date"] >= row["start_date"]), key=lambda row: row["start_date"])
+    if not ordered:
+        return errors
+    for previous, row in zip(ordered, ordered[1:]):
+        if row["start_date"] <= previous["end_date"]:
+            errors.append({"line": row["line"], "message": f"Overlaps the range on line {previous['line']}."})
+
+    existing = CalendarOverride.objects.filter(
+        start_date__lte=ordered[-1]["end_date"], end_date__gte=ordered[0]["start_date"]
+    ).order_by("start_date")
+    for override in existing:
+        for row in ordered:
+            if row["start_date"] <= override.end_date and row["end_date"] >= override.start_date:
+                errors.append({
+                    "line": row["line"],
+                    "message": f"Overlaps the existing override {override.start_date}..{override.end_date}."
+                })
+    return sorted(errors, key=lambda error: error["line"])
+
+def import_calendar_overrides(rows, actor):
+    """
+    Validates and inserts the rows in one transaction, holding the calendar
+    lock. Returns (overrides, errors); nothing is inserted when there are
+    errors.
+    """
+    with transaction.atomic():
+        lock_calendar_overrides()
+        errors = calendar_import_errors(rows)
+        if errors:
+            return [], errors
+        CalendarOverride.objects.bulk_create([
+            CalendarOverride(
+                start_date=row["start_date"],
+                end_date=row["end_date"],
+                override_type=row["override_type"],
+                description=row["description"],
+                created_by=actor
+            )
+            for row in rows
+        ])
+        # Re-read for the ids, which MySQL doesn't return from a bulk insert
+        created = CalendarOverride.objects.filter(start_date__in=[row["start_date"] for row in rows])
+        return list(created.select_related("created_by").order_by("start_date")), []
@@ -3,8 +3,9 @@ from .views import (
     ResourceListCreateView, ResourceDetailUpdateDeleteView,
     ResourceAdditionRequestCreateView, ResourceAdditionRequestListView,
     ApproveResourceRequestView, RejectResourceRequestView,
-    ResourceScheduleView, CalendarOverrideListCreateView, CalendarOverrideDeleteView,
-    AvailabilityView
+    ResourceScheduleView, CalendarOverrideListCreateView, CalendarOverrideDeleteView, CalendarOverrideImportView,
+    AvailabilityView, ScheduleTemplateListCreateView, ScheduleTemplateDetailView,
+    ApplyScheduleTemplateView
 )
 
 urlpatterns = [
@@ -20,7 +21,13 @@ urlpatterns = [
     path("resource-requests/<int:pk>/approve/", ApproveResourceRequestView.as_view(), name="approve-resource-request"),
     path("resource-requests/<int:pk>/reject/", RejectResourceRequestView.as_view(), name="reject-resource-request"),
     
+    # Schedule Templates
+    path("schedule-templates/", ScheduleTemplateListCreateView.as_view(), name="schedule-template-list-create"),
+    path("schedule-templates/<int:pk>/", ScheduleTemplateDetailView.as_view(), name="schedule-template-detail"),
+    path("schedule-templates/<int:pk>/apply/", ApplyScheduleTemplateView.as_view(), name="schedule-template-apply"),
+    
     # Calendar Overrides
     path("calendar-overrides/", CalendarOverrideListCreateView.as_view(), name="calendar-override-list"),
+    path("calendar-overrides/import/", CalendarOverrideImportView.as_view(), name="calendar-override-import"),
     path("calendar-overrides/<int:pk>/", CalendarOverrideDeleteView.as_view(), name="calendar-override-delete"),
 ]
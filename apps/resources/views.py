@@ -1,7 +1,8 @@
 from rest_framework import generics, views, status
 from rest_framework.permissions import IsAuthenticated
 from django.shortcuts import get_object_or_404
-from django.db.models import Q, Sum
+from django.db import transaction
+from django.db.models import Q
 from django.utils import timezone
 import datetime
 
@@ -9,16 +10,28 @@ from .serializers import (
     ResourceSerializer, ResourceCreateSerializer, ResourceUpdateSerializer,
     ResourceAdditionRequestSerializer, ResourceAdditionRequestReadSerializer,
     ResourceAdditionReviewSerializer, ResourceWeeklyScheduleSerializer,
-    CalendarOverrideSerializer, AvailabilitySlotSerializer
+    CalendarOverrideSerializer, AvailabilitySlotSerializer, ScheduleDaySerializer,
+    ScheduleTemplateSerializer, ScheduleTemplateApplySerializer, CalendarImportSerializer, validate_week
 )
-from .models import Resource, ResourceAdditionRequest, ResourceWeeklySchedule, CalendarOverride
-from apps.bookings.models import Booking
+from .models import Resource, ResourceAdditionRequest, CalendarOverride, ScheduleTemplate
+from .services import (
+    create_weekly_schedules, import_calendar_overrides, lock_calendar_overrides, override_on, parse_calendar_file,
+    template_week, upsert_weekly_schedules
+)
+from apps.bookings.models import approver_id_for
+from apps.bookings.services import cancel_resource_bookings, cancel_waitlist, slot_usage, sync_approvers
 from apps.notifications.services import create_notification
 from apps.audit.models import create_audit_log
 from core.permissions import IsActiveAndApproved, IsAdmin, IsStaffRole, IsResourceManager
 from core.response import success_response, error_response
+from core.conditional import conditional, queryset_version
+from core.fieldsets import SparseFieldsetMixin
+from core.instrumentation import timed
+
+class ResourceListCreateView(SparseFieldsetMixin, generics.ListCreateAPIView):
+    idempotent = True
+    query_budget = {"GET": 5}
 
-class ResourceListCreateView(generics.ListCreateAPIView):
     def get_permissions(self):
         if self.request.method == 'POST':
             return [IsAuthenticated(), IsActiveAndApproved(), IsAdmin()]
@@ -46,6 +59,11 @@ class ResourceListCreateView(generics.ListCreateAPIView):
             
         return queryset.order_by('-created_at')
 
+    def get_cache_validators(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        return queryset_version(queryset, 'updated_at', 'managed_by__updated_at'), None
+
+    @conditional
     def list(self, request, *args, **kwargs):
         queryset = self.filter_queryset(self.get_queryset())
         page = self.paginate_queryset(queryset)
@@ -60,18 +78,7 @@ class ResourceListCreateView(generics.ListCreateAPIView):
         serializer.is_valid(raise_exception=True)
         resource = serializer.save()
 
-        # Auto-generate 7 weekly schedules
-        schedules = []
-        for day in range(7):
-            is_working = True if day < 5 else False
-            schedules.append(ResourceWeeklySchedule(
-                resource=resource,
-                day_of_week=day,
-                start_time=datetime.time(8, 0),
-                end_time=datetime.time(19, 0),
-                is_working=is_working
-            ))
-        ResourceWeeklySchedule.objects.bulk_create(schedules)
+        create_weekly_schedules(resource)
         
         create_audit_log(
             actor=request.user,
@@ -84,15 +91,23 @@ class ResourceListCreateView(generics.ListCreateAPIView):
 
         return success_response(ResourceSerializer(resource).data, status_code=status.HTTP_201_CREATED)
 
-class ResourceDetailUpdateDeleteView(generics.RetrieveUpdateDestroyAPIView):
+class ResourceDetailUpdateDeleteView(SparseFieldsetMixin, generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved]
     queryset = Resource.objects.all()
+    idempotent = True
     
     def get_serializer_class(self):
         if self.request.method in ['PUT', 'PATCH']:
             return ResourceUpdateSerializer
         return ResourceSerializer
 
+    def get_cache_validators(self, request, *args, **kwargs):
+        stamps = Resource.objects.filter(pk=kwargs['pk']).values_list('updated_at', 'managed_by__updated_at').first()
+        if stamps is None:
+            return None
+        return list(stamps), max(stamps)
+
+    @conditional
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
         serializer = self.get_serializer(instance)
@@ -102,15 +117,17 @@ class ResourceDetailUpdateDeleteView(generics.RetrieveUpdateDestroyAPIView):
         resource = self.get_object()
         
         # Permission check
-        if not (request.user.role == "ADMIN" or (request.user.role == "STAFF" and resource.managed_by == request.user)):
+        if not (request.user.role == "ADMIN" or (request.user.role == "STAFF" and resource.managed_by_id == request.user.id)):
             return error_response(message="You do not have permission to edit this resource.", status_code=403)
             
         previous_state = ResourceSerializer(resource).data
+        previous_approver_id = approver_id_for(resource)
         
         partial = kwargs.pop('partial', False)
         serializer = self.get_serializer(resource, data=request.data, partial=partial)
         serializer.is_valid(raise_exception=True)
         self.perform_update(serializer)
+        sync_approvers(resource, previous_approver_id)
         
         new_state = ResourceSerializer(resource).data
         
@@ -132,44 +149,21 @@ class ResourceDetailUpdateDeleteView(generics.RetrieveUpdateDestroyAPIView):
             
         resource = self.get_object()
         
-        # Cancel bookings
-        future_bookings = Booking.objects.filter(
-            resource=resource,
-            booking_date__gte=datetime.date.today(),
-            status__in=["PENDING", "APPROVED"]
+        bookings_cancelled_count = cancel_resource_bookings(
+            resource, "Resource removed by administrator",
+            actor=request.user, ip_address=getattr(request, 'audit_ip', None)
+        )
+        waitlist_cancelled_count = cancel_waitlist(
+            resource, "Resource removed by administrator",
+            actor=request.user, ip_address=getattr(request, 'audit_ip', None)
         )
-        
-        bookings_cancelled_count = 0
-        for booking in future_bookings:
-            booking.status = "CANCELLED"
-            booking.cancellation_reason = "Resource removed by administrator"
-            booking.cancelled_by = request.user
-            booking.cancelled_at = timezone.now()
-            booking.save()
-            bookings_cancelled_count += 1
-            
-            create_notification(
-                user=booking.user,
-                message_type="BOOKING_AUTO_CANCELLED",
-                title="Booking Auto-Cancelled",
-                body=f"Your booking for {resource.name} on {booking.booking_date} has been cancelled because the resource was removed by administrator."
-            )
-            
-            create_audit_log(
-                actor=request.user,
-                action="BOOKING_AUTO_CANCELLED",
-                target_entity_type="booking",
-                target_entity_id=booking.id,
-                metadata={"reason": "Resource deleted"},
-                ip_address=getattr(request, 'audit_ip', None)
-            )
 
         create_audit_log(
             actor=request.user,
             action="RESOURCE_DELETED",
             target_entity_type="resource",
             target_entity_id=resource.id,
-            metadata={"cancelled_bookings_count": bookings_cancelled_count},
+            metadata={"cancelled_bookings_count": bookings_cancelled_count, "cancelled_waitlist_count": waitlist_cancelled_count},
             ip_address=getattr(request, 'audit_ip', None)
         )
         
@@ -179,6 +173,7 @@ class ResourceDetailUpdateDeleteView(generics.RetrieveUpdateDestroyAPIView):
 class ResourceAdditionRequestCreateView(generics.CreateAPIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved, IsStaffRole]
     serializer_class = ResourceAdditionRequestSerializer
+    idempotent = True
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -200,12 +195,16 @@ class ResourceAdditionRequestCreateView(generics.CreateAPIView):
 class ResourceAdditionRequestListView(generics.ListAPIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved]
     serializer_class = ResourceAdditionRequestReadSerializer
+    query_budget = 4
 
     def get_queryset(self):
+        queryset = ResourceAdditionRequest.objects.select_related(
+            "requested_by", "reviewed_by", "created_resource__managed_by"
+        ).prefetch_related("created_resource__weekly_schedules")
         if self.request.user.role == "ADMIN":
-            return ResourceAdditionRequest.objects.all().order_by('-created_at')
+            return queryset.order_by('-created_at')
         elif self.request.user.role == "STAFF":
-            return ResourceAdditionRequest.objects.filter(requested_by=self.request.user).order_by('-created_at')
+            return queryset.filter(requested_by=self.request.user).order_by('-created_at')
         return ResourceAdditionRequest.objects.none()
 
     def list(self, request, *args, **kwargs):
@@ -219,6 +218,7 @@ class ResourceAdditionRequestListView(generics.ListAPIView):
 
 class ApproveResourceRequestView(views.APIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved, IsAdmin]
+    idempotent = True
 
     def post(self, request, pk):
         req_obj = get_object_or_404(ResourceAdditionRequest, pk=pk)
@@ -238,18 +238,7 @@ class ApproveResourceRequestView(views.APIView):
             managed_by=req_obj.requested_by 
         )
         
-        # Auto-generate schedules
-        schedules = []
-        for day in range(7):
-            is_working = True if day < 5 else False
-            schedules.append(ResourceWeeklySchedule(
-                resource=new_resource,
-                day_of_week=day,
-                start_time=datetime.time(8, 0),
-                end_time=datetime.time(19, 0),
-                is_working=is_working
-            ))
-        ResourceWeeklySchedule.objects.bulk_create(schedules)
+        create_weekly_schedules(new_resource)
 
         req_obj.status = "APPROVED"
         req_obj.reviewed_by = request.user
@@ -277,6 +266,7 @@ class ApproveResourceRequestView(views.APIView):
 
 class RejectResourceRequestView(views.APIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved, IsAdmin]
+    idempotent = True
 
     def post(self, request, pk):
         req_obj = get_object_or_404(ResourceAdditionRequest, pk=pk)
@@ -315,7 +305,17 @@ class RejectResourceRequestView(views.APIView):
 
 class ResourceScheduleView(views.APIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved]
+    idempotent = True
+    query_budget = {"GET": 4}
 
+    def get_cache_validators(self, request, pk):
+        # Schedule writes bump the resource's updated_at
+        updated_at = Resource.objects.filter(pk=pk).values_list('updated_at', flat=True).first()
+        if updated_at is None:
+            return None
+        return [updated_at], updated_at
+
+    @conditional
     def get(self, request, pk):
         resource = get_object_or_404(Resource, pk=pk)
         schedules = resource.weekly_schedules.all().order_by('day_of_week')
@@ -332,24 +332,11 @@ class ResourceScheduleView(views.APIView):
         if not isinstance(data, list) or len(data) != 7:
              return error_response(message="Expected a list of 7 schedule entries (0-6).", status_code=400)
              
-        # Validate and update
-        # Assuming input is list of dicts with day_of_week, start_time, end_time, is_working
-        updated_schedules = []
-        for entry in data:
-            day = entry.get('day_of_week')
-            if day is None or not (0 <= day <= 6):
-                 return error_response(message="Invalid day_of_week.", status_code=400)
-            
-            schedule, created = ResourceWeeklySchedule.objects.update_or_create(
-                resource=resource,
-                day_of_week=day,
-                defaults={
-                    'start_time': entry.get('start_time', '08:00'),
-                    'end_time': entry.get('end_time', '19:00'),
-                    'is_working': entry.get('is_working', True)
-                }
-            )
-            updated_schedules.append(schedule)
+        serializer = ScheduleDaySerializer(data=data, many=True)
+        serializer.is_valid(raise_exception=True)
+        week = validate_week(serializer.validated_data)
+        upsert_weekly_schedules([resource.id], week)
+        updated_schedules = resource.weekly_schedules.all().order_by('day_of_week')
             
         create_audit_log(
             actor=request.user,
@@ -361,9 +348,134 @@ class ResourceScheduleView(views.APIView):
             
         return success_response(ResourceWeeklyScheduleSerializer(updated_schedules, many=True).data)
 
+class ScheduleTemplateListCreateView(generics.ListCreateAPIView):
+    permission_classes = [IsAuthenticated, IsActiveAndApproved] # GET open, POST limited
+    serializer_class = ScheduleTemplateSerializer
+    idempotent = True
+    query_budget = {"GET": 4}
+
+    def get_permissions(self):
+        if self.request.method == 'POST':
+            return [IsAuthenticated(), IsActiveAndApproved(), IsAdmin()]
+        return super().get_permissions()
+
+    def get_queryset(self):
+        return ScheduleTemplate.objects.select_related("created_by").prefetch_related("days").order_by('name')
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        template = serializer.save(created_by=request.user)
+        data = ScheduleTemplateSerializer(template).data
+
+        create_audit_log(
+            actor=request.user,
+            action="SCHEDULE_TEMPLATE_CREATED",
+            target_entity_type="schedule_template",
+            target_entity_id=template.id,
+            new_state=data,
+            ip_address=getattr(request, 'audit_ip', None)
+        )
+
+        return success_response(data, status_code=status.HTTP_201_CREATED)
+
+class ScheduleTemplateDetailView(generics.RetrieveUpdateDestroyAPIView):
+    serializer_class = ScheduleTemplateSerializer
+    queryset = ScheduleTemplate.objects.select_related("created_by").prefetch_related("days")
+    idempotent = True
+
+    def get_permissions(self):
+        if self.request.method == 'GET':
+            return [IsAuthenticated(), IsActiveAndApproved()]
+        return [IsAuthenticated(), IsActiveAndApproved(), IsAdmin()]
+
+    def retrieve(self, request, *args, **kwargs):
+        return success_response(self.get_serializer(self.get_object()).data)
+
+    def update(self, request, *args, **kwargs):
+        template = self.get_object()
+        previous_state = ScheduleTemplateSerializer(template).data
+
+        serializer = self.get_serializer(template, data=request.data, partial=kwargs.pop('partial', False))
+        serializer.is_valid(raise_exception=True)
+        template = serializer.save()
+        new_state = ScheduleTemplateSerializer(template).data
+
+        create_audit_log(
+            actor=request.user,
+            action="SCHEDULE_TEMPLATE_UPDATED",
+            target_entity_type="schedule_template",
+            target_entity_id=template.id,
+            previous_state=previous_state,
+            new_state=new_state,
+            ip_address=getattr(request, 'audit_ip', None)
+        )
+
+        return success_response(new_state)
+
+    def destroy(self, request, *args, **kwargs):
+        template = self.get_object()
+
+        create_audit_log(
+            actor=request.user,
+            action="SCHEDULE_TEMPLATE_DELETED",
+            target_entity_type="schedule_template",
+            target_entity_id=template.id,
+            previous_state=ScheduleTemplateSerializer(template).data,
+            ip_address=getattr(request, 'audit_ip', None)
+        )
+
+        template.delete()
+        return success_response(status_code=status.HTTP_204_NO_CONTENT)
+
+class ApplyScheduleTemplateView(views.APIView):
+    """
+    Applies a template's week to every resource matching resource_ids, type
+    and/or location (substring). All matching schedules are written with
+    batched upserts, recorded as one audit entry and invalidated together.
+    """
+    permission_classes = [IsAuthenticated, IsActiveAndApproved, IsAdmin]
+    idempotent = True
+
+    def post(self, request, pk):
+        template = get_object_or_404(ScheduleTemplate.objects.prefetch_related("days"), pk=pk)
+
+        serializer = ScheduleTemplateApplySerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        filters = serializer.validated_data
+
+        resources = Resource.objects.all()
+        if 'resource_ids' in filters:
+            resources = resources.filter(id__in=filters['resource_ids'])
+        if 'type' in filters:
+            resources = resources.filter(type=filters['type'])
+        if 'location' in filters:
+            resources = resources.filter(location__icontains=filters['location'])
+        resource_ids = list(resources.order_by('id').values_list('id', flat=True))
+        if not resource_ids:
+             return error_response(message="No resources match these filters.", status_code=400)
+
+        upsert_weekly_schedules(resource_ids, template_week(template))
+
+        create_audit_log(
+            actor=request.user,
+            action="SCHEDULE_TEMPLATE_APPLIED",
+            target_entity_type="schedule_template",
+            target_entity_id=template.id,
+            metadata={"filters": filters, "resource_ids": resource_ids},
+            ip_address=getattr(request, 'audit_ip', None)
+        )
+
+        return success_response(
+            {"template_id": template.id, "resources_updated": len(resource_ids), "resource_ids": resource_ids},
+            message=f"Schedule template applied to {len(resource_ids)} resource(s)."
+        )
+
 class CalendarOverrideListCreateView(generics.ListCreateAPIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved] # GET open, POST limited
     serializer_class = CalendarOverrideSerializer
+    idempotent = True
+    query_budget = {"GET": 4}
 
     def get_permissions(self):
         if self.request.method == 'POST':
@@ -371,12 +483,23 @@ class CalendarOverrideListCreateView(generics.ListCreateAPIView):
         return super().get_permissions()
 
     def get_queryset(self):
-        return CalendarOverride.objects.all().order_by('override_date')
+        return CalendarOverride.objects.select_related("created_by").order_by('start_date')
+
+    def get_cache_validators(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        return queryset_version(queryset, 'created_at', 'created_by__updated_at'), None
+
+    @conditional
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-        override = serializer.save(created_by=request.user)
+        with transaction.atomic():
+            # The overlap check and the insert must not interleave with another writer's
+            lock_calendar_overrides()
+            serializer.is_valid(raise_exception=True)
+            override = serializer.save(created_by=request.user)
         
         create_audit_log(
             actor=request.user,
@@ -389,9 +512,56 @@ class CalendarOverrideListCreateView(generics.ListCreateAPIView):
         
         return success_response(CalendarOverrideSerializer(override).data, status_code=status.HTTP_201_CREATED)
 
+class CalendarOverrideImportView(views.APIView):
+    """
+    Imports holiday/working-day ranges from an uploaded .ics or .csv file.
+    Every row is validated (types, ranges, overlaps with each other and with
+    existing overrides) and the whole file is inserted in one transaction,
+    or nothing is.
+    """
+    permission_classes = [IsAuthenticated, IsActiveAndApproved, IsAdmin]
+    idempotent = True
+
+    def post(self, request):
+        serializer = CalendarImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = serializer.validated_data['file']
+
+        try:
+            text = upload.read().decode('utf-8-sig')
+            rows = parse_calendar_file(text, serializer.validated_data['format'], serializer.validated_data['default_type'])
+        except (UnicodeDecodeError, ValueError) as exc:
+             return error_response(errors=[{"field": "file", "message": str(exc)}], message="Could not read the calendar file.")
+        if not rows:
+             return error_response(message="The file contains no calendar entries.", status_code=400)
+
+        overrides, errors = import_calendar_overrides(rows, request.user)
+        if errors:
+             return error_response(errors=errors, message="Calendar import rejected; nothing was imported.")
+
+        create_audit_log(
+            actor=request.user,
+            action="CALENDAR_OVERRIDES_IMPORTED",
+            target_entity_type="calendar_override",
+            metadata={
+                "file": upload.name,
+                "count": len(overrides),
+                "first_date": str(overrides[0].start_date),
+                "last_date": str(max(override.end_date for override in overrides)),
+            },
+            ip_address=getattr(request, 'audit_ip', None)
+        )
+
+        return success_response(
+            CalendarOverrideSerializer(overrides, many=True).data,
+            message=f"Imported {len(overrides)} calendar override(s).",
+            status_code=status.HTTP_201_CREATED
+        )
+
 class CalendarOverrideDeleteView(generics.DestroyAPIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved, IsAdmin]
     queryset = CalendarOverride.objects.all()
+    idempotent = True
     
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()
@@ -409,6 +579,8 @@ class CalendarOverrideDeleteView(generics.DestroyAPIView):
 
 class AvailabilityView(views.APIView):
     permission_classes = [IsAuthenticated, IsActiveAndApproved]
+    throttle_scope = "availability"
+    query_budget = 6
 
     def get(self, request, pk):
         resource = get_object_or_404(Resource, pk=pk)
@@ -427,7 +599,7 @@ class AvailabilityView(views.APIView):
         start_time = datetime.time(8, 0)
         end_time = datetime.time(19, 0)
         
-        override = CalendarOverride.objects.filter(override_date=query_date).first()
+        override = override_on(query_date)
         if override:
             if override.override_type == "WORKING_DAY":
                 is_working_day = True
@@ -450,6 +622,9 @@ class AvailabilityView(views.APIView):
             # Let's use 8-19 default if no schedule
             pass
         
+        if is_working_day:
+            booked, held = slot_usage(resource, query_date)
+
         # Generate hourly slots
         current_time = datetime.datetime.combine(query_date, start_time)
         end_datetime = datetime.datetime.combine(query_date, end_time)
@@ -466,30 +641,31 @@ class AvailabilityView(views.APIView):
                 "end_time": slot_end,
                 "total_quantity": resource.total_quantity,
                 "booked_quantity": 0,
+                "held_quantity": 0,
                 "available_quantity": 0,
                 "status": "NON_WORKING"
             }
             
             if is_working_day:
-                booked_qty = Booking.objects.filter(
-                    resource=resource,
-                    booking_date=query_date,
-                    start_time=slot_start,
-                    status__in=["PENDING", "APPROVED"]
-                ).aggregate(total=Sum("quantity_requested"))["total"] or 0
+                booked_qty = booked.get(slot_start, 0)
+                held_qty = held.get(slot_start, 0)
                 
-                available = resource.total_quantity - booked_qty
+                available = resource.total_quantity - booked_qty - held_qty
                 slot_data["booked_quantity"] = booked_qty
+                slot_data["held_quantity"] = held_qty
                 slot_data["available_quantity"] = available
                 slot_data["status"] = "AVAILABLE" if available > 0 else "FULLY_BOOKED"
             
             slots.append(slot_data)
 
+        with timed("serializer"):
+            slots_data = AccessibilitySlotSerializerWrapper(slots).data
+
         return success_response({
             "resource_id": resource.id,
             "date": date_str,
             "is_working_day": is_working_day,
-            "slots": AccessibilitySlotSerializerWrapper(slots).data
+            "slots": slots_data
         })
 
 # Helper wrapper because AvailabilitySlotSerializer expects specific fields
@@ -0,0 +1,154 @@
+import datetime
+import random
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+
+from apps.accounts.models import User
+from apps.audit.models import AuditLog
+from apps.bookings.models import Booking, approver_id_for
+from apps.notifications.models import UserNotification
+from apps.resources.models import Resource, ResourceWeeklySchedule
+
+BENCH_DOMAIN = "bench.reshub.test"
+BENCH_PASSWORD = "Bench@1234"
+RESOURCE_PREFIX = "BENCH "
+
+class BenchData:
+    """
+    Handles to the seeded benchmark rows, passed to every scenario.
+    """
+    def __init__(self, admin, staff, students, contended, polled, booking_date):
+        self.admin = admin
+        self.staff = staff
+        self.students = students
+        self.contended = contended
+        self.polled = polled
+        self.booking_date = booking_date
+
+def next_working_day(start, days_ahead=7):
+    day = start + datetime.timedelta(days=days_ahead)
+    while day.weekday() >= 5:
+        day += datetime.timedelta(days=1)
+    return day
+
+def clear_bench_data():
+    AuditLog.objects.filter(actor_email__endswith=f"@{BENCH_DOMAIN}").delete()
+    Booking.objects.filter(resource__name__startswith=RESOURCE_PREFIX).delete()
+    Resource.all_objects.filter(name__startswith=RESOURCE_PREFIX).delete()
+    User.all_objects.filter(email__endswith=f"@{BENCH_DOMAIN}").delete()
+
+@transaction.atomic
+def seed_bench_data(students=200, contended_quantity=5, polled_resources=20,
+                    notifications_per_user=50, history_bookings=2000, audit_logs=2000, seed=42):
+    """
+    Creates a self-contained dataset for the benchmark scenarios. Everything
+    is tagged with BENCH_DOMAIN / RESOURCE_PREFIX so it can be cleared again.
+    """
+    rng = random.Random(seed)
+    clear_bench_data()
+    password = make_password(BENCH_PASSWORD)
+
+    def bench_user(name, role):
+        return User(
+            email=f"{name}@{BENCH_DOMAIN}",
+            name=name.replace(".", " ").title(),
+            password=password,
+            role=role,
+            account_status="ACTIVE",
+            approval_status="APPROVED",
+            is_email_verified=True,
+        )
+
+    admin = bench_user("bench.admin", "ADMIN")
+    staff = bench_user("bench.staff", "STAFF")
+    User.objects.bulk_create([admin, staff])
+    User.objects.bulk_create([bench_user(f"bench.student{i:05d}", "STUDENT") for i in range(students)], batch_size=1000)
+    admin = User.objects.get(email=admin.email)
+    staff = User.objects.get(email=staff.email)
+    student_list = list(User.objects.filter(email__startswith="bench.student", email__endswith=f"@{BENCH_DOMAIN}").order_by("email"))
+
+    resources = [Resource(
+        name=f"{RESOURCE_PREFIX}Contended Lab",
+        type="LAB",
+        capacity=contended_quantity,
+        total_quantity=contended_quantity,
+        location="Benchmark Block",
+        approval_type="AUTO_APPROVE",
+        managed_by=staff,
+    )]
+    for i in range(polled_resources):
+        resources.append(Resource(
+            name=f"{RESOURCE_PREFIX}Room {i:03d}",
+            type=rng.choice(["LAB", "CLASSROOM", "EVENT_HALL"]),
+            capacity=rng.randint(20, 200),
+            total_quantity=rng.randint(1, 10),
+            location=f"Benchmark Block, Floor {i % 5}",
+            approval_type=rng.choice(["AUTO_APPROVE", "STAFF_APPROVE", "ADMIN_APPROVE"]),
+            managed_by=staff,
+        ))
+    Resource.objects.bulk_create(resources)
+    resources = list(Resource.objects.filter(name__startswith=RESOURCE_PREFIX).order_by("id"))
+    contended, polled = resources[0], resources[1:]
+
+    ResourceWeeklySchedule.objects.bulk_create([
+        ResourceWeeklySchedule(
+            resource=resource,
+            day_of_week=day,
+            start_time=datetime.time(8, 0),
+            end_time=datetime.time(19, 0),
+            is_working=day < 5,
+        )
+        for resource in resources for day in range(7)
+    ])
+
+    today = timezone.localdate()
+    booking_date = next_working_day(today)
+
+    # Background bookings so availability and statistics have rows to aggregate
+    history = []
+    for _ in range(history_bookings):
+        resource = rng.choice(polled)
+        day = today + datetime.timedelta(days=rng.randint(-60, 30))
+        hour = rng.randint(8, 18)
+        history.append(Booking(
+            user=rng.choice(student_list),
+            resource=resource,
+            booking_date=day,
+            start_time=datetime.time(hour, 0),
+            end_time=datetime.time(hour + 1, 0),
+            quantity_requested=1,
+            status=rng.choice(["PENDING", "APPROVED", "APPROVED", "CANCELLED", "REJECTED"]),
+            approver_id=approver_id_for(resource),
+        ))
+    Booking.objects.bulk_create(history, batch_size=1000)
+
+    notifications = []
+    for user in student_list:
+        for i in range(notifications_per_user):
+            notifications.append(UserNotification(
+                user=user,
+                message_type=rng.choice(["BOOKING_APPROVED", "BOOKING_REJECTED", "GENERAL"]),
+                title=f"Benchmark notification {i}",
+                body="Generated for the notification read benchmark.",
+                is_read=rng.random() < 0.7,
+            ))
+    UserNotification.objects.bulk_create(notifications, batch_size=2000)
+
+    logs = []
+    for i in range(audit_logs):
+        actor = rng.choice([admin, staff] + student_list[:20])
+        logs.append(AuditLog(
+            actor=actor if i % 10 else None,
+            actor_email=actor.email,
+            action=rng.choice(["BOOKING_CREATED", "BOOKING_APPROVED", "BOOKING_CANCELLED"]),
+            target_entity_type="booking",
+            target_entity_id=i + 1,
+            previous_state={"status": "PENDING"} if i % 3 else None,
+            new_state={"status": "APPROVED", "quantity": rng.randint(1, 3)},
+            ip_address="10.0.0.%d" % (i % 250 + 1),
+        ))
+    AuditLog.objects.bulk_create(logs, batch_size=2000)
+
+    return BenchData(admin, staff, student_list, contended, polled, booking_date)
@@ -0,0 +1,50 @@
+import timeit
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+
+from apps.accounts.models import User
+from apps.accounts.serializers import UserSerializer, user_projection
+from apps.audit.models import AuditLog
+from apps.audit.serializers import AuditLogSerializer, audit_log_projection
+from apps.bookings.models import Booking
+from apps.bookings.serializers import BookingSerializer, booking_projection
+from apps.notifications.models import UserNotification
+from apps.notifications.serializers import NotificationSerializer, notification_projection
+from benchmarks.fixtures import seed_bench_data
+
+class Command(BaseCommand):
+    help = "Times list projections against their serializers (core.tests checks the output matches)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--page-size', type=int, default=100)
+        parser.add_argument('--number', type=int, default=20, help='Pages per timing run.')
+        parser.add_argument('--repeat', type=int, default=3, help='Timing runs; the best is reported.')
+
+    def handle(self, *args, **options):
+        call_command('migrate', verbosity=0)
+        self.stdout.write("Seeding benchmark data...")
+        data = seed_bench_data(students=100)
+
+        size = options['page_size']
+        cases = [
+            ("bookings", Booking.objects.order_by("-booking_date", "id"), BookingSerializer, booking_projection),
+            ("audit_logs", AuditLog.objects.all(), AuditLogSerializer, audit_log_projection),
+            ("users", User.objects.order_by("-created_at"), UserSerializer, user_projection),
+            ("notifications", UserNotification.objects.filter(user=data.students[0]), NotificationSerializer, notification_projection),
+        ]
+
+        for name, queryset, serializer_class, projection in cases:
+            def with_serializer():
+                return serializer_class(queryset[:size], many=True).data
+
+            def with_projection():
+                return projection.serialize(projection.rows(queryset)[:size])
+
+            number = options['number']
+            serializer_best = min(timeit.repeat(with_serializer, number=number, repeat=options['repeat'])) / number
+            projection_best = min(timeit.repeat(with_projection, number=number, repeat=options['repeat'])) / number
+            self.stdout.write(
+                f"  {name:<14} serializer {serializer_best * 1000:8.2f}ms  projection {projection_best * 1000:8.2f}ms  "
+                f"({serializer_best / projection_best:.1f}x)"
+            )
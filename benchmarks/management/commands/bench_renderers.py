@@ -0,0 +1,103 @@
+import datetime
+import io
+import json
+import random
+import timeit
+from collections import OrderedDict
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from apps.accounts.models import User
+from apps.bookings.models import Booking
+from apps.bookings.serializers import BookingSerializer
+from apps.resources.models import Resource
+from core import renderers
+from core.parsers import FastJSONParser
+from core.renderers import FastJSONRenderer
+
+def booking_page(size, seed=42):
+    """
+    A paginated BookingSerializer page built from unsaved instances, so the
+    benchmark needs no database.
+    """
+    rng = random.Random(seed)
+    now = timezone.now()
+    users = [
+        User(id=i, email=f"student{i}@campus.test", name=rng.choice(["Anaïs Roy", "Zoë Kim", "Ravi Kumar"]),
+             role="STUDENT", account_status="ACTIVE", approval_status="APPROVED")
+        for i in range(1, 21)
+    ]
+    resources = [
+        Resource(id=i, name=f"Lab {i}", type="LAB", location="Block A Floor 2")
+        for i in range(1, 11)
+    ]
+    bookings = []
+    for i in range(size):
+        hour = rng.randint(8, 18)
+        bookings.append(Booking(
+            id=i + 1,
+            user=rng.choice(users),
+            resource=rng.choice(resources),
+            booking_date=now.date() + datetime.timedelta(days=rng.randint(0, 30)),
+            start_time=datetime.time(hour, 0),
+            end_time=datetime.time(hour + 1, 0),
+            quantity_requested=rng.randint(1, 3),
+            status=rng.choice(["PENDING", "APPROVED", "REJECTED", "CANCELLED"]),
+            special_request_reason="Needs projector" if i % 5 == 0 else None,
+            approved_by_id=1 if i % 2 else None,
+            approved_at=now if i % 2 else None,
+            created_at=now - datetime.timedelta(minutes=i, microseconds=i),
+            updated_at=now,
+        ))
+    return OrderedDict([
+        ("count", size * 10),
+        ("next", "http://testserver/api/v1/bookings/?page=2"),
+        ("previous", None),
+        ("results", BookingSerializer(bookings, many=True).data),
+    ])
+
+class Command(BaseCommand):
+    help = "Compares the stdlib and fast JSON renderer/parser on BookingSerializer pages."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='20,100', help='Comma separated page sizes.')
+        parser.add_argument('--number', type=int, default=200, help='Renders per timing run.')
+        parser.add_argument('--repeat', type=int, default=5, help='Timing runs; the best is reported.')
+
+    def handle(self, *args, **options):
+        if renderers.orjson is None:
+            self.stdout.write(self.style.WARNING(
+                "orjson is not installed; FastJSONRenderer falls back to the stdlib and the numbers will match."
+            ))
+
+        stdlib_renderer, fast_renderer = JSONRenderer(), FastJSONRenderer()
+        stdlib_parser, fast_parser = JSONParser(), FastJSONParser()
+
+        for size in [int(s) for s in options['sizes'].split(',')]:
+            envelope = {"status": "success", "data": booking_page(size), "message": "Success"}
+
+            expected = stdlib_renderer.render(envelope)
+            if fast_renderer.render(envelope) != expected:
+                raise CommandError(f"FastJSONRenderer output differs from JSONRenderer for a page of {size}.")
+            if fast_parser.parse(io.BytesIO(expected)) != json.loads(expected):
+                raise CommandError(f"FastJSONParser output differs from JSONParser for a page of {size}.")
+
+            self.stdout.write(f"Page of {size} bookings ({len(expected)} bytes):")
+            self.report("render", options,
+                        lambda: stdlib_renderer.render(envelope),
+                        lambda: fast_renderer.render(envelope))
+            self.report("parse", options,
+                        lambda: stdlib_parser.parse(io.BytesIO(expected)),
+                        lambda: fast_parser.parse(io.BytesIO(expected)))
+
+    def report(self, label, options, stdlib, fast):
+        number = options['number']
+        stdlib_best = min(timeit.repeat(stdlib, number=number, repeat=options['repeat'])) / number
+        fast_best = min(timeit.repeat(fast, number=number, repeat=options['repeat'])) / number
+        self.stdout.write(
+            f"  {label:<7} stdlib {stdlib_best * 1e6:9.1f}us  fast {fast_best * 1e6:9.1f}us  "
+            f"({stdlib_best / fast_best:.1f}x)"
+        )
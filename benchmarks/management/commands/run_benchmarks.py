@@ -0,0 +1,112 @@
+import json
+import platform
+import subprocess
+from pathlib import Path
+
+import django
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from benchmarks.fixtures import seed_bench_data
+from benchmarks.scenarios import SCENARIOS
+
+class Command(BaseCommand):
+    help = "Seeds benchmark data and drives the real API routes with concurrent clients."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS), help='Scenario to run (repeatable). Defaults to all.')
+        parser.add_argument('--concurrency', type=int, default=16)
+        parser.add_argument('--iterations', type=int, default=500, help='Requests per polling scenario.')
+        parser.add_argument('--students', type=int, default=200, help='Students seeded; each makes one attempt in booking_contention.')
+        parser.add_argument('--contended-quantity', type=int, default=5)
+        parser.add_argument('--label', default='run')
+        parser.add_argument('--output', help='Results file. Defaults to benchmarks/results/<label>-<timestamp>.json')
+        parser.add_argument('--baseline', help='Previous results file to compare against.')
+        parser.add_argument('--tolerance', type=float, default=0.2, help='Allowed p95/throughput regression against the baseline (0.2 = 20%%).')
+
+    def handle(self, *args, **options):
+        call_command('migrate', verbosity=0)
+
+        self.stdout.write("Seeding benchmark data...")
+        data = seed_bench_data(
+            students=options['students'],
+            contended_quantity=options['contended_quantity'],
+        )
+
+        results = []
+        for name in options['scenario'] or list(SCENARIOS):
+            self.stdout.write(f"Running {name}...")
+            result = SCENARIOS[name](data, options['concurrency'], options['iterations']).summary()
+            results.append(result)
+            self.print_result(result)
+
+        report = {
+            "label": options['label'],
+            "created_at": timezone.now().isoformat(),
+            "environment": self.environment(),
+            "options": {key: options[key] for key in ('concurrency', 'iterations', 'students', 'contended_quantity')},
+            "scenarios": results,
+        }
+
+        output = Path(options['output'] or settings.BASE_DIR / "benchmarks" / "results" /
+                      f"{options['label']}-{timezone.now():%Y%m%d-%H%M%S}.json")
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, indent=2))
+        self.stdout.write(self.style.SUCCESS(f"Results written to {output}"))
+
+        if options['baseline']:
+            regressions = self.compare(report, json.loads(Path(options['baseline']).read_text()), options['tolerance'])
+            if regressions:
+                raise CommandError(f"{regressions} metric(s) regressed beyond {options['tolerance']:.0%} of the baseline.")
+
+        if any(r.get("overbooked") for r in results):
+            raise CommandError("booking_contention overbooked the contended slot.")
+
+    def environment(self):
+        try:
+            commit = subprocess.run(
+                ["git", "rev-parse", "--short", "HEAD"], cwd=settings.BASE_DIR,
+                capture_output=True, text=True, check=False
+            ).stdout.strip()
+        except OSError:
+            commit = ""
+        return {
+            "git_commit": commit,
+            "database": connection.vendor,
+            "python": platform.python_version(),
+            "django": django.get_version(),
+        }
+
+    def print_result(self, result):
+        latency = result["latency_ms"]
+        self.stdout.write(
+            f"  {result['requests']} requests, {result['throughput_rps']} req/s, "
+            f"p50={latency['p50']}ms p95={latency['p95']}ms p99={latency['p99']}ms, "
+            f"{result['queries_per_request']['mean']} queries/request, status={result['status_counts']}"
+        )
+        if "booked_quantity" in result:
+            self.stdout.write(f"  booked {result['booked_quantity']}/{result['capacity']} seats")
+
+    def compare(self, report, baseline, tolerance):
+        previous = {scenario["name"]: scenario for scenario in baseline.get("scenarios", [])}
+        regressions = 0
+        self.stdout.write(f"Compared with baseline '{baseline.get('label')}' ({baseline.get('created_at')}):")
+        for current in report["scenarios"]:
+            before = previous.get(current["name"])
+            if before is None:
+                continue
+            checks = [
+                ("p95", before["latency_ms"]["p95"], current["latency_ms"]["p95"], True),
+                ("throughput", before["throughput_rps"], current["throughput_rps"], False),
+                ("queries", before["queries_per_request"]["mean"], current["queries_per_request"]["mean"], True),
+            ]
+            for metric, old, new, lower_is_better in checks:
+                change = (new - old) / old if old else 0.0
+                worse = change > tolerance if lower_is_better else change < -tolerance
+                regressions += worse
+                line = f"  {current['name']:<22} {metric:<10} {old:>10} -> {new:<10} ({change:+.1%})"
+                self.stdout.write(self.style.ERROR(line) if worse else line)
+        return regressions
@@ -0,0 +1,110 @@
+import queue
+import threading
+import time
+
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from rest_framework_simplejwt.tokens import RefreshToken
+
+def auth_client(user):
+    """
+    Test client authenticated with a freshly minted access token, so the
+    benchmark exercises JWT authentication without going through login.
+    """
+    token = RefreshToken.for_user(user).access_token
+    return Client(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+class ScenarioResult:
+    def __init__(self, name, concurrency):
+        self.name = name
+        self.concurrency = concurrency
+        self.latencies = []
+        self.queries = []
+        self.status_counts = {}
+        self.wall_time = 0.0
+        self.extra = {}
+        self._lock = threading.Lock()
+
+    def record(self, latency, status_code, query_count):
+        with self._lock:
+            self.latencies.append(latency)
+            self.queries.append(query_count)
+            key = str(status_code)
+            self.status_counts[key] = self.status_counts.get(key, 0) + 1
+
+    def summary(self):
+        latencies = sorted(self.latencies)
+        count = len(latencies)
+        return {
+            "name": self.name,
+            "concurrency": self.concurrency,
+            "requests": count,
+            "wall_time_s": round(self.wall_time, 4),
+            "throughput_rps": round(count / self.wall_time, 2) if self.wall_time else 0.0,
+            "latency_ms": {
+                "mean": round(sum(latencies) / count * 1000, 3) if count else 0.0,
+                "p50": round(percentile(latencies, 50) * 1000, 3),
+                "p95": round(percentile(latencies, 95) * 1000, 3),
+                "p99": round(percentile(latencies, 99) * 1000, 3),
+                "max": round(latencies[-1] * 1000, 3) if count else 0.0,
+            },
+            "queries_per_request": {
+                "mean": round(sum(self.queries) / count, 2) if count else 0.0,
+                "max": max(self.queries) if count else 0,
+            },
+            "status_counts": self.status_counts,
+            **self.extra,
+        }
+
+def run_concurrently(name, tasks, concurrency):
+    """
+    Runs `tasks` (a list of (user, callable) pairs) on `concurrency` threads.
+    Each callable receives an authenticated client and returns a response.
+    Latency and query count are measured per request on the worker thread.
+    """
+    result = ScenarioResult(name, concurrency)
+    pending = queue.SimpleQueue()
+    for task in tasks:
+        pending.put(task)
+    errors = []
+
+    def worker():
+        clients = {}
+        try:
+            while True:
+                try:
+                    user, call = pending.get_nowait()
+                except queue.Empty:
+                    return
+                client = clients.get(user.pk)
+                if client is None:
+                    client = clients[user.pk] = auth_client(user)
+                with CaptureQueriesContext(connection) as ctx:
+                    start = time.perf_counter()
+                    response = call(client)
+                    latency = time.perf_counter() - start
+                result.record(latency, response.status_code, len(ctx.captured_queries))
+        except Exception as exc:
+            errors.append(exc)
+        finally:
+            # Each worker thread owns its own DB connection
+            connection.close()
+
+    threads = [threading.Thread(target=worker, name=f"bench-{name}-{i}") for i in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    result.wall_time = time.perf_counter() - start
+
+    if errors:
+        raise errors[0]
+    return result
@@ -0,0 +1,78 @@
+import datetime
+
+from django.db.models import Sum
+
+from apps.bookings.models import Booking
+from benchmarks.runner import run_concurrently
+
+def booking_contention(data, concurrency, iterations):
+    """
+    Every student races for the same slot on the contended resource, which
+    only has `total_quantity` seats. Verifies the capacity check held.
+    """
+    slot = datetime.time(9, 0)
+    Booking.objects.filter(resource=data.contended).delete()
+    payload = {
+        "resource_id": data.contended.id,
+        "booking_date": data.booking_date.isoformat(),
+        "start_time": slot.strftime("%H:%M"),
+        "quantity_requested": 1,
+    }
+
+    def book(client):
+        return client.post("/api/v1/bookings/create/", payload, content_type="application/json")
+
+    result = run_concurrently("booking_contention", [(student, book) for student in data.students], concurrency)
+
+    booked = Booking.objects.filter(
+        resource=data.contended,
+        booking_date=data.booking_date,
+        start_time=slot,
+        status__in=["PENDING", "APPROVED"],
+    ).aggregate(total=Sum("quantity_requested"))["total"] or 0
+    result.extra["capacity"] = data.contended.total_quantity
+    result.extra["booked_quantity"] = booked
+    result.extra["overbooked"] = booked > data.contended.total_quantity
+    return result
+
+def availability_polling(data, concurrency, iterations):
+    """
+    Students poll the availability grid of every polled resource for the
+    benchmark week, like a timetable screen refreshing.
+    """
+    dates = [data.booking_date + datetime.timedelta(days=offset) for offset in range(5)]
+    tasks = []
+    for i in range(iterations):
+        student = data.students[i % len(data.students)]
+        resource = data.polled[i % len(data.polled)]
+        url = f"/api/v1/resources/{resource.id}/availability/?date={dates[i % len(dates)].isoformat()}"
+        tasks.append((student, lambda client, url=url: client.get(url)))
+    return run_concurrently("availability_polling", tasks, concurrency)
+
+def admin_statistics(data, concurrency, iterations):
+    """
+    Admin dashboard loads cycling through the supported ranges.
+    """
+    ranges = ["TODAY", "THIS_WEEK", "THIS_MONTH", "ALL_TIME"]
+    tasks = [
+        (data.admin, lambda client, r=ranges[i % len(ranges)]: client.get(f"/api/v1/statistics/?range={r}"))
+        for i in range(iterations)
+    ]
+    return run_concurrently("admin_statistics", tasks, concurrency)
+
+def notification_reads(data, concurrency, iterations):
+    """
+    Students repeatedly fetching their notification list.
+    """
+    tasks = [
+        (data.students[i % len(data.students)], lambda client: client.get("/api/v1/notifications/"))
+        for i in range(iterations)
+    ]
+    return run_concurrently("notification_reads", tasks, concurrency)
+
+SCENARIOS = {
+    "booking_contention": booking_contention,
+    "availability_polling": availability_polling,
+    "admin_statistics": admin_statistics,
+    "notification_reads": notification_reads,
+}
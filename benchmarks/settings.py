@@ -0,0 +1,40 @@
+"""
+Settings for the load-test benchmark suite.
+
+    python manage.py run_benchmarks --settings=benchmarks.settings
+
+Uses a throwaway SQLite file by default. Set BENCH_DATABASE=mysql to run
+against the MySQL server configured in .env, using BENCH_DB_NAME
+(default: <DB_NAME>_bench) so the development database is left alone.
+"""
+from config.settings.base import *
+
+INSTALLED_APPS = INSTALLED_APPS + ["benchmarks"]
+
+DEBUG = False
+ALLOWED_HOSTS = ["*"]
+
+if config('BENCH_DATABASE', default='sqlite') == 'mysql':
+    DATABASES['default']['NAME'] = config('BENCH_DB_NAME', default=f"{DATABASES['default']['NAME']}_bench")
+else:
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": config('BENCH_SQLITE_PATH', default=str(BASE_DIR / "benchmarks" / "bench.sqlite3")),
+            "OPTIONS": {
+                # Serialise writers up front instead of failing with "database is locked"
+                "timeout": 30,
+                "transaction_mode": "IMMEDIATE",
+            },
+        }
+    }
+
+# Seeding hashes a single password; keep it cheap
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+# Profiling every request would skew the numbers being measured
+PERF_INSTRUMENTATION_ENABLED = False
+QUERY_BUDGET_ENABLED = False
+
+# The scenarios poll far harder than any real client is allowed to
+REST_FRAMEWORK = {**REST_FRAMEWORK, "DEFAULT_THROTTLE_CLASSES": ()}
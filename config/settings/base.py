@@ -37,10 +37,12 @@ INSTALLED_APPS = [
     "apps.bookings",
     "apps.notifications",
     "apps.audit",
+    "core",
 ]
 
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",  # Must be before CommonMiddleware
+    "core.middleware.PerformanceInstrumentationMiddleware",  # Early so total time covers the whole stack
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -49,6 +51,8 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "core.middleware.AuditLogMiddleware",  # Custom audit middleware at the end
+    "core.middleware.IdempotencyMiddleware",  # Replays retried POSTs before the view runs
+    "core.middleware.QueryBudgetMiddleware",  # Last, so only the view's own queries are counted
 ]
 
 ROOT_URLCONF = "config.urls"
@@ -137,6 +141,15 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
     ),
+    "DEFAULT_RENDERER_CLASSES": (
+        "core.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "core.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
     "DEFAULT_PAGINATION_CLASS": "core.pagination.StandardResultsSetPagination",
     "PAGE_SIZE": 20,
     "DEFAULT_FILTER_BACKENDS": (
@@ -144,10 +157,28 @@ REST_FRAMEWORK = {
         "rest_framework.filters.SearchFilter",
         "rest_framework.filters.OrderingFilter",
     ),
+    # Only views that set throttle_scope are throttled (core.throttling)
+    "DEFAULT_THROTTLE_CLASSES": (
+        "core.throttling.ScopedTokenBucketThrottle",
+    ),
+    "DEFAULT_THROTTLE_RATES": {
+        "booking_create": config('THROTTLE_BOOKING_CREATE', default='20/min'),
+        "availability": config('THROTTLE_AVAILABILITY', default='120/min'),
+        "notifications": config('THROTTLE_NOTIFICATIONS', default='60/min'),
+    },
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "EXCEPTION_HANDLER": "core.response.custom_exception_handler",
 }
 
+# Cache; throttle buckets live here, so point every worker at the same
+# Redis/Memcached server in production (e.g. django.core.cache.backends.redis.RedisCache)
+CACHES = {
+    "default": {
+        "BACKEND": config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        "LOCATION": config('CACHE_LOCATION', default='campus-reshub'),
+    }
+}
+
 # Simple JWT
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=config('JWT_ACCESS_LIFETIME_MINUTES', default=60, cast=int)),
@@ -165,6 +196,62 @@ SIMPLE_JWT = {
 CORS_ALLOWED_ORIGINS = config('CORS_ALLOWED_ORIGINS', default="", cast=Csv())
 CORS_ALLOW_CREDENTIALS = True
 
+# Performance instrumentation (core.middleware.PerformanceInstrumentationMiddleware)
+PERF_INSTRUMENTATION_ENABLED = config('PERF_INSTRUMENTATION_ENABLED', default=True, cast=bool)
+PERF_SAMPLE_RATE = config('PERF_SAMPLE_RATE', default=0.05, cast=float)
+PERF_SLOW_REQUEST_MS = config('PERF_SLOW_REQUEST_MS', default=500, cast=int)
+PERF_SLOW_QUERY_LOG_COUNT = config('PERF_SLOW_QUERY_LOG_COUNT', default=5, cast=int)
+
+# Per-view query budgets (core.middleware.QueryBudgetMiddleware). None enforces
+# them under DEBUG and for test client requests.
+QUERY_BUDGET_ENABLED = None
+QUERY_BUDGET_REPEAT_LIMIT = config('QUERY_BUDGET_REPEAT_LIMIT', default=2, cast=int)
+
+# Prometheus metrics (core.views.MetricsView); set PROMETHEUS_MULTIPROC_DIR under gunicorn.
+# Scraper addresses allowed without a login; empty means admin users only. Behind a
+# reverse proxy on the same host every request comes from 127.0.0.1, so don't list it there.
+METRICS_ALLOWED_IPS = config('METRICS_ALLOWED_IPS', default='', cast=Csv())
+
+# Booking holds (apps.bookings): how long a held slot stays reserved
+BOOKING_HOLD_SECONDS = config('BOOKING_HOLD_SECONDS', default=300, cast=int)
+
+# Pending bookings nobody reviewed expire this many hours before their slot
+# starts (0 = at slot start); Resource.pending_expiry_hours overrides it
+BOOKING_PENDING_EXPIRY_HOURS = config('BOOKING_PENDING_EXPIRY_HOURS', default=0, cast=int)
+
+# iCalendar feeds (apps.bookings.feeds): how far back they reach, and how long
+# a rendered feed is cached (it is also replaced as soon as a booking changes)
+BOOKING_FEED_PAST_DAYS = config('BOOKING_FEED_PAST_DAYS', default=30, cast=int)
+BOOKING_FEED_CACHE_SECONDS = config('BOOKING_FEED_CACHE_SECONDS', default=86400, cast=int)
+
+# Bookings dated further back than this move to bookings_archive (archive_bookings command)
+BOOKING_ARCHIVE_AFTER_DAYS = config('BOOKING_ARCHIVE_AFTER_DAYS', default=90, cast=int)
+
+# Soft-deleted users and resources move to users_archive/resources_archive
+# this many days after deletion (compact_soft_deleted command)
+SOFT_DELETE_COMPACT_AFTER_DAYS = config('SOFT_DELETE_COMPACT_AFTER_DAYS', default=30, cast=int)
+
+# Notification retention (apps.notifications.services.purgeable_notifications):
+# days to keep per message type once read / while unread, "default" for the
+# other types, None to keep forever. Purged rows are tallied per user in
+# notification_summaries when NOTIFICATION_RETENTION_SUMMARIZE is on.
+NOTIFICATION_RETENTION_DAYS = {
+    "GENERAL": {"read": 90, "unread": 180},
+    "default": {"read": 180, "unread": 365},
+}
+NOTIFICATION_RETENTION_SUMMARIZE = config('NOTIFICATION_RETENTION_SUMMARIZE', default=True, cast=bool)
+
+# Idempotency-Key replay window (core.middleware.IdempotencyMiddleware)
+IDEMPOTENCY_KEY_TTL_SECONDS = config('IDEMPOTENCY_KEY_TTL_SECONDS', default=86400, cast=int)
+
+# Background jobs (core.jobs, `manage.py runworker`)
+JOB_RETRY_BACKOFF_SECONDS = config('JOB_RETRY_BACKOFF_SECONDS', default=30, cast=int)
+# A RUNNING job older than this is assumed to have lost its worker and is re-queued
+JOB_LEASE_SECONDS = config('JOB_LEASE_SECONDS', default=900, cast=int)
+JOB_RETENTION_DAYS = config('JOB_RETENTION_DAYS', default=7, cast=int)
+# Per-job cron overrides, e.g. {"bookings.archive": "0 2 * * 0"}; None disables a schedule
+JOB_SCHEDULES = {}
+
 # Spectacular
 SPECTACULAR_SETTINGS = {
     "TITLE": "Campus ResHub API",
@@ -1,3 +1,6 @@
 from .base import *
 
 DEBUG = True
+
+# Profile every request locally
+PERF_SAMPLE_RATE = 1.0
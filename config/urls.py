@@ -2,6 +2,7 @@ from django.contrib import admin
 from django.urls import path, include
 from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView
 from rest_framework_simplejwt.views import TokenRefreshView
+from core.views import MetricsView, PerformanceStatsView
 
 urlpatterns = [
     path("admin/", admin.site.urls),
@@ -12,6 +13,8 @@ urlpatterns = [
     path("api/v1/", include("apps.bookings.urls")),
     path("api/v1/", include("apps.notifications.urls")),
     path("api/v1/", include("apps.audit.urls")),
+    path("api/v1/performance/", PerformanceStatsView.as_view(), name="performance-stats"),
+    path("metrics/", MetricsView.as_view(), name="metrics"),
     
     # Auth Token Refresh (Global) - also in accounts but good to have dedicated or reused
     # We put it in accounts urls as 'auth/token/refresh/' which is fine.
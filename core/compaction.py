@@ -0,0 +1,70 @@
+"""
+Compaction of soft-deleted rows: SoftDeleteMixin only flags rows, so
+tombstones stay in the live table (and its indexes) forever. These helpers
+move rows that have been deleted for long enough into an archive table with
+the same ids and drop them from the live one.
+
+A row is only moved when nothing that must stay resolvable still points at
+it. Each caller lists the relations that may go with the row (`disposable`,
+as model labels); relations without a database constraint (the archive
+tables) never block. Every other reverse relation with a row keeps it in
+place until that row is gone, e.g. archived by archive_bookings.
+"""
+import datetime
+
+from django.db import connection, transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+def blocking_relations(model, disposable):
+    return [
+        rel for rel in model._meta.related_objects
+        if rel.field.db_constraint and rel.related_model._meta.label not in disposable
+    ]
+
+def compactable(model, older_than_days, disposable, now=None):
+    """
+    Soft-deleted rows of `model` deleted more than `older_than_days` ago
+    that no blocking relation refers to.
+    """
+    cutoff = (now or timezone.now()) - datetime.timedelta(days=older_than_days)
+    rows = model._base_manager.filter(is_deleted=True, deleted_at__lt=cutoff)
+    for rel in blocking_relations(model, disposable):
+        rows = rows.exclude(Exists(rel.related_model._base_manager.filter(**{rel.field.name: OuterRef("pk")})))
+    return rows
+
+def compact_batch(model, archive_model, older_than_days, batch_size, disposable, before_delete=None):
+    """
+    Copies up to `batch_size` compactable rows, lowest ids first, into
+    `archive_model` and deletes them (cascading to the disposable relations)
+    in one transaction. `before_delete(ids)` runs inside it, just before the
+    delete. Returns the number moved; 0 means there is nothing left.
+    """
+    with transaction.atomic():
+        ids = list(
+            compactable(model, older_than_days, disposable)
+            .select_for_update().order_by("id").values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            return 0
+        rows = model._base_manager.filter(id__in=ids).values(*archive_model.COPIED_FIELDS)
+        archive_model.objects.bulk_create([archive_model(**row) for row in rows], ignore_conflicts=True)
+        if before_delete is not None:
+            before_delete(ids)
+        model._base_manager.filter(id__in=ids).delete()
+    return len(ids)
+
+def rebuild_indexes(model):
+    """
+    Rebuilds the table's indexes so they stop carrying the space of the
+    removed rows. On MySQL, OPTIMIZE TABLE rebuilds an InnoDB table online.
+    """
+    table = connection.ops.quote_name(model._meta.db_table)
+    with connection.cursor() as cursor:
+        if connection.vendor == "mysql":
+            cursor.execute(f"OPTIMIZE TABLE {table}")
+            cursor.fetchall()
+        elif connection.vendor == "postgresql":
+            cursor.execute(f"REINDEX TABLE {table}")
+        elif connection.vendor == "sqlite":
+            cursor.execute(f"REINDEX {table}")
@@ -0,0 +1,72 @@
+import functools
+import hashlib
+
+from django.db.models import Count, Max
+from django.http import HttpResponseNotModified
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+def queryset_version(queryset, *timestamp_fields):
+    """
+    Cheap version of a collection: one aggregate returning the row count and
+    the latest value of each timestamp field (which may span relations, e.g.
+    'managed_by__updated_at'). Any insert, delete or timestamped update
+    changes it.
+    """
+    aggregates = {f"latest_{i}": Max(field) for i, field in enumerate(timestamp_fields)}
+    result = queryset.order_by().aggregate(count=Count('pk'), **aggregates)
+    return [result['count']] + [result[f"latest_{i}"] for i in range(len(timestamp_fields))]
+
+def make_etag(request, version):
+    """
+    Strong ETag over the request URL, the negotiated format and `version`.
+    """
+    source = repr((request.get_full_path(), request.META.get('HTTP_ACCEPT', ''), version))
+    return quote_etag(hashlib.md5(source.encode()).hexdigest())
+
+def set_cache_headers(response, etag, last_modified=None):
+    """
+    Validators plus Cache-Control for authenticated data: clients may keep a
+    private copy but must revalidate it on every use.
+    """
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    patch_cache_control(response, private=True, no_cache=True)
+    patch_vary_headers(response, ('Authorization',))
+    return response
+
+def conditional(method):
+    """
+    Decorator for DRF GET handlers (get/list/retrieve). The view's
+    `get_cache_validators(request, *args, **kwargs)` returns
+    (version, last_modified), or None to skip conditional handling. A
+    matching If-None-Match / If-Modified-Since returns 304 before the handler
+    runs, so nothing is serialized.
+
+    Collections should return last_modified=None: deleting a row can make the
+    newest timestamp go backwards, so only the ETag is reliable for them.
+    """
+    @functools.wraps(method)
+    def wrapper(self, request, *args, **kwargs):
+        validators = self.get_cache_validators(request, *args, **kwargs)
+        if validators is None:
+            return method(self, request, *args, **kwargs)
+
+        version, last_modified = validators
+        etag = make_etag(request, version)
+        response = get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=int(last_modified.timestamp()) if last_modified else None,
+        )
+        if response is not None:
+            if isinstance(response, HttpResponseNotModified):
+                set_cache_headers(response, etag, last_modified)
+            return response
+
+        response = method(self, request, *args, **kwargs)
+        if response.status_code == 200:
+            set_cache_headers(response, etag, last_modified)
+        return response
+    return wrapper
@@ -0,0 +1,68 @@
+FIELDS = (
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day of month", 1, 31),
+    ("month", 1, 12),
+    ("day of week", 0, 6),
+)
+
+def _parse_field(text, name, low, high):
+    values = set()
+    for part in text.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            if not step_text.isdigit() or int(step_text) == 0:
+                raise ValueError(f"Bad step in cron {name} field: {text!r}")
+            step = int(step_text)
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start_text, end_text = part.split("-", 1)
+            if not (start_text.isdigit() and end_text.isdigit()):
+                raise ValueError(f"Bad range in cron {name} field: {text!r}")
+            start, end = int(start_text), int(end_text)
+        elif part.isdigit():
+            start = end = int(part)
+            if step != 1:
+                end = high
+        else:
+            raise ValueError(f"Bad cron {name} field: {text!r}")
+        if not (low <= start <= end <= high):
+            raise ValueError(f"Cron {name} field out of range {low}-{high}: {text!r}")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+class CronSchedule:
+    """
+    A standard five-field cron expression ("*/5 * * * *"): minute, hour, day
+    of month, month and day of week (0 = Sunday). Fields accept `*`, numbers,
+    ranges, lists and `/step`. As in cron, when both day fields are
+    restricted a day matching either one fires.
+    """
+    def __init__(self, expression):
+        parts = expression.split()
+        if len(parts) != 5:
+            raise ValueError(f"Cron expression needs 5 fields, got {expression!r}")
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, self.weekdays = (
+            _parse_field(part, name, low, high) for part, (name, low, high) in zip(parts, FIELDS)
+        )
+        self.any_day = parts[2] == "*"
+        self.any_weekday = parts[4] == "*"
+
+    def matches(self, moment):
+        """
+        Whether the schedule fires in the minute containing `moment`.
+        """
+        if moment.minute not in self.minutes or moment.hour not in self.hours or moment.month not in self.months:
+            return False
+        day = moment.day in self.days
+        # Python's Monday=0 to cron's Sunday=0
+        weekday = (moment.weekday() + 1) % 7 in self.weekdays
+        if self.any_day or self.any_weekday:
+            return day and weekday
+        return day or weekday
+
+    def __repr__(self):
+        return f"CronSchedule({self.expression!r})"
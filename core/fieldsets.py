@@ -0,0 +1,162 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+class Fieldset:
+    """
+    The fields a client asked for with `?fields=a,b,c` and the relations it
+    wants rendered in full with `?expand=x,y`.
+
+    Without `fields` everything is rendered as before. With `fields`, nested
+    relations come back as primary keys unless they are also listed in
+    `expand`.
+    """
+    def __init__(self, fields=None, expand=()):
+        self.fields = frozenset(fields) if fields is not None else None
+        self.expand = frozenset(expand)
+
+    @classmethod
+    def from_request(cls, request):
+        params = request.query_params
+        fields = params.get('fields')
+        return cls(
+            fields=[f.strip() for f in fields.split(',') if f.strip()] if fields else None,
+            expand=[f.strip() for f in params.get('expand', '').split(',') if f.strip()],
+        )
+
+    @property
+    def is_sparse(self):
+        return self.fields is not None
+
+    def includes(self, name):
+        return self.fields is None or name in self.fields
+
+    def expands(self, name):
+        return self.fields is None or name in self.expand
+
+    def key(self):
+        if self.fields is None:
+            return None
+        return (self.fields, self.expand & self.fields)
+
+def _nested_serializer(field):
+    """
+    Returns (serializer, many) for a nested ModelSerializer field, or (None, False).
+    """
+    if isinstance(field, serializers.ListSerializer) and isinstance(field.child, serializers.ModelSerializer):
+        return field.child, True
+    if isinstance(field, serializers.ModelSerializer):
+        return field, False
+    return None, False
+
+class DynamicFieldsMixin:
+    """
+    ModelSerializer mixin that drops the fields the request's Fieldset leaves
+    out and collapses unexpanded nested serializers to primary keys.
+
+    The fieldset comes from the `fieldset` kwarg or the serializer context;
+    serializers built without either render every field.
+    """
+    def __init__(self, *args, **kwargs):
+        fieldset = kwargs.pop('fieldset', None)
+        super().__init__(*args, **kwargs)
+        fieldset = fieldset or self.context.get('fieldset')
+        if fieldset is None or not fieldset.is_sparse:
+            return
+
+        for name in list(self.fields):
+            field = self.fields[name]
+            if not fieldset.includes(name):
+                self.fields.pop(name)
+                continue
+            nested, many = _nested_serializer(field)
+            if nested is not None and not fieldset.expands(name):
+                kwargs = {'source': field.source} if field.source != name else {}
+                self.fields[name] = serializers.PrimaryKeyRelatedField(many=many, read_only=True, **kwargs)
+
+def trim_queryset(queryset, serializer_class, fieldset):
+    """
+    Narrows `queryset` to what `serializer_class` will read under `fieldset`:
+    select_related/prefetch_related for expanded relations, and only() on the
+    selected columns when every selected field maps onto a model field.
+    """
+    columns, select, prefetch = _plan(queryset.model, serializer_class, fieldset, "")
+    if select:
+        queryset = queryset.select_related(*select)
+    if prefetch:
+        queryset = queryset.prefetch_related(*prefetch)
+    if columns is not None:
+        queryset = queryset.only(*columns)
+    return queryset
+
+def _plan(model, serializer_class, fieldset, prefix):
+    # columns is None when a field can't be mapped to a column (method
+    # fields, properties); those serializers load the full row.
+    columns, select, prefetch = [], [], []
+    for name, field in serializer_class().fields.items():
+        if field.write_only or (fieldset is not None and not fieldset.includes(name)):
+            continue
+        source = field.source
+        try:
+            model_field = model._meta.get_field(source)
+        except FieldDoesNotExist:
+            columns = None
+            continue
+
+        nested, many = _nested_serializer(field)
+        expanded = nested is not None and (fieldset is None or fieldset.expands(name))
+        if many:
+            related = model_field.related_model
+            if expanded:
+                child_columns, _, _ = _plan(related, type(nested), None, "")
+                child = related._default_manager.all()
+                if child_columns is not None:
+                    child = child.only(model_field.field.name, *child_columns)
+            else:
+                child = related._default_manager.only("pk", model_field.field.name)
+            prefetch.append(Prefetch(prefix + source, queryset=child))
+        elif expanded:
+            nested_columns, nested_select, nested_prefetch = _plan(
+                model_field.related_model, type(nested), None, prefix + source + "__"
+            )
+            select.append(prefix + source)
+            select.extend(nested_select)
+            prefetch.extend(nested_prefetch)
+            if columns is not None:
+                if nested_columns is None:
+                    columns = None
+                else:
+                    columns.append(source)
+                    columns.extend(source + "__" + column for column in nested_columns)
+        elif columns is not None and model_field.concrete:
+            columns.append(source)
+    return columns, select, prefetch
+
+class SparseFieldsetMixin:
+    """
+    View mixin for `?fields=` / `?expand=`. It passes the request's Fieldset to
+    the serializer, restricts the view's projection, and trims the queryset
+    on read requests.
+    """
+    @property
+    def fieldset(self):
+        if not hasattr(self, '_fieldset'):
+            self._fieldset = Fieldset.from_request(self.request)
+        return self._fieldset
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.request.method in SAFE_METHODS:
+            context['fieldset'] = self.fieldset
+        return context
+
+    def get_projection(self):
+        return super().get_projection().restrict(self.fieldset)
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        # Projections pick their own columns; writes need the full row
+        if self.request.method not in SAFE_METHODS or getattr(self, 'projection', None) is not None:
+            return queryset
+        return trim_queryset(queryset, self.get_serializer_class(), self.fieldset)
@@ -0,0 +1,178 @@
+"""
+A small iCalendar (RFC 5545) reader and writer. The reader turns the
+VEVENTs of an exported academic calendar into date ranges (times are
+dropped; an event covers the calendar days it touches). The writer renders
+booking feeds for calendar apps.
+"""
+import datetime
+import re
+
+_DURATION = re.compile(r"^P(?:(\d+)W|(?:(\d+)D)?(?:T.*)?)$")
+_ESCAPES = {"n": "\n", "N": "\n", ",": ",", ";": ";", "\\": "\\"}
+
+class ICalError(ValueError):
+    def __init__(self, message, line=None):
+        super().__init__(f"Line {line}: {message}" if line else message)
+        self.line = line
+
+def unfold(text):
+    """
+    Yields (line number, content line) with folded continuation lines
+    joined back on.
+    """
+    current, start = None, 0
+    for number, line in enumerate(text.splitlines(), 1):
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+        if current is not None:
+            yield start, current
+        current, start = line, number
+    if current:
+        yield start, current
+
+def parse_line(line, number):
+    """
+    "DTSTART;VALUE=DATE:20250101" -> ("DTSTART", {"VALUE": "DATE"}, "20250101")
+    """
+    head, sep, value = line.partition(":")
+    if not sep:
+        raise ICalError(f"Expected NAME:VALUE, got {line!r}", number)
+    name, *params = head.split(";")
+    return name.upper(), dict(param.upper().split("=", 1) for param in params if "=" in param), value
+
+def unescape(value):
+    return re.sub(r"\\(.)", lambda match: _ESCAPES.get(match.group(1), match.group(1)), value)
+
+def parse_date(value, params, number):
+    """
+    A DATE value as a date, a DATE-TIME as a naive datetime (the zone is
+    irrelevant for whole days).
+    """
+    try:
+        if params.get("VALUE") == "DATE" or len(value) == 8:
+            return datetime.datetime.strptime(value, "%Y%m%d").date()
+        return datetime.datetime.strptime(value.rstrip("Z"), "%Y%m%dT%H%M%S")
+    except ValueError:
+        raise ICalError(f"Invalid date {value!r}", number) from None
+
+def parse_duration_days(value, number):
+    match = _DURATION.match(value)
+    if not match:
+        raise ICalError(f"Unsupported DURATION {value!r}", number)
+    weeks, days = match.groups()
+    return int(weeks or 0) * 7 + int(days or 0)
+
+def parse_events(text):
+    """
+    The VEVENTs in `text` as dicts with start and end (inclusive dates),
+    summary, description, categories (upper-cased) and the line the event
+    starts on. Raises ICalError for malformed input and for recurring
+    events, which would need expanding.
+    """
+    events, event = [], None
+    for number, line in unfold(text):
+        if not line.strip():
+            continue
+        name, params, value = parse_line(line, number)
+        if name == "BEGIN" and value.upper() == "VEVENT":
+            event = {"line": number, "summary": "", "description": "", "categories": []}
+        elif name == "END" and value.upper() == "VEVENT":
+            if event is None or "start" not in event:
+                raise ICalError("VEVENT without DTSTART", number)
+            events.append(finish_event(event))
+            event = None
+        elif event is None:
+            continue
+        elif name == "DTSTART":
+            event["start"] = parse_date(value, params, number)
+        elif name == "DTEND":
+            event["end"] = parse_date(value, params, number)
+        elif name == "DURATION":
+            event["duration_days"] = parse_duration_days(value, number)
+        elif name in ("RRULE", "RDATE"):
+            raise ICalError("Recurring events are not supported; export them expanded", number)
+        elif name == "SUMMARY":
+            event["summary"] = unescape(value)
+        elif name == "DESCRIPTION":
+            event["description"] = unescape(value)
+        elif name == "CATEGORIES":
+            event["categories"] += [unescape(item).strip().upper() for item in value.split(",")]
+    if event is not None:
+        raise ICalError("Unterminated VEVENT", event["line"])
+    return events
+
+def finish_event(event):
+    start = event.pop("start")
+    end = event.pop("end", None)
+    duration_days = event.pop("duration_days", None)
+    start_date = start.date() if isinstance(start, datetime.datetime) else start
+    # DTEND and DURATION run up to but not including the end
+    if end is None and duration_days is not None:
+        end_date = start_date + datetime.timedelta(days=max(duration_days - 1, 0))
+    elif end is None:
+        end_date = start_date
+    elif not isinstance(end, datetime.datetime):
+        end_date = max(end - datetime.timedelta(days=1), start_date)
+    elif end.time() == datetime.time(0) and end.date() > start_date:
+        end_date = end.date() - datetime.timedelta(days=1)
+    else:
+        end_date = end.date()
+    if end_date < start_date:
+        raise ICalError("Event ends before it starts", event["line"])
+    return {**event, "start": start_date, "end": end_date}
+
+def escape(text):
+    return (
+        str(text).replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+        .replace("\r\n", "\\n").replace("\n", "\\n")
+    )
+
+def fold(line):
+    """
+    Splits a content line into 75-octet pieces joined by CRLF + space, as
+    RFC 5545 requires, without cutting a UTF-8 character in half.
+    """
+    pieces, current, size = [], "", 0
+    for char in line:
+        width = len(char.encode())
+        if size + width > 75:
+            pieces.append(current)
+            current, size = " ", 1
+        current += char
+        size += width
+    pieces.append(current)
+    return "\r\n".join(pieces) + "\r\n"
+
+def format_utc(moment):
+    return moment.astimezone(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+def render_calendar(name, events):
+    """
+    Yields an iCalendar document line by line, so it can be streamed.
+    `events` is an iterable of dicts with uid, start, end, stamp (aware
+    datetimes), summary, and optionally location, description and status.
+    """
+    yield "BEGIN:VCALENDAR\r\n"
+    yield "VERSION:2.0\r\n"
+    yield "PRODID:-//Campus ResHub//Bookings//EN\r\n"
+    yield "CALSCALE:GREGORIAN\r\n"
+    yield "METHOD:PUBLISH\r\n"
+    yield fold(f"X-WR-CALNAME:{escape(name)}")
+    for event in events:
+        lines = [
+            "BEGIN:VEVENT",
+            f"UID:{event['uid']}",
+            f"DTSTAMP:{format_utc(event['stamp'])}",
+            f"DTSTART:{format_utc(event['start'])}",
+            f"DTEND:{format_utc(event['end'])}",
+            f"SUMMARY:{escape(event['summary'])}",
+        ]
+        for key in ("location", "description"):
+            if event.get(key):
+                lines.append(f"{key.upper()}:{escape(event[key])}")
+        if event.get("status"):
+            lines.append(f"STATUS:{event['status']}")
+        lines.append("END:VEVENT")
+        yield "".join(fold(line) for line in lines)
+    yield "END:VCALENDAR\r\n"
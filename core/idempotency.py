@@ -0,0 +1,125 @@
+import datetime
+import hashlib
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.http import HttpResponse
+from django.utils import timezone
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from core.metrics import IDEMPOTENCY_REQUESTS
+from core.models import IdempotencyKey
+from core.renderers import FastJSONRenderer
+
+HEADER = 'HTTP_IDEMPOTENCY_KEY'
+MUTATING_METHODS = ('POST', 'PUT', 'PATCH', 'DELETE')
+MAX_KEY_LENGTH = 255
+
+def token_user_id(request):
+    """
+    The user id claimed by the request's bearer token, or None. Only the
+    signature and expiry are checked, so this costs no queries.
+    """
+    authentication = JWTAuthentication()
+    header = authentication.get_header(request)
+    if header is None:
+        return None
+    raw_token = authentication.get_raw_token(header)
+    if raw_token is None:
+        return None
+    try:
+        token = authentication.get_validated_token(raw_token)
+    except (InvalidToken, TokenError):
+        return None
+    return token.get(jwt_settings.USER_ID_CLAIM)
+
+def request_fingerprint(request):
+    digest = hashlib.sha256()
+    digest.update(request.method.encode())
+    digest.update(b'\0')
+    digest.update(request.get_full_path().encode())
+    digest.update(b'\0')
+    if request.content_type == 'multipart/form-data':
+        # Reading request.body would buffer the whole upload and raise
+        # RequestDataTooBig past DATA_UPLOAD_MAX_MEMORY_SIZE, so uploads are
+        # told apart by size (the boundary in Content-Type varies per send)
+        digest.update(request.content_type.encode())
+        digest.update(b'\0')
+        digest.update(request.META.get('CONTENT_LENGTH', '').encode())
+    else:
+        digest.update(request.body)
+    return digest.hexdigest()
+
+def error(message, status_code):
+    content = FastJSONRenderer().render({"status": "error", "errors": [], "message": message})
+    return HttpResponse(content, status=status_code, content_type='application/json')
+
+def begin(request, user_id, key):
+    """
+    Claims `key` for this request. Returns (record, None) when the view should
+    run, or (None, response) with a replay or an error. The unique
+    (user, key) constraint decides between concurrent duplicates.
+    """
+    fingerprint = request_fingerprint(request)
+    now = timezone.now()
+    record = IdempotencyKey.objects.filter(user_id=user_id, key=key).first()
+    if record is not None and record.expires_at <= now:
+        record.delete()
+        record = None
+
+    if record is None:
+        try:
+            with transaction.atomic():
+                record = IdempotencyKey.objects.create(
+                    user_id=user_id,
+                    key=key,
+                    method=request.method,
+                    path=request.path[:255],
+                    fingerprint=fingerprint,
+                    expires_at=now + datetime.timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL_SECONDS)
+                )
+        except IntegrityError:
+            # A concurrent duplicate claimed the key first
+            IDEMPOTENCY_REQUESTS.labels(outcome="in_progress").inc()
+            return None, error("A request with this Idempotency-Key is still in progress.", 409)
+        IDEMPOTENCY_REQUESTS.labels(outcome="new").inc()
+        return record, None
+
+    if record.fingerprint != fingerprint:
+        IDEMPOTENCY_REQUESTS.labels(outcome="mismatch").inc()
+        return None, error("This Idempotency-Key was already used for a different request.", 422)
+    if record.response_status is None:
+        IDEMPOTENCY_REQUESTS.labels(outcome="in_progress").inc()
+        return None, error("A request with this Idempotency-Key is still in progress.", 409)
+
+    IDEMPOTENCY_REQUESTS.labels(outcome="replayed").inc()
+    response = HttpResponse(
+        bytes(record.response_body or b''),
+        status=record.response_status,
+        content_type=record.response_content_type or None
+    )
+    response['Idempotent-Replayed'] = 'true'
+    return None, response
+
+def finish(record, response):
+    """
+    Stores the response for replay. Server errors release the key instead,
+    so the client can retry with it.
+    """
+    if response.status_code >= 500 or getattr(response, 'streaming', False):
+        IdempotencyKey.objects.filter(pk=record.pk).delete()
+        return
+    IdempotencyKey.objects.filter(pk=record.pk).update(
+        response_status=response.status_code,
+        response_content_type=response.get('Content-Type', ''),
+        response_body=response.content
+    )
+
+def purge_expired():
+    """
+    Deletes expired keys. Returns the number removed.
+    """
+    deleted, _ = IdempotencyKey.objects.filter(expires_at__lte=timezone.now()).delete()
+    return deleted
@@ -0,0 +1,125 @@
+import contextvars
+import heapq
+import threading
+import time
+from contextlib import contextmanager
+
+_current_profile = contextvars.ContextVar("request_profile", default=None)
+
+_view_stats = {}
+_view_stats_lock = threading.Lock()
+
+class RequestProfile:
+    """
+    Timing data collected for a single sampled request.
+    """
+    def __init__(self, keep_queries=5):
+        self.started = time.perf_counter()
+        self.query_count = 0
+        self.db_time = 0.0
+        self.timings = {}
+        self.keep_queries = keep_queries
+        self._slowest = []
+
+    def record_query(self, sql, duration):
+        self.query_count += 1
+        self.db_time += duration
+        # Keep only the slowest few statements so long requests stay cheap to profile
+        entry = (duration, self.query_count, sql)
+        if len(self._slowest) < self.keep_queries:
+            heapq.heappush(self._slowest, entry)
+        elif duration > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    def add_timing(self, name, duration):
+        self.timings[name] = self.timings.get(name, 0.0) + duration
+
+    def top_queries(self):
+        return [(duration, sql) for duration, _, sql in sorted(self._slowest, reverse=True)]
+
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    def __call__(self, execute, sql, params, many, context):
+        # connection.execute_wrapper hook
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.record_query(sql, time.perf_counter() - start)
+
+def get_current_profile():
+    return _current_profile.get()
+
+def activate_profile(profile):
+    return _current_profile.set(profile)
+
+def deactivate_profile(token):
+    _current_profile.reset(token)
+
+@contextmanager
+def timed(name):
+    """
+    Adds the wall time of the block to the current request profile under `name`.
+    Does nothing when the request is not being sampled.
+    """
+    profile = _current_profile.get()
+    if profile is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.add_timing(name, time.perf_counter() - start)
+
+def record_view_stats(view_name, total, db_time, query_count):
+    with _view_stats_lock:
+        stats = _view_stats.get(view_name)
+        if stats is None:
+            stats = _view_stats[view_name] = {
+                "count": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "db_ms": 0.0,
+                "queries": 0,
+                "max_queries": 0,
+            }
+        total_ms = total * 1000
+        stats["count"] += 1
+        stats["total_ms"] += total_ms
+        stats["max_ms"] = max(stats["max_ms"], total_ms)
+        stats["db_ms"] += db_time * 1000
+        stats["queries"] += query_count
+        stats["max_queries"] = max(stats["max_queries"], query_count)
+
+def get_view_stats():
+    """
+    Returns a snapshot of the in-process per-view aggregates.
+    """
+    with _view_stats_lock:
+        snapshot = {}
+        for view_name, stats in _view_stats.items():
+            count = stats["count"] or 1
+            snapshot[view_name] = {
+                "count": stats["count"],
+                "avg_ms": round(stats["total_ms"] / count, 2),
+                "max_ms": round(stats["max_ms"], 2),
+                "avg_db_ms": round(stats["db_ms"] / count, 2),
+                "avg_queries": round(stats["queries"] / count, 2),
+                "max_queries": stats["max_queries"],
+            }
+        return snapshot
+
+def reset_view_stats():
+    with _view_stats_lock:
+        _view_stats.clear()
+
+def get_view_name(request):
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return None
+    view_class = getattr(match.func, "view_class", None)
+    if view_class is not None:
+        return view_class.__name__
+    return match.func.__name__
@@ -0,0 +1,223 @@
+"""
+Background jobs kept in the `jobs` table and run by `manage.py runworker`,
+so nothing beyond the database is needed.
+
+Apps register jobs in a `jobs.py` module:
+
+    @job("bookings.expire_holds", schedule="* * * * *")
+    def expire_holds_job():
+        ...
+
+and enqueue them with `enqueue("bookings.expire_holds", {...})`; the payload
+is passed to the function as keyword arguments.
+"""
+import datetime
+import logging
+import random
+import time
+import traceback
+
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.module_loading import autodiscover_modules
+
+from core.cron import CronSchedule
+from core.idempotency import purge_expired
+from core.metrics import JOB_DURATION, JOBS_ENQUEUED
+from core.models import Job
+
+logger = logging.getLogger("core.jobs")
+
+MAX_BACKOFF_SECONDS = 3600
+
+_registry = {}
+
+class JobSpec:
+    def __init__(self, name, func, max_attempts, schedule):
+        self.name = name
+        self.func = func
+        self.max_attempts = max_attempts
+        self.default_schedule = schedule
+
+    @property
+    def schedule(self):
+        """
+        The cron schedule in effect: JOB_SCHEDULES[name] when set (None
+        disables it), otherwise the one given to @job.
+        """
+        overrides = getattr(settings, 'JOB_SCHEDULES', {})
+        expression = overrides[self.name] if self.name in overrides else self.default_schedule
+        return CronSchedule(expression) if expression else None
+
+def job(name, max_attempts=3, schedule=None):
+    """
+    Registers the decorated function as background job `name`. `schedule`
+    is a cron expression (see core.cron) for jobs that should also run
+    periodically.
+    """
+    if schedule:
+        CronSchedule(schedule)
+
+    def decorate(func):
+        _registry[name] = JobSpec(name, func, max_attempts, schedule)
+        return func
+    return decorate
+
+def load_jobs():
+    """
+    Imports every installed app's `jobs` module so its jobs are registered.
+    """
+    autodiscover_modules('jobs')
+    return _registry
+
+def get_job(name):
+    if name not in _registry:
+        load_jobs()
+    try:
+        return _registry[name]
+    except KeyError:
+        raise ValueError(f"No background job registered as {name!r}.") from None
+
+def enqueue(name, payload=None, run_at=None, unique_key=None):
+    """
+    Queues a run of job `name`. With `unique_key`, returns None instead of
+    queueing a second job with the same key.
+    """
+    spec = get_job(name)
+    job = Job(
+        name=name,
+        payload=payload or {},
+        run_at=run_at or timezone.now(),
+        max_attempts=spec.max_attempts,
+        unique_key=unique_key
+    )
+    if unique_key is None:
+        job.save()
+    else:
+        try:
+            with transaction.atomic():
+                job.save()
+        except IntegrityError:
+            return None
+    JOBS_ENQUEUED.labels(job=name).inc()
+    return job
+
+def enqueue_due(now=None):
+    """
+    Queues every periodic job whose schedule fires in the current minute
+    (local time). Each worker calls this; the per-minute unique_key keeps it
+    to one run. Returns the names queued.
+    """
+    minute = timezone.localtime(now or timezone.now()).replace(second=0, microsecond=0)
+    queued = []
+    for spec in load_jobs().values():
+        schedule = spec.schedule
+        if schedule is not None and schedule.matches(minute):
+            if enqueue(spec.name, unique_key=f"{spec.name}@{minute.isoformat()}") is not None:
+                queued.append(spec.name)
+    return queued
+
+def claim(worker_id, limit=1):
+    """
+    Marks up to `limit` due jobs as RUNNING for `worker_id` and returns them.
+    Uses SELECT ... FOR UPDATE SKIP LOCKED where the database has it, so
+    workers never wait on each other. Elsewhere (SQLite) each candidate is
+    claimed with a conditional UPDATE, and a worker that loses the race
+    simply moves on to the next one.
+    """
+    now = timezone.now()
+    due = Job.objects.filter(status="QUEUED", run_at__lte=now).order_by("run_at", "id")
+    claimed = {"status": "RUNNING", "locked_by": worker_id, "locked_at": now, "attempts": F("attempts") + 1}
+
+    if connection.features.has_select_for_update_skip_locked:
+        with transaction.atomic():
+            ids = list(due.select_for_update(skip_locked=True).values_list("id", flat=True)[:limit])
+            if ids:
+                Job.objects.filter(id__in=ids).update(**claimed)
+    else:
+        ids = []
+        for job_id in due.values_list("id", flat=True)[:limit * 5]:
+            if Job.objects.filter(id=job_id, status="QUEUED").update(**claimed):
+                ids.append(job_id)
+                if len(ids) == limit:
+                    break
+
+    if not ids:
+        return []
+    return list(Job.objects.filter(id__in=ids).order_by("run_at", "id"))
+
+def retry_delay(attempts):
+    """
+    Exponential backoff from JOB_RETRY_BACKOFF_SECONDS with 10% jitter,
+    capped at an hour.
+    """
+    base = getattr(settings, 'JOB_RETRY_BACKOFF_SECONDS', 30)
+    delay = min(base * 2 ** (attempts - 1), MAX_BACKOFF_SECONDS)
+    return delay * random.uniform(1.0, 1.1)
+
+def run_job(job):
+    """
+    Runs a claimed job and records the outcome: SUCCEEDED, QUEUED again
+    after a backoff, or FAILED once max_attempts is used up. Returns the
+    outcome label used for metrics.
+    """
+    owned = Job.objects.filter(id=job.id, status="RUNNING", locked_by=job.locked_by)
+    start = time.perf_counter()
+    try:
+        get_job(job.name).func(**job.payload)
+    except Exception:
+        error = traceback.format_exc()
+        now = timezone.now()
+        if job.attempts < job.max_attempts:
+            outcome = "retried"
+            owned.update(
+                status="QUEUED",
+                run_at=now + datetime.timedelta(seconds=retry_delay(job.attempts)),
+                locked_by="",
+                locked_at=None,
+                last_error=error
+            )
+        else:
+            outcome = "failed"
+            owned.update(status="FAILED", finished_at=now, last_error=error)
+        logger.error("Job %s #%s %s on attempt %s/%s\n%s",
+                     job.name, job.id, outcome, job.attempts, job.max_attempts, error)
+    else:
+        outcome = "succeeded"
+        owned.update(status="SUCCEEDED", finished_at=timezone.now())
+    JOB_DURATION.labels(job=job.name, outcome=outcome).observe(time.perf_counter() - start)
+    return outcome
+
+def requeue_stale():
+    """
+    Puts back jobs whose worker died mid-run: RUNNING for longer than
+    JOB_LEASE_SECONDS. Jobs out of attempts are marked FAILED instead.
+    Returns the number of jobs touched.
+    """
+    now = timezone.now()
+    lease = getattr(settings, 'JOB_LEASE_SECONDS', 900)
+    stale = Job.objects.filter(status="RUNNING", locked_at__lt=now - datetime.timedelta(seconds=lease))
+    failed = stale.filter(attempts__gte=F("max_attempts")).update(
+        status="FAILED", finished_at=now, last_error="Worker stopped before the job finished."
+    )
+    requeued = stale.update(status="QUEUED", locked_by="", locked_at=None)
+    return failed + requeued
+
+def purge_finished(older_than_days):
+    """
+    Deletes succeeded and failed jobs that finished more than
+    `older_than_days` ago. Returns the number removed.
+    """
+    cutoff = timezone.now() - datetime.timedelta(days=older_than_days)
+    deleted, _ = Job.objects.filter(status__in=["SUCCEEDED", "FAILED"], finished_at__lt=cutoff).delete()
+    return deleted
+
+@job("core.purge_jobs", schedule="15 4 * * *")
+def purge_jobs():
+    purge_finished(getattr(settings, 'JOB_RETENTION_DAYS', 7))
+
+@job("core.purge_idempotency_keys", schedule="5 * * * *")
+def purge_idempotency_keys():
+    purge_expired()
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+
+from core.idempotency import purge_expired
+
+class Command(BaseCommand):
+    help = 'Deletes Idempotency-Key records past their replay window.'
+
+    def handle(self, *args, **options):
+        deleted = purge_expired()
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} expired idempotency key(s)."))
@@ -0,0 +1,83 @@
+import os
+import signal
+import socket
+import threading
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection
+from django.utils import timezone
+
+from core.jobs import claim, enqueue_due, load_jobs, requeue_stale, run_job
+
+class Command(BaseCommand):
+    help = (
+        'Runs background jobs from the jobs table in worker threads and queues '
+        'periodic jobs when their schedule fires. Start as many as you like; '
+        'they coordinate through the database.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=4, help='Worker threads.')
+        parser.add_argument('--poll-interval', type=float, default=1.0,
+                            help='Seconds an idle thread waits before looking for work again.')
+        parser.add_argument('--no-scheduler', action='store_true',
+                            help='Only run jobs; leave periodic scheduling to other workers.')
+        parser.add_argument('--burst', action='store_true',
+                            help='Exit once the queue is empty instead of waiting for more work.')
+
+    def handle(self, *args, **options):
+        jobs = load_jobs()
+        self.stdout.write(f"Registered jobs: {', '.join(sorted(jobs)) or 'none'}")
+
+        stop = threading.Event()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *args: stop.set())
+
+        worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        threads = [
+            threading.Thread(
+                target=self.work,
+                args=(f"{worker_id}:{i}", stop, options['poll_interval'], options['burst']),
+                name=f"worker-{i}",
+                daemon=True,
+            )
+            for i in range(options['concurrency'])
+        ]
+
+        if not options['no_scheduler']:
+            self.schedule()
+        for thread in threads:
+            thread.start()
+
+        # The main thread runs the scheduler once a minute and waits for the workers
+        last_minute = timezone.now().replace(second=0, microsecond=0)
+        while any(thread.is_alive() for thread in threads):
+            stop.wait(options['poll_interval'])
+            minute = timezone.now().replace(second=0, microsecond=0)
+            if not options['no_scheduler'] and not options['burst'] and minute != last_minute and not stop.is_set():
+                last_minute = minute
+                self.schedule()
+        connection.close()
+        self.stdout.write("Worker stopped.")
+
+    def schedule(self):
+        close_old_connections()
+        requeue_stale()
+        for name in enqueue_due():
+            self.stdout.write(f"Queued periodic job {name}")
+
+    def work(self, worker_id, stop, poll_interval, burst):
+        try:
+            while not stop.is_set():
+                close_old_connections()
+                jobs = claim(worker_id)
+                if not jobs:
+                    if burst:
+                        return
+                    stop.wait(poll_interval)
+                    continue
+                for job in jobs:
+                    outcome = run_job(job)
+                    self.stdout.write(f"[{worker_id}] {job.name} #{job.id}: {outcome}")
+        finally:
+            connection.close()
@@ -0,0 +1,131 @@
+import os
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram,
+    generate_latest, multiprocess
+)
+
+# Under gunicorn each worker writes its samples to PROMETHEUS_MULTIPROC_DIR and
+# the scraping worker aggregates them (see gunicorn.conf.py).
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+REQUEST_LATENCY = Histogram(
+    "reshub_http_request_duration_seconds",
+    "Request latency by DRF view.",
+    ["view", "method", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+
+BOOKINGS_CREATED = Counter(
+    "reshub_bookings_created_total",
+    "Bookings created, by initial status.",
+    ["status"],
+)
+
+BOOKINGS_REJECTED = Counter(
+    "reshub_bookings_rejected_total",
+    "Booking attempts refused at create time, by reason.",
+    ["reason"],
+)
+
+BOOKINGS_EXPIRED = Counter(
+    "reshub_bookings_expired_total",
+    "Pending bookings expired by the stale-booking sweep before anyone reviewed them.",
+)
+
+WAITLIST_PROMOTED = Counter(
+    "reshub_waitlist_promoted_total",
+    "Waitlist entries turned into bookings when seats freed up, by booking status.",
+    ["status"],
+)
+
+BOOKING_HOLDS = Counter(
+    "reshub_booking_holds_total",
+    "Slot holds by outcome (created, refused, confirmed, released, expired).",
+    ["outcome"],
+)
+
+IDEMPOTENCY_REQUESTS = Counter(
+    "reshub_idempotency_requests_total",
+    "Requests carrying an Idempotency-Key, by outcome (new, replayed, in_progress, mismatch).",
+    ["outcome"],
+)
+
+THROTTLE_DECISIONS = Counter(
+    "reshub_throttle_decisions_total",
+    "Token-bucket throttle decisions, by throttle scope and outcome (allowed, throttled).",
+    ["scope", "outcome"],
+)
+
+BOOKING_LOCK_WAIT = Histogram(
+    "reshub_booking_lock_wait_seconds",
+    "Time spent waiting for the resource select_for_update lock.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+NOTIFICATION_WRITE = Histogram(
+    "reshub_notification_write_seconds",
+    "Duration of notification inserts.",
+    ["kind"],
+    buckets=LATENCY_BUCKETS,
+)
+
+NOTIFICATIONS_PURGED = Counter(
+    "reshub_notifications_purged_total",
+    "Notifications deleted by the retention purge.",
+)
+
+AUDIT_WRITE = Histogram(
+    "reshub_audit_write_seconds",
+    "Duration of audit log inserts.",
+    buckets=LATENCY_BUCKETS,
+)
+
+JOB_DURATION = Histogram(
+    "reshub_job_duration_seconds",
+    "Background job run time, by job name and outcome (succeeded, retried, failed).",
+    ["job", "outcome"],
+    buckets=LATENCY_BUCKETS + (30.0, 60.0, 300.0),
+)
+
+JOBS_ENQUEUED = Counter(
+    "reshub_jobs_enqueued_total",
+    "Background jobs enqueued, by job name.",
+    ["job"],
+)
+
+DB_CONNECTIONS_OPENED = Counter(
+    "reshub_db_connections_opened_total",
+    "Database connections opened.",
+    ["alias"],
+)
+
+DB_CONNECTIONS_OPEN = Gauge(
+    "reshub_db_connections_open",
+    "Database connections open at the end of the last request, summed over live workers.",
+    multiprocess_mode="livesum",
+)
+
+def _on_connection_created(sender, connection, **kwargs):
+    DB_CONNECTIONS_OPENED.labels(alias=connection.alias).inc()
+
+connection_created.connect(_on_connection_created, dispatch_uid="core.metrics.connection_created")
+
+def observe_request(view_name, method, status_code, duration):
+    REQUEST_LATENCY.labels(view=view_name, method=method, status=str(status_code)).observe(duration)
+    DB_CONNECTIONS_OPEN.set(sum(1 for conn in connections.all(initialized_only=True) if conn.connection is not None))
+
+def render_metrics():
+    """
+    Returns (payload, content_type) for the current metrics, aggregated
+    across workers when multiprocess mode is enabled.
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
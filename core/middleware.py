@@ -1,3 +1,20 @@
+import logging
+import random
+import time
+
+from django.conf import settings
+from django.db import connection
+
+from core import idempotency
+from core.query_budget import QueryBudget, declared_budget
+from core.instrumentation import (
+    RequestProfile, activate_profile, deactivate_profile,
+    get_view_name, record_view_stats
+)
+from core.metrics import observe_request
+
+logger = logging.getLogger("core.performance")
+
 class AuditLogMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
@@ -14,3 +31,145 @@ class AuditLogMiddleware:
         response = self.get_response(request)
 
         return response
+
+class PerformanceInstrumentationMiddleware:
+    """
+    Records query count, DB time, serializer time and total time for a sample
+    of requests. Sampled responses carry a Server-Timing header, slow requests
+    are logged with their slowest queries and per-view aggregates are kept in
+    memory (see core.instrumentation.get_view_stats).
+
+    Every request, sampled or not, feeds the Prometheus latency histogram.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = getattr(settings, 'PERF_INSTRUMENTATION_ENABLED', True)
+        self.sample_rate = getattr(settings, 'PERF_SAMPLE_RATE', 1.0)
+        self.slow_request_ms = getattr(settings, 'PERF_SLOW_REQUEST_MS', 500)
+        self.slow_query_log_count = getattr(settings, 'PERF_SLOW_QUERY_LOG_COUNT', 5)
+
+    def __call__(self, request):
+        if not self.enabled or random.random() >= self.sample_rate:
+            start = time.perf_counter()
+            response = self.get_response(request)
+            observe_request(get_view_name(request) or "unmatched", request.method,
+                            response.status_code, time.perf_counter() - start)
+            return response
+
+        profile = RequestProfile(keep_queries=self.slow_query_log_count)
+        token = activate_profile(profile)
+        try:
+            with connection.execute_wrapper(profile):
+                response = self.get_response(request)
+        finally:
+            deactivate_profile(token)
+
+        total = profile.elapsed()
+        response['Server-Timing'] = self.server_timing(profile, total)
+
+        view_name = get_view_name(request)
+        if view_name:
+            record_view_stats(view_name, total, profile.db_time, profile.query_count)
+        observe_request(view_name or "unmatched", request.method, response.status_code, total)
+
+        if total * 1000 >= self.slow_request_ms:
+            self.log_slow_request(request, response, view_name, profile, total)
+
+        return response
+
+    def server_timing(self, profile, total):
+        entries = [f'db;dur={profile.db_time * 1000:.1f};desc="{profile.query_count} queries"']
+        for name, duration in profile.timings.items():
+            entries.append(f'{name};dur={duration * 1000:.1f}')
+        entries.append(f'total;dur={total * 1000:.1f}')
+        return ', '.join(entries)
+
+    def log_slow_request(self, request, response, view_name, profile, total):
+        lines = [
+            f"Slow request {request.method} {request.path} ({view_name}) "
+            f"status={response.status_code} total={total * 1000:.1f}ms "
+            f"db={profile.db_time * 1000:.1f}ms queries={profile.query_count}"
+        ]
+        for duration, sql in profile.top_queries():
+            lines.append(f"  {duration * 1000:.1f}ms {sql[:500]}")
+        logger.warning("\n".join(lines))
+
+class IdempotencyMiddleware:
+    """
+    `Idempotency-Key` support for views that set `idempotent = True`. The
+    first mutating request with a key runs normally and its response is
+    stored for IDEMPOTENCY_KEY_TTL_SECONDS; retries with the same key and
+    body get that response back without running the view (and without
+    loading the user), a different body with the same key gets 422, and a
+    retry that arrives while the first is still running gets 409.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        record = getattr(request, 'idempotency_record', None)
+        if record is not None:
+            idempotency.finish(record, response)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view_class = getattr(view_func, 'cls', None)
+        if request.method not in idempotency.MUTATING_METHODS or not getattr(view_class, 'idempotent', False):
+            return None
+
+        key = request.META.get(idempotency.HEADER, '').strip()
+        if not key:
+            return None
+        if len(key) > idempotency.MAX_KEY_LENGTH:
+            return idempotency.error("Idempotency-Key must be at most 255 characters.", 400)
+
+        # Unauthenticated requests fall through to the view's own 401
+        user_id = idempotency.token_user_id(request)
+        if user_id is None:
+            return None
+
+        record, response = idempotency.begin(request, user_id, key)
+        request.idempotency_record = record
+        return response
+
+class QueryBudgetMiddleware:
+    """
+    Enforces the query budget views declare with `query_budget = N` (or the
+    core.query_budget.query_budget decorator). Only the view itself is
+    counted. A request that goes over budget, or repeats one query shape more
+    than QUERY_BUDGET_REPEAT_LIMIT times, raises QueryBudgetExceeded with the
+    stack of the offending query.
+
+    QUERY_BUDGET_ENABLED=None enforces budgets under DEBUG and for Django
+    test client requests; True/False force it on or off.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = getattr(settings, 'QUERY_BUDGET_ENABLED', None)
+        self.repeat_limit = getattr(settings, 'QUERY_BUDGET_REPEAT_LIMIT', 2)
+
+    def __call__(self, request):
+        try:
+            response = self.get_response(request)
+        finally:
+            budget = getattr(request, 'query_budget', None)
+            if budget is not None:
+                connection.execute_wrappers.remove(budget)
+        if budget is not None:
+            budget.check(get_view_name(request))
+        return response
+
+    def enforced(self, request):
+        if self.enabled is None:
+            return settings.DEBUG or request.META.get('SERVER_NAME') == 'testserver'
+        return self.enabled
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        limit = declared_budget(view_func, request.method)
+        if limit is None or not self.enforced(request):
+            return None
+        # Last in MIDDLEWARE, so nothing but the view runs after this
+        request.query_budget = QueryBudget(limit, self.repeat_limit)
+        connection.execute_wrappers.append(request.query_budget)
+        return None
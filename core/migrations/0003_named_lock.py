@@ -0,0 +1,22 @@
+# Generated by Django 6.0.2 on 2026-10-19 01:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0002_job"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NamedLock",
+            fields=[
+                ("name", models.CharField(max_length=100, primary_key=True, serialize=False)),
+            ],
+            options={
+                "db_table": "named_locks",
+            },
+        ),
+    ]
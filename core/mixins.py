@@ -1,4 +1,9 @@
+import copy
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.db.models.base import DEFERRED
 from django.utils import timezone
 from django.contrib.auth.models import BaseUserManager
 
@@ -47,3 +52,91 @@ class SoftDeleteMixin(models.Model):
 
     def hard_delete(self):
         super().delete()
+
+class DirtyFieldsMixin(models.Model):
+    """
+    Remembers field values as loaded from the database so save() writes
+    only what changed. A plain save() on a loaded instance becomes
+    save(update_fields=<changed fields>) (plus auto_now fields such as
+    updated_at), and is skipped entirely when nothing changed. Explicit
+    update_fields, new instances and force_insert behave as usual.
+
+    state_diff() returns the (previous_state, new_state) pair for the
+    audit log; call it before save(). Fields in audit_exclude_fields are
+    left out of the diff.
+    """
+    audit_exclude_fields = ()
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._snapshot(dict(zip(field_names, (value for value in values if value is not DEFERRED))))
+        return instance
+
+    def _snapshot(self, values):
+        # Mutable values (JSON) are copied so in-place edits still show up as changes
+        loaded = getattr(self, '_loaded_values', {})
+        for attname, value in values.items():
+            loaded[attname] = copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+        self._loaded_values = loaded
+
+    def _current_values(self, fields=None):
+        return {
+            field.attname: self.__dict__[field.attname]
+            for field in self._meta.concrete_fields
+            if field.attname in self.__dict__
+            and (fields is None or field.name in fields or field.attname in fields)
+        }
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        # Also how deferred fields get loaded, so only the refreshed fields
+        # are re-snapshotted
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        self._snapshot(self._current_values(fields))
+
+    def dirty_fields(self):
+        """
+        {field name: value as loaded} for every field changed since load.
+        Empty for instances that were never loaded.
+        """
+        loaded = getattr(self, '_loaded_values', None)
+        if loaded is None:
+            return {}
+        dirty = {}
+        for field in self._meta.concrete_fields:
+            if field.primary_key or field.attname not in self.__dict__:
+                continue
+            if field.attname not in loaded or loaded[field.attname] != self.__dict__[field.attname]:
+                dirty[field.name] = loaded.get(field.attname)
+        return dirty
+
+    def state_diff(self):
+        """
+        JSON-safe (previous_state, new_state) dicts of the changed fields,
+        keyed by column name (e.g. "approved_by_id").
+        """
+        previous, new = {}, {}
+        for name, old_value in self.dirty_fields().items():
+            field = self._meta.get_field(name)
+            if name in self.audit_exclude_fields or getattr(field, 'auto_now', False):
+                continue
+            previous[field.attname] = json.loads(json.dumps(old_value, cls=DjangoJSONEncoder))
+            new[field.attname] = json.loads(json.dumps(getattr(self, field.attname), cls=DjangoJSONEncoder))
+        return previous, new
+
+    def save(self, *args, **kwargs):
+        tracked = (
+            hasattr(self, '_loaded_values') and not self._state.adding and not args
+            and kwargs.get('update_fields') is None and not kwargs.get('force_insert')
+        )
+        if tracked:
+            dirty = self.dirty_fields()
+            if not dirty:
+                return
+            auto_now = [field.name for field in self._meta.concrete_fields if getattr(field, 'auto_now', False)]
+            kwargs['update_fields'] = set(dirty) | set(auto_now)
+        super().save(*args, **kwargs)
+        self._snapshot(self._current_values(kwargs.get('update_fields')))
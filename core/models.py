@@ -0,0 +1,88 @@
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+class IdempotencyKey(models.Model):
+    """
+    One `Idempotency-Key` a user sent to a mutating endpoint, with the
+    response it produced. `response_status` is null while the first request
+    is still running.
+    """
+    id = models.BigAutoField(primary_key=True)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='idempotency_keys')
+    key = models.CharField(max_length=255)
+    method = models.CharField(max_length=10)
+    path = models.CharField(max_length=255)
+    fingerprint = models.CharField(max_length=64)
+    response_status = models.PositiveSmallIntegerField(blank=True, null=True)
+    response_content_type = models.CharField(max_length=100, blank=True)
+    response_body = models.BinaryField(blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        db_table = 'idempotency_keys'
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'key'], name='unique_idempotency_key_per_user'),
+        ]
+
+    def __str__(self):
+        return f"{self.method} {self.path} ({self.key})"
+
+class Job(models.Model):
+    """
+    One run of a background job registered in core.jobs. Workers
+    (`runworker`) claim QUEUED rows whose run_at has passed; failures are
+    retried with backoff until max_attempts. `unique_key` dedupes periodic
+    runs enqueued by several workers for the same minute.
+    """
+    STATUS_CHOICES = (
+        ('QUEUED', 'Queued'),
+        ('RUNNING', 'Running'),
+        ('SUCCEEDED', 'Succeeded'),
+        ('FAILED', 'Failed'),
+    )
+
+    id = models.BigAutoField(primary_key=True)
+    name = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='QUEUED')
+    run_at = models.DateTimeField(default=timezone.now)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=3)
+    unique_key = models.CharField(max_length=255, unique=True, blank=True, null=True)
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        db_table = 'jobs'
+        indexes = [
+            models.Index(fields=['status', 'run_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.name} #{self.id} ({self.status})"
+
+class NamedLock(models.Model):
+    """
+    A row to lock for writers that have no natural row of their own, e.g.
+    everything that checks calendar overrides for overlaps. Call acquire()
+    inside transaction.atomic(); it blocks until other transactions holding
+    the same name have finished.
+    """
+    name = models.CharField(max_length=100, primary_key=True)
+
+    class Meta:
+        db_table = 'named_locks'
+
+    def __str__(self):
+        return self.name
+
+    @classmethod
+    def acquire(cls, name):
+        # The first caller inserts the row; a concurrent insert waits on the
+        # key, fails, and get_or_create then locks the committed row
+        cls.objects.select_for_update().get_or_create(name=name)
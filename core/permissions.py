@@ -1,3 +1,4 @@
+from django.conf import settings
 from rest_framework import permissions
 
 class IsActiveAndApproved(permissions.BasePermission):
@@ -83,3 +84,18 @@ class IsResourceManager(permissions.BasePermission):
         elif hasattr(obj, 'resource') and hasattr(obj.resource, 'managed_by'):
              return obj.resource.managed_by == request.user
         return False
+
+class IsMetricsClient(permissions.BasePermission):
+    """
+    Allows scrapers connecting from METRICS_ALLOWED_IPS, or any active ADMIN user.
+    Uses REMOTE_ADDR rather than X-Forwarded-For so the allowlist cannot be spoofed.
+    """
+    message = "Metrics access required."
+
+    def has_permission(self, request, view):
+        if request.META.get('REMOTE_ADDR') in getattr(settings, 'METRICS_ALLOWED_IPS', []):
+            return True
+        return (
+            IsActiveAndApproved().has_permission(request, view) and
+            request.user.role == "ADMIN"
+        )
@@ -0,0 +1,195 @@
+import datetime
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.relations import PrimaryKeyRelatedField
+from rest_framework.settings import api_settings
+
+from core.instrumentation import timed
+from core.response import success_response
+
+DATETIME = "datetime"
+
+# Restricted projections are cached per fieldset up to this many variants
+MAX_RESTRICTED = 64
+
+def _is_iso(field, default):
+    output_format = getattr(field, 'format', default)
+    return output_format is not None and output_format.lower() == ISO_8601
+
+def _converter(field):
+    """
+    Picks the cheapest callable that reproduces `field.to_representation`
+    for a non-null database value. None means the value is used as is.
+    """
+    if isinstance(field, serializers.DateTimeField):
+        if settings.USE_TZ and not hasattr(field, 'timezone') and _is_iso(field, api_settings.DATETIME_FORMAT):
+            return DATETIME
+    elif isinstance(field, serializers.DateField):
+        if _is_iso(field, api_settings.DATE_FORMAT):
+            return datetime.date.isoformat
+    elif isinstance(field, serializers.TimeField):
+        if _is_iso(field, api_settings.TIME_FORMAT):
+            return datetime.time.isoformat
+    elif isinstance(field, serializers.BooleanField):
+        return bool
+    elif isinstance(field, serializers.IntegerField):
+        return int
+    elif isinstance(field, serializers.CharField):
+        return str
+    elif isinstance(field, serializers.JSONField):
+        if not field.binary:
+            return None
+    elif isinstance(field, PrimaryKeyRelatedField):
+        if field.pk_field is None:
+            return None
+    return field.to_representation
+
+def _iso_datetime(tz, fallback):
+    def convert(value):
+        if value.tzinfo is None:
+            return fallback(value)
+        value = value.astimezone(tz).isoformat()
+        if value.endswith('+00:00'):
+            value = value[:-6] + 'Z'
+        return value
+    return convert
+
+class Projection:
+    """
+    Read-only fast path for a ModelSerializer on list endpoints.
+
+    The serializer's fields are compiled once into `values_list()` columns and
+    per-field converters, so a page is built from plain tuples without model
+    or serializer instances. The output matches `serializer_class(many=True).data`;
+    serializers the projection can't reproduce (method fields, many=True
+    nesting, custom to_representation) raise ImproperlyConfigured when compiled.
+    """
+    def __init__(self, serializer_class, fieldset=None):
+        self.serializer_class = serializer_class
+        self.fieldset = fieldset
+        self._columns = None
+        self._plan = None
+        self._restricted = {}
+
+    def restrict(self, fieldset):
+        """
+        The projection for a sparse Fieldset (see core.fieldsets): unselected
+        fields are dropped from the columns, and unexpanded relations render
+        as their primary key.
+        """
+        if fieldset is None or not fieldset.is_sparse:
+            return self
+        key = fieldset.key()
+        projection = self._restricted.get(key)
+        if projection is None:
+            projection = Projection(self.serializer_class, fieldset)
+            if len(self._restricted) < MAX_RESTRICTED:
+                self._restricted[key] = projection
+        return projection
+
+    @property
+    def columns(self):
+        if self._columns is None:
+            self.compile()
+        return self._columns
+
+    def compile(self):
+        columns = []
+        index = {}
+
+        def column(lookup):
+            if lookup not in index:
+                index[lookup] = len(columns)
+                columns.append(lookup)
+            return index[lookup]
+
+        self._plan = self._compile(self.serializer_class, "", column, self.fieldset)
+        self._columns = columns
+
+    def _compile(self, serializer_class, prefix, column, fieldset=None):
+        if serializer_class.to_representation is not serializers.Serializer.to_representation:
+            raise ImproperlyConfigured(f"{serializer_class.__name__} overrides to_representation and can't be projected.")
+
+        plan = []
+        for name, field in serializer_class().fields.items():
+            if field.write_only or (fieldset is not None and not fieldset.includes(name)):
+                continue
+            if field.source == '*' or isinstance(field, (serializers.SerializerMethodField, serializers.ListSerializer)):
+                raise ImproperlyConfigured(f"{serializer_class.__name__}.{name} can't be projected.")
+
+            lookup = prefix + field.source.replace('.', '__')
+            if isinstance(field, serializers.ModelSerializer) and fieldset is not None and not fieldset.expands(name):
+                plan.append((name, column(lookup), None))
+            elif isinstance(field, serializers.ModelSerializer):
+                # The FK column tells a null relation apart from a related row
+                nested = self._compile(type(field), lookup + "__", column)
+                plan.append((name, column(lookup), nested))
+            else:
+                plan.append((name, column(lookup), _converter(field)))
+        return plan
+
+    def rows(self, queryset):
+        """
+        The queryset as the tuples `serialize` expects. Paginate this instead
+        of the model queryset.
+        """
+        return queryset.values_list(*self.columns)
+
+    def serialize(self, rows):
+        if self._plan is None:
+            self.compile()
+        tz = timezone.get_current_timezone()
+        plan = self._bind(self._plan, self.serializer_class, tz)
+        return [self._build(row, plan) for row in rows]
+
+    def _bind(self, plan, serializer_class, tz):
+        # Datetime converters depend on the active timezone, so they are
+        # resolved per call rather than at compile time
+        fields = serializer_class().fields
+        bound = []
+        for name, position, converter in plan:
+            if isinstance(converter, list):
+                converter = self._bind(converter, type(fields[name]), tz)
+            elif converter is DATETIME:
+                converter = _iso_datetime(tz, fields[name].to_representation)
+            bound.append((name, position, converter))
+        return bound
+
+    def _build(self, row, plan):
+        data = {}
+        for name, position, converter in plan:
+            value = row[position]
+            if value is None:
+                data[name] = None
+            elif converter is None:
+                data[name] = value
+            elif isinstance(converter, list):
+                data[name] = self._build(row, converter)
+            else:
+                data[name] = converter(value)
+        return data
+
+class ProjectionListMixin:
+    """
+    ListAPIView mixin that renders list pages through `projection` instead of
+    instantiating `serializer_class` for every row.
+    """
+    projection = None
+
+    def get_projection(self):
+        return self.projection
+
+    def list(self, request, *args, **kwargs):
+        projection = self.get_projection()
+        rows = projection.rows(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            with timed("serializer"):
+                data = projection.serialize(page)
+            return self.get_paginated_response(data)
+        with timed("serializer"):
+            data = projection.serialize(rows)
+        return success_response(data)
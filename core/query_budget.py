@@ -0,0 +1,108 @@
+import re
+import traceback
+from collections import Counter
+
+from django.conf import settings
+
+# Transaction bookkeeping repeats by design and says nothing about the view
+IGNORED_PREFIXES = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+_IN_LIST = re.compile(r"\(\s*%s(?:\s*,\s*%s)*\s*\)")
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+def query_budget(queries):
+    """
+    Declares the most queries a view may run per request. Works on APIView
+    classes (same as setting `query_budget = N` on the class) and on function
+    views. `queries` may also be a dict keyed by HTTP method, e.g.
+    {"GET": 4}; methods left out are not checked.
+    """
+    def decorate(view):
+        view.query_budget = queries
+        return view
+    return decorate
+
+def declared_budget(view_func, method):
+    view_class = getattr(view_func, 'cls', None) or getattr(view_func, 'view_class', None)
+    budget = getattr(view_class, 'query_budget', None)
+    if budget is None:
+        budget = getattr(view_func, 'query_budget', None)
+    if isinstance(budget, dict):
+        return budget.get(method)
+    return budget
+
+def query_shape(sql):
+    """
+    SQL with IN lists and inline literals collapsed, so the same lookup for
+    different rows compares equal.
+    """
+    return _LITERALS.sub("?", _IN_LIST.sub("(...)", sql))
+
+# Middleware and query hooks that show up in every stack
+SKIPPED_MODULES = ("core/middleware.py", "core/instrumentation.py", "core/query_budget.py")
+
+def caller_stack():
+    """
+    The project frames of the current stack, innermost last, without
+    installed packages or the middleware around the view.
+    """
+    root = str(settings.BASE_DIR)
+    return [
+        frame for frame in traceback.extract_stack()
+        if frame.filename.startswith(root)
+        and 'site-packages' not in frame.filename
+        and not frame.filename.replace("\\", "/").endswith(SKIPPED_MODULES)
+    ]
+
+class QueryBudget:
+    """
+    Counts the queries run while a view handles a request; installed as a
+    connection.execute_wrapper. Two things count as a violation: going over
+    `limit`, and running the same query shape more than `repeat_limit` times
+    (the usual sign of a lazy load per row). The stack is kept for the first
+    query past each threshold so the report points at the offending access.
+    """
+    def __init__(self, limit, repeat_limit):
+        self.limit = limit
+        self.repeat_limit = repeat_limit
+        self.count = 0
+        self.shapes = Counter()
+        self.repeat_stacks = {}
+        self.overflow = None
+
+    def __call__(self, execute, sql, params, many, context):
+        if not sql.lstrip().upper().startswith(IGNORED_PREFIXES):
+            self.record(sql)
+        return execute(sql, params, many, context)
+
+    def record(self, sql):
+        self.count += 1
+        shape = query_shape(sql)
+        self.shapes[shape] += 1
+        if self.shapes[shape] == self.repeat_limit + 1:
+            self.repeat_stacks[shape] = caller_stack()
+        if self.count == self.limit + 1:
+            self.overflow = (sql, caller_stack())
+
+    def violations(self):
+        problems = []
+        if self.count > self.limit:
+            sql, stack = self.overflow
+            problems.append(
+                f"{self.count} queries, budget is {self.limit}. Query {self.limit + 1}: {sql[:500]}\n"
+                + "".join(traceback.format_list(stack))
+            )
+        for shape, stack in self.repeat_stacks.items():
+            problems.append(
+                f"Same query ran {self.shapes[shape]} times (limit {self.repeat_limit}): {shape[:500]}\n"
+                + "".join(traceback.format_list(stack))
+            )
+        return problems
+
+    def check(self, view_name):
+        problems = self.violations()
+        if problems:
+            raise QueryBudgetExceeded(f"Query budget exceeded in {view_name}:\n\n" + "\n".join(problems))
@@ -0,0 +1,74 @@
+import math
+
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+LINE_SEPARATOR = "\u2028".encode()
+PARAGRAPH_SEPARATOR = "\u2029".encode()
+
+# Values that can't hide a float
+SCALAR_TYPES = frozenset({str, int, bool, type(None)})
+
+def has_non_finite_float(data):
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            items = value.values()
+        elif isinstance(value, (list, tuple)):
+            items = value
+        else:
+            if type(value) is float and not math.isfinite(value):
+                return True
+            continue
+        # One C-level pass over the types skips all-scalar rows entirely
+        if not SCALAR_TYPES.issuperset(map(type, items)):
+            stack.extend([item for item in items if type(item) not in SCALAR_TYPES])
+    return False
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    Drop-in replacement for DRF's JSONRenderer that encodes with orjson when
+    it is installed. Dates, times, datetimes and UUIDs are serialized natively;
+    anything else (Decimal, timedelta, lazy strings, querysets) goes through
+    DRF's own encoder via `default`, so the output matches the stdlib renderer
+    with one exception: floats below 1e-4 keep their value but may be spelled
+    differently (orjson writes 1e-05 as 0.00001 and 1.5e-07 as 1.5e-7).
+
+    Pretty-printed, ASCII-only or non-strict output is left to the stdlib path,
+    as are payloads orjson refuses (e.g. integers wider than 64 bits).
+    orjson writes NaN and Infinity as null, so payloads holding them are
+    rendered by the stdlib path too, which raises as strict JSON requires.
+    """
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        renderer_context = renderer_context or {}
+        if (self.get_indent(accepted_media_type, renderer_context) is not None
+                or self.ensure_ascii or not self.compact or not self.strict):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+            )
+        except TypeError:
+            # orjson.JSONEncodeError subclasses TypeError
+            return super().render(data, accepted_media_type, renderer_context)
+        # Non-finite floats can only hide behind a null, so most payloads skip the scan
+        if b"null" in ret and has_non_finite_float(data):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Keep the output a strict javascript subset, as JSONRenderer does
+        if LINE_SEPARATOR in ret:
+            ret = ret.replace(LINE_SEPARATOR, b"\\u2028")
+        if PARAGRAPH_SEPARATOR in ret:
+            ret = ret.replace(PARAGRAPH_SEPARATOR, b"\\u2029")
+        return ret
@@ -0,0 +1,55 @@
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from apps.accounts.models import User
+from apps.accounts.serializers import UserSerializer, user_projection
+from apps.audit.models import AuditLog
+from apps.audit.serializers import AuditLogSerializer, audit_log_projection
+from apps.bookings.models import Booking
+from apps.bookings.serializers import BookingSerializer, booking_projection
+from apps.notifications.models import UserNotification
+from apps.notifications.serializers import NotificationSerializer, notification_projection
+from benchmarks.fixtures import seed_bench_data
+
+class ProjectionOutputTests(TestCase):
+    """
+    List projections must render byte for byte like the serializers they
+    replace.
+    """
+    @classmethod
+    def setUpTestData(cls):
+        cls.data = seed_bench_data(
+            students=5, polled_resources=3, notifications_per_user=5, history_bookings=40, audit_logs=40
+        )
+        # Fill the nullable relations and timestamps the fixture leaves empty
+        now = timezone.now()
+        Booking.objects.filter(status="APPROVED").update(approved_by=cls.data.admin, approved_at=now)
+        Booking.objects.filter(status="CANCELLED").update(
+            cancelled_by=cls.data.students[0], cancelled_at=now, cancellation_reason="Plans changed"
+        )
+        Booking.objects.filter(status="REJECTED").update(rejected_by=cls.data.admin, rejection_reason="Clash")
+
+    def assertRendersLikeSerializer(self, queryset, serializer_class, projection):
+        renderer = JSONRenderer()
+        expected = renderer.render(serializer_class(queryset, many=True).data)
+        actual = renderer.render(projection.serialize(projection.rows(queryset)))
+        self.assertGreater(len(queryset), 0)
+        self.assertEqual(actual, expected)
+
+    def test_booking_list(self):
+        self.assertRendersLikeSerializer(
+            Booking.objects.order_by("-booking_date", "id"), BookingSerializer, booking_projection
+        )
+
+    def test_audit_log_list(self):
+        self.assertRendersLikeSerializer(AuditLog.objects.order_by("-timestamp", "id"), AuditLogSerializer, audit_log_projection)
+
+    def test_user_list(self):
+        self.assertRendersLikeSerializer(User.objects.order_by("-created_at", "id"), UserSerializer, user_projection)
+
+    def test_notification_list(self):
+        self.assertRendersLikeSerializer(
+            UserNotification.objects.filter(user=self.data.students[0]).order_by("-created_at", "id"),
+            NotificationSerializer, notification_projection
+        )
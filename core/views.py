@@ -0,0 +1,28 @@
+from django.http import HttpResponse
+from rest_framework import views
+from rest_framework.permissions import IsAuthenticated
+
+from core.instrumentation import get_view_stats
+from core.metrics import render_metrics
+from core.permissions import IsActiveAndApproved, IsAdmin, IsMetricsClient
+from core.response import success_response
+
+class PerformanceStatsView(views.APIView):
+    """
+    Per-view aggregates collected by PerformanceInstrumentationMiddleware.
+    Figures are per worker process and reset on restart.
+    """
+    permission_classes = [IsAuthenticated, IsActiveAndApproved, IsAdmin]
+
+    def get(self, request):
+        return success_response(get_view_stats())
+
+class MetricsView(views.APIView):
+    """
+    Prometheus text exposition of the application metrics.
+    """
+    permission_classes = [IsMetricsClient]
+
+    def get(self, request):
+        payload, content_type = render_metrics()
+        return HttpResponse(payload, content_type=content_type)
@@ -0,0 +1,15 @@
+# Loaded automatically by gunicorn from the project root.
+import os
+import shutil
+
+def on_starting(server):
+    # Drop metric files left behind by a previous run before workers start writing
+    path = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if path:
+        shutil.rmtree(path, ignore_errors=True)
+        os.makedirs(path, exist_ok=True)
+
+def child_exit(server, worker):
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)